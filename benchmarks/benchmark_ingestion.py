@@ -0,0 +1,298 @@
+"""
+Ingestion benchmarks.
+
+Times every ingestion path per museum and writes machine-readable JSON:
+wall time, peak RSS and rows per second for plain CSV parsing, the Parquet
+cache of scripts.load_data, JSON and streamed flattening of the API dumps,
+and the registry loaders behind both load_data_to_clean functions.
+Each measurement runs in a fresh process, so peak RSS is not polluted by
+earlier runs.
+
+Usage (from the repository root):
+    python -m benchmarks.benchmark_ingestion --data-folder data --scale 1 10 --output bench.json
+    python -m benchmarks.benchmark_ingestion --registry --data-root "/path/to/raw/data"
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+import pandas as pd
+from cleaning_scripts.instrumentation import _peak_rss_mb
+
+
+def _task_read_csv(path):
+    return len(pd.read_csv(path))
+
+
+def _task_cached_read(path, cache_dir):
+    from scripts.data_cache import cached_read_csv
+
+    return len(cached_read_csv(path, cache_dir=cache_dir))
+
+
+def _task_load_data(folder_path, use_cache, cache_dir):
+    from scripts.load_data import load_data
+
+    dataframes, _ = load_data(folder_path, use_cache=use_cache, cache_dir=cache_dir)
+    return sum(len(df) for df in dataframes)
+
+
+def _task_read_json(path):
+    return len(pd.read_json(path))
+
+
+def _task_stream_flatten(path, skip_prefixes):
+    from cleaning_scripts.flatten_stream import load_flattened_json
+
+    return len(load_flattened_json(path, skip_prefixes=skip_prefixes))
+
+
+def _task_registry(loader, name, data_root):
+    # Both loaders read their sources from the registry, data_root overrides the config
+    if data_root is not None:
+        os.environ["MUSEUM_DATA_ROOT"] = data_root
+    if loader == "load_data_to_clean":
+        from cleaning_scripts.load_data_to_clean import load_data_to_clean
+    else:
+        from cleaning_scripts.load_data_to_clean2 import load_data_to_clean
+
+    raw_data, _ = load_data_to_clean(names=[name])
+    return sum(len(df) for df in raw_data)
+
+
+TASKS = {
+    "read_csv": _task_read_csv,
+    "cached_read": _task_cached_read,
+    "load_data": _task_load_data,
+    "read_json": _task_read_json,
+    "stream_flatten": _task_stream_flatten,
+    "registry": _task_registry,
+}
+
+
+def _run_task(task, args):
+    # Executed in a fresh process
+    baseline = _peak_rss_mb()
+    start = time.perf_counter()
+    rows = TASKS[task](*args)
+    wall_time = time.perf_counter() - start
+    return {
+        "rows": rows,
+        "wall_time_s": wall_time,
+        "peak_rss_mb": _peak_rss_mb(),
+        "baseline_rss_mb": baseline,
+    }
+
+
+def measure(task, args, **labels):
+    """
+    Run one benchmark task in a new process and return its measurement record.
+
+    Parameters:
+    task (str): Key of TASKS
+    args (tuple): Arguments of the task
+    **labels: Extra fields of the record (benchmark, museum, path_type, scale, ...)
+
+    Returns:
+    dict: labels plus rows, wall_time_s, peak_rss_mb, rows_per_s and status
+    """
+    record = dict(labels)
+    context = multiprocessing.get_context("spawn")
+    try:
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            record.update(executor.submit(_run_task, task, args).result())
+        record["rows_per_s"] = (
+            record["rows"] / record["wall_time_s"] if record["wall_time_s"] else None
+        )
+        record["status"] = "ok"
+    except Exception as e:
+        record["status"] = f"error: {str(e)}"
+    return record
+
+
+def scale_csv(path, factor, output_dir):
+    """
+    Write a synthetic copy of a CSV file with its rows repeated factor times.
+    Returns the path of the copy.
+    """
+    output_path = os.path.join(output_dir, os.path.basename(path))
+    if factor == 1:
+        shutil.copy(path, output_path)
+        return output_path
+
+    df = pd.read_csv(path)
+    pd.concat([df] * factor, ignore_index=True).to_csv(output_path, index=False)
+    return output_path
+
+
+def benchmark_clean_folder(folder_path, scale_factors=(1,)):
+    """
+    Benchmark scripts.load_data on the cleaned CSVs of a folder, per museum:
+    plain CSV parsing, building the Parquet cache and reading the warm cache,
+    for every scale factor.
+    """
+    csv_files = sorted(f for f in os.listdir(folder_path) if f.endswith(".csv"))
+    results = []
+
+    for factor in scale_factors:
+        with tempfile.TemporaryDirectory() as work_dir:
+            scaled_dir = os.path.join(work_dir, "data")
+            cache_dir = os.path.join(work_dir, "cache")
+            os.makedirs(scaled_dir)
+
+            for csv_file in csv_files:
+                path = scale_csv(
+                    os.path.join(folder_path, csv_file), factor, scaled_dir
+                )
+                museum = os.path.splitext(csv_file)[0]
+                labels = dict(benchmark="load_data", museum=museum, scale=factor)
+
+                results.append(measure("read_csv", (path,), path_type="csv", **labels))
+                # First cached read parses the CSV and writes Parquet
+                results.append(
+                    measure(
+                        "cached_read",
+                        (path, cache_dir),
+                        path_type="cached_columnar_cold",
+                        **labels,
+                    )
+                )
+                results.append(
+                    measure(
+                        "cached_read",
+                        (path, cache_dir),
+                        path_type="cached_columnar",
+                        **labels,
+                    )
+                )
+
+            # Whole load_data call over all museums, with and without the warm cache
+            labels = dict(benchmark="load_data", museum="all", scale=factor)
+            results.append(
+                measure(
+                    "load_data",
+                    (scaled_dir, False, cache_dir),
+                    path_type="csv",
+                    **labels,
+                )
+            )
+            results.append(
+                measure(
+                    "load_data",
+                    (scaled_dir, True, cache_dir),
+                    path_type="cached_columnar",
+                    **labels,
+                )
+            )
+
+    return results
+
+
+def benchmark_registry(data_root=None):
+    """
+    Benchmark the raw ingestion per museum: load_data_to_clean (raw dumps) and
+    load_data_to_clean2 (flattened csv files), plus plain JSON parsing versus
+    streamed flattening for the API dumps. Sources missing on this machine are
+    reported with status "missing".
+    """
+    from cleaning_scripts.dataset_registry import (
+        DEFAULT_REGISTRY,
+        RAW_REGISTRY,
+        load_registry,
+    )
+
+    results = []
+    loaders = [
+        ("load_data_to_clean", RAW_REGISTRY),
+        ("load_data_to_clean2", DEFAULT_REGISTRY),
+    ]
+    for loader, config_path in loaders:
+        registry = load_registry(config_path, data_root=data_root)
+        for name, spec in registry.items():
+            labels = dict(benchmark=loader, museum=name, path_type=spec["format"])
+            if not os.path.exists(spec["path"]):
+                results.append(dict(labels, status="missing"))
+                continue
+
+            results.append(measure("registry", (loader, name, data_root), **labels))
+
+            if spec["format"] == "json_records":
+                skip_prefixes = tuple(spec.get("flatten", {}).get("skip_prefixes", ()))
+                labels = dict(benchmark="json", museum=name)
+                results.append(
+                    measure("read_json", (spec["path"],), path_type="json", **labels)
+                )
+                results.append(
+                    measure(
+                        "stream_flatten",
+                        (spec["path"], skip_prefixes),
+                        path_type="flattened",
+                        **labels,
+                    )
+                )
+    return results
+
+
+def run_benchmarks(
+    data_folder=None, scale_factors=(1,), registry=False, data_root=None
+):
+    """
+    Run the selected benchmarks and return a JSON-serialisable report.
+    """
+    results = []
+    if data_folder is not None:
+        results.extend(benchmark_clean_folder(data_folder, scale_factors))
+    if registry:
+        results.extend(benchmark_registry(data_root))
+
+    return {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark museum data ingestion")
+    parser.add_argument("--data-folder", help="Folder with the cleaned museum CSVs")
+    parser.add_argument(
+        "--scale",
+        type=int,
+        nargs="+",
+        default=[1],
+        help="Scale factors for synthetic copies of the cleaned CSVs",
+    )
+    parser.add_argument(
+        "--registry",
+        action="store_true",
+        help="Benchmark the raw ingestion of the dataset registries",
+    )
+    parser.add_argument("--data-root", help="Overrides data_root of the registries")
+    parser.add_argument("--output", help="JSON output file, defaults to stdout")
+    args = parser.parse_args()
+
+    report = run_benchmarks(
+        data_folder=args.data_folder,
+        scale_factors=args.scale,
+        registry=args.registry,
+        data_root=args.data_root,
+    )
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+        print(f"Saved {args.output}")
+    else:
+        print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
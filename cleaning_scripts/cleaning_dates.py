@@ -1,12 +1,48 @@
 import pandas as pd
 import re
+from cleaning_scripts.instrumentation import instrumented
+from cleaning_scripts.diagnostics import diagnose_columns
 from cleaning_scripts.extract_first_number import (
-    extract_first_number,
-    extract_last_number,
+    coalesce_year_columns,
+    extract_first_number_series,
+    extract_last_number_series,
+    keep_valid_years,
 )
 
-
-def extract_date(df, possible_columns, new_column_name):
+# Possible source columns for the artist birth and death years, in priority order
+ARTIST_BIRTH_YEAR_COLUMNS = [
+    "Artist Begin Date",
+    "author_born_year",
+    "yearOfBirth",
+    "artist_birth",
+    "BeginDate",
+    "birth_date",
+    "beginyear",
+    "people_0_birthYear",
+    "production_0_creator_date_of_birth",
+]
+
+ARTIST_DEATH_YEAR_COLUMNS = [
+    "Artist End Date",
+    "author_death_year",
+    "yearOfDeath",
+    "artist_death",
+    "EndDate",
+    "death_date",
+    "endyear",
+    "people_0_deathYear",
+    "production_0_creator_date_of_death",
+]
+
+
+@instrumented(output_arg="new_column_name")
+def extract_date(df, possible_columns, new_column_name, coalesce=False):
+    """
+    Extract years into new_column_name from the first existing column of possible_columns.
+    With coalesce=True every row is filled from the first candidate column with a valid year.
+    """
+    if coalesce:
+        return coalesce_year_columns(df, possible_columns, new_column_name)
 
     df[new_column_name] = pd.NA
     found_column = False
@@ -14,11 +50,8 @@ def extract_date(df, possible_columns, new_column_name):
     # Loop over the possible column names and use the first one that exists
     for col in possible_columns:
         if col in df.columns:
-            df[new_column_name] = df[col].apply(extract_first_number)
             # Basic validation: years should be between 1000 and current year
-            current_year = pd.Timestamp.now().year
-            mask = (df[new_column_name] >= 1000) & (df[new_column_name] <= current_year)
-            df.loc[~mask, new_column_name] = pd.NA
+            df[new_column_name] = keep_valid_years(extract_first_number_series(df[col]))
 
             # Calculate statistics
             count_nans = df[new_column_name].notna().sum()
@@ -40,31 +73,20 @@ def extract_date(df, possible_columns, new_column_name):
 
 
 def analyze_data_quality(df, possible_columns, new_column_name):
-
-    diagnostic_results = []
-
+    """
+    Rows where a column of possible_columns has data but new_column_name is NA,
+    with the column in 'source_column'. See diagnose_columns for a lighter result.
+    """
+    diagnostics = diagnose_columns(df, possible_columns, new_column_name)
     for col in possible_columns:
         if col in df.columns:
-            # Keep rows where original column has data but new_column_name is NA
-            problematic_rows = df[
-                (df[col].notna()) & (df[new_column_name].isna())
-            ].copy()
             print(f"Data taken from column {col}")
 
-            if not problematic_rows.empty:
-                # Add column name for reference
-                problematic_rows["source_column"] = col
-                diagnostic_results.append(problematic_rows)
-
     # Combine all problematic rows into one DataFrame
-    if diagnostic_results:
-        diagnostic_df = pd.concat(diagnostic_results, ignore_index=True)
-    else:
-        diagnostic_df = pd.DataFrame()
-
-    return diagnostic_df
+    return diagnostics.rows()
 
 
+@instrumented(output_arg="new_column")
 def extract_date_from_other_column(
     df, new_column, column_with_main_data, column_with_more_data
 ):
@@ -76,8 +98,8 @@ def extract_date_from_other_column(
     mask = (df[column_with_main_data].notna()) & (df[new_column].isna())
 
     # Apply the date extraction directly to the main DataFrame
-    df.loc[mask, new_column] = df.loc[mask, column_with_more_data].apply(
-        extract_first_number
+    df.loc[mask, new_column] = extract_first_number_series(
+        df.loc[mask, column_with_more_data]
     )
 
     # mark changes
@@ -97,6 +119,7 @@ def extract_date_from_other_column(
     return
 
 
+@instrumented(output_arg="new_column")
 def extract_last_date_from_other_column(
     df, new_column, column_with_main_data, column_with_more_data
 ):
@@ -108,8 +131,8 @@ def extract_last_date_from_other_column(
     mask = (df[column_with_main_data].notna()) & (df[new_column].isna())
 
     # Apply the date extraction directly to the main DataFrame
-    df.loc[mask, new_column] = df.loc[mask, column_with_more_data].apply(
-        extract_last_number
+    df.loc[mask, new_column] = extract_last_number_series(
+        df.loc[mask, column_with_more_data]
     )
 
     # mark changes
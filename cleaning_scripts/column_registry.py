@@ -0,0 +1,61 @@
+from cleaning_scripts.string_operations import (
+    ARTIST_NAME_COLUMNS,
+    TITLE_COLUMNS,
+    MEDIUM_COLUMNS,
+    NATIONALITY_COLUMNS,
+    ACQUISITION_METHOD_COLUMNS,
+    GENDER_COLUMNS,
+)
+from cleaning_scripts.acquisition_operations import ACQUISITION_YEAR_COLUMNS
+from cleaning_scripts.production_operations import CREATION_YEAR_COLUMNS
+from cleaning_scripts.cleaning_dates import (
+    ARTIST_BIRTH_YEAR_COLUMNS,
+    ARTIST_DEATH_YEAR_COLUMNS,
+)
+
+# Columns read by the dataset-specific improve_* functions and by ingestion itself
+SUPPORT_COLUMNS = [
+    "object_inventory",  # improve_acquisition_pompidou
+    "locationid",  # improve_acquisition_nga
+    "acquisition?",  # improve_acquisition_kiasma
+    "Object End Date",  # improve_production_met
+    "displaydate_x",  # improve_production_nga
+    "born-death-raw",  # extract_date_from_other_column on Reina Sofia
+    "responsibleOrganisation",  # split of Kiasma and Ateneum
+    "people_0_firstName",  # artist_name of Kiasma and Ateneum
+    "people_0_familyName",
+    "Person",  # Queensland artist, nationality and life dates
+]
+
+# Column lists of every cleaning step, in pipeline order
+PIPELINE_COLUMN_GROUPS = {
+    "create_artist_name_col": ARTIST_NAME_COLUMNS,
+    "create_artwork_title": TITLE_COLUMNS,
+    "clean_acquisition_year": ACQUISITION_YEAR_COLUMNS,
+    "artwork_creation_date": CREATION_YEAR_COLUMNS,
+    "Artist_birth_year": ARTIST_BIRTH_YEAR_COLUMNS,
+    "Artist_death_year": ARTIST_DEATH_YEAR_COLUMNS,
+    "classify_medium": MEDIUM_COLUMNS,
+    "create_artist_nationality": NATIONALITY_COLUMNS,
+    "create_acquisition_method": ACQUISITION_METHOD_COLUMNS,
+    "create_artist_gender": GENDER_COLUMNS,
+    "support": SUPPORT_COLUMNS,
+}
+
+
+def pipeline_columns(extra_columns=()):
+    """
+    Collect every raw column the cleaning pipeline can read.
+
+    Parameters:
+    extra_columns (iterable): Additional columns to keep, e.g. for manual inspection
+
+    Returns:
+    list: Unique column names, in pipeline order
+    """
+    columns = []
+    for group in PIPELINE_COLUMN_GROUPS.values():
+        columns.extend(group)
+    columns.extend(extra_columns)
+    # dict keeps the first occurrence and the order
+    return list(dict.fromkeys(columns))
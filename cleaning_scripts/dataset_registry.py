@@ -0,0 +1,322 @@
+import importlib
+import json
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from cleaning_scripts.column_registry import pipeline_columns
+from cleaning_scripts.flatten_stream import (
+    iter_flattened_batches,
+    load_flattened_json,
+    load_partitioned_json,
+)
+from cleaning_scripts.readers import (
+    read_source,
+    read_fields_records_json,
+    read_source_to_arrow,
+    read_arrow_file,
+)
+from cleaning_scripts.year_rules import apply_year_rules
+
+REGISTRY_DIR = os.path.dirname(os.path.abspath(__file__))
+# Sources of the cleaning notebook (flattened csv files)
+DEFAULT_REGISTRY = os.path.join(REGISTRY_DIR, "datasets.json")
+# Original API dumps, flattened and split during ingestion
+RAW_REGISTRY = os.path.join(REGISTRY_DIR, "datasets_raw.json")
+
+# Overrides the data_root of the config file, e.g. on another machine
+DATA_ROOT_ENV = "MUSEUM_DATA_ROOT"
+
+# Modules searched for hook functions named in the config
+HOOK_MODULES = [
+    "cleaning_scripts.load_data_to_clean",
+    "cleaning_scripts.acquisition_operations",
+    "cleaning_scripts.production_operations",
+    "cleaning_scripts.cleaning_dates",
+]
+
+# Formats that can be read independently in a process pool
+STANDARD_FORMATS = ("csv", "json")
+
+
+def load_registry(config_path=DEFAULT_REGISTRY, data_root=None):
+    """
+    Load a dataset registry config file.
+
+    Parameters:
+    config_path (str): Path to the JSON config
+    data_root (str): Folder the relative source paths are resolved against.
+        Defaults to the MUSEUM_DATA_ROOT environment variable, then to the root of
+        each dataset: its "root" entry in the data_roots of the config, or data_root.
+        A dataset without any of them raises ValueError.
+
+    Returns:
+    dict: Dataset name -> dataset spec with an absolute "path", in config order
+    """
+    with open(config_path, "r") as file:
+        config = json.load(file)
+
+    if data_root is None:
+        data_root = os.environ.get(DATA_ROOT_ENV)
+
+    # Named roots, for sources spread over several folders
+    data_roots = config.get("data_roots", {})
+
+    datasets = {}
+    for name, spec in config["datasets"].items():
+        spec = dict(spec)
+        root = data_root
+        if root is None:
+            if "root" in spec:
+                if spec["root"] not in data_roots:
+                    raise ValueError(
+                        f"Unknown root {spec['root']} of {name}, "
+                        f"add it to data_roots in {config_path}"
+                    )
+                root = data_roots[spec["root"]]
+            else:
+                root = config.get("data_root")
+        if root is None:
+            raise ValueError(
+                f"No data folder for {name}: pass data_root, set {DATA_ROOT_ENV} "
+                f"or add a root to {config_path}"
+            )
+        spec["path"] = os.path.join(root, spec["path"])
+        spec.setdefault("hooks", {})
+        datasets[name] = spec
+    return datasets
+
+
+def select_datasets(registry, names=None):
+    """Return the selected dataset names in config order, unknown names raise ValueError."""
+    if names is None:
+        return list(registry)
+    unknown = [name for name in names if name not in registry]
+    if unknown:
+        raise ValueError(
+            f"Unknown datasets: {unknown}, expected any of {list(registry)}"
+        )
+    return [name for name in registry if name in names]
+
+
+def resolve_hook(function_name):
+    """Find a hook function by name in HOOK_MODULES."""
+    for module_name in HOOK_MODULES:
+        module = importlib.import_module(module_name)
+        if hasattr(module, function_name):
+            return getattr(module, function_name)
+    raise ValueError(f"Hook function {function_name} not found in {HOOK_MODULES}")
+
+
+def apply_hooks(df, spec, step):
+    """
+    Run the hooks of one dataset for a pipeline step ("prepare", "acquisition",
+    "production", "birth_year", "death_year") and return the resulting DataFrame.
+    A hook is either a function name or {"function": name, "kwargs": {...}}.
+    The year rules of the step run after the hooks.
+    """
+    for hook in spec["hooks"].get(step, []):
+        if isinstance(hook, str):
+            hook = {"function": hook}
+        function = resolve_hook(hook["function"])
+        result = function(df, **hook.get("kwargs", {}))
+        # Most hooks work in place, some return a new frame
+        if result is not None:
+            df = result
+
+    rules = spec.get("year_rules", {}).get(step, [])
+    if rules:
+        df = apply_year_rules(df, rules)
+    return df
+
+
+def run_hooks(raw_data, dataset_names, step, config_path=DEFAULT_REGISTRY):
+    """
+    Run the per-museum hooks of a pipeline step on loaded datasets.
+    Replaces the positional improve_* calls, e.g. improve_acquisition_whitney(transformed_data[5]).
+
+    Returns:
+    list: DataFrames in the same order as dataset_names
+    """
+    registry = load_registry(config_path)
+    result = []
+    for df, name in zip(raw_data, dataset_names):
+        if name in registry:
+            df = apply_hooks(df, registry[name], step)
+        result.append(df)
+    return result
+
+
+def _load_standard(specs, columns, parallel, max_workers):
+    # csv and json sources, optionally read concurrently
+    frames = {}
+    if not parallel:
+        for name, spec in specs.items():
+            frames[name] = read_source(spec["path"], columns=columns)
+        return frames
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                name: executor.submit(
+                    read_source_to_arrow, spec["path"], output_dir, columns
+                )
+                for name, spec in specs.items()
+            }
+            for name, future in futures.items():
+                result = future.result()
+                if isinstance(result, str):
+                    result = read_arrow_file(result)
+                frames[name] = result
+    return frames
+
+
+def _load_json_records(specs, columns):
+    frames = {}
+
+    # Sources bundling several organisations are read once per file
+    partition_groups = {}
+    for name, spec in specs.items():
+        skip_prefixes = tuple(spec.get("flatten", {}).get("skip_prefixes", ()))
+        organisation = spec.get("organisation")
+        if organisation is None:
+            frames[name] = load_flattened_json(
+                spec["path"], skip_prefixes=skip_prefixes, columns=columns
+            )
+            continue
+        group_key = (spec["path"], organisation["key"], skip_prefixes)
+        partition_groups.setdefault(group_key, {})[name] = organisation["value"]
+
+    for (path, key, skip_prefixes), partitions in partition_groups.items():
+        frames.update(
+            load_partitioned_json(
+                path,
+                partition_key=key,
+                partitions=partitions,
+                skip_prefixes=skip_prefixes,
+                columns=columns,
+            )
+        )
+    return frames
+
+
+def load_datasets(
+    names=None,
+    config_path=DEFAULT_REGISTRY,
+    data_root=None,
+    parallel=False,
+    max_workers=None,
+    project_columns=False,
+):
+    """
+    Load museum datasets described in a registry config.
+
+    Parameters:
+    names (list): Datasets to load, e.g. ["whitney", "queensland"]. Defaults to all.
+    config_path (str): Registry config, DEFAULT_REGISTRY or RAW_REGISTRY
+    data_root (str): Overrides the data_root of the config
+    parallel (bool): Read csv and json sources concurrently in a process pool
+    max_workers (int): Size of the process pool
+    project_columns (bool): Read only the columns used by the cleaning functions
+        and the key column of each dataset
+
+    Returns:
+    tuple: list of raw DataFrames and list of dataset names in the same order
+    """
+    registry = load_registry(config_path, data_root=data_root)
+    selected = select_datasets(registry, names)
+    columns = None
+    if project_columns:
+        # The key columns are read too, clean_incremental matches rows on them
+        keys = [registry[name]["key"] for name in selected if "key" in registry[name]]
+        columns = pipeline_columns(extra_columns=keys)
+
+    specs_by_format = {}
+    for name in selected:
+        spec = registry[name]
+        specs_by_format.setdefault(spec["format"], {})[name] = spec
+
+    frames = {}
+    standard_specs = {
+        name: spec
+        for fmt in STANDARD_FORMATS
+        for name, spec in specs_by_format.get(fmt, {}).items()
+    }
+    if standard_specs:
+        frames.update(_load_standard(standard_specs, columns, parallel, max_workers))
+    if "json_records" in specs_by_format:
+        frames.update(_load_json_records(specs_by_format["json_records"], columns))
+    for name, spec in specs_by_format.get("fields_records_json", {}).items():
+        frames[name] = read_fields_records_json(spec["path"], columns=columns)
+
+    unknown_formats = set(specs_by_format) - set(STANDARD_FORMATS)
+    unknown_formats -= {"json_records", "fields_records_json"}
+    for fmt in unknown_formats:
+        for name in specs_by_format[fmt]:
+            print(f"Cannot load {name}: unknown format {fmt}")
+
+    raw_data = []
+    dataset_names = []
+    for name in selected:
+        data = frames.get(name)
+        if data is None:
+            print(f"Cannot load {registry[name]['path']}")
+            continue
+        data = apply_hooks(data, registry[name], "prepare")
+        raw_data.append(data)
+        dataset_names.append(name)
+        print(f"Loaded {name} with shape: {data.shape}")
+
+    return raw_data, dataset_names
+
+
+def iter_dataset_batches(
+    name,
+    config_path=RAW_REGISTRY,
+    data_root=None,
+    batch_size=10000,
+    project_columns=False,
+):
+    """
+    Stream a json_records dataset as flattened batches with the prepare hooks applied.
+    Unlike load_datasets, memory stays within one batch instead of about twice the
+    full frame, e.g. to write a large dump to disk or to clean it chunk by chunk.
+
+    Parameters:
+    name (str): Dataset name, e.g. "kiasma"
+    config_path (str): Registry config, RAW_REGISTRY or DEFAULT_REGISTRY
+    data_root (str): Overrides the data_root of the config
+    batch_size (int): Number of records per batch
+    project_columns (bool): Read only the columns used by the cleaning functions
+        and the key column of the dataset
+
+    Yields:
+    pandas.DataFrame: Flattened records of the dataset, at most batch_size rows
+    """
+    registry = load_registry(config_path, data_root=data_root)
+    (name,) = select_datasets(registry, [name])
+    spec = registry[name]
+    if spec["format"] != "json_records":
+        raise ValueError(
+            f"Cannot stream {name}: format {spec['format']}, use load_datasets"
+        )
+
+    columns = None
+    if project_columns:
+        columns = pipeline_columns(extra_columns=[spec["key"]] if "key" in spec else [])
+
+    # A shared dump is filtered on the organisation before flattening
+    record_filter = None
+    organisation = spec.get("organisation")
+    if organisation is not None:
+        record_filter = (
+            lambda record: record.get(organisation["key"]) == organisation["value"]
+        )
+
+    for batch in iter_flattened_batches(
+        spec["path"],
+        skip_prefixes=spec.get("flatten", {}).get("skip_prefixes", ()),
+        batch_size=batch_size,
+        record_filter=record_filter,
+        columns=columns,
+    ):
+        yield apply_hooks(batch, spec, "prepare")
@@ -0,0 +1,152 @@
+import re
+import pandas as pd
+from cleaning_scripts.distinct_values import map_distinct
+from cleaning_scripts.extract_first_number import MAX_YEAR, _year_text
+
+# How exact a parsed date is, from a single year to a whole century
+DATE_PRECISIONS = ["year", "circa", "range", "decade", "century"]
+
+# Optional circa prefix, "c. ", "ca ", "circa ", "about "
+_CIRCA = r"(?P<circa>\b(?:c|ca|circa|about)\b\.?\s*)?"
+
+# Years and ranges, the leftmost one is also the year of extract_first_number
+_YEAR_OR_RANGE = (
+    r"\b(?P<range_start>\d{4})\s*(?P<separator>-|–|—|/|\bto\b)\s*(?P<range_end>\d{4}|\d{1,2})(?![\d-])"
+    # "1960's" is a decade, "1634's" a year
+    r"|\b(?P<year>\d{4})\b(?!(?<=0)'s\b)"
+)
+
+# One regex for all supported forms, the leftmost match in the text wins:
+#   "1920-1925", "c. 1920–25", "1920/21"   -> range
+#   "1800s", "late 1800s"                 -> century
+#   "1960s", "1960's"                     -> decade
+#   "19th century", "19th-century"        -> century
+#   "1920", "c. 1920", "ca 1920"          -> year / circa
+DATE_INTERVAL_PATTERN = re.compile(
+    _CIRCA + r"(?:"
+    r"\b(?P<hundreds>\d{2})00'?s\b"
+    r"|\b(?P<decade>\d{3})0'?s\b"
+    r"|\b(?P<century>\d{1,2})(?:st|nd|rd|th)[\s-]+century\b"
+    r"|" + _YEAR_OR_RANGE + r")"
+)
+
+# An explicit year or range anywhere in the text is preferred over a decade or
+# century, e.g. 1850 for "19th century, 1850"
+YEAR_OR_RANGE_PATTERN = re.compile(_CIRCA + r"(?:" + _YEAR_OR_RANGE + r")")
+
+
+def _range_end(start, end, separator):
+    """
+    End year of a range, NA where the range is rather a date.
+    "1920-25" -> 1925, "1999-2001" -> 2001. Abbreviated ends that would wrap into the
+    next century ("2010-09") and months of hyphenated dates ("1999-01", "1905-10")
+    are dates of the start year.
+    """
+    digits = end.str.len()
+    number = pd.to_numeric(end).astype("Int64")
+    last = start % 10**digits
+    short = digits < 4
+    is_date = short & (
+        (number <= last)
+        | ((separator == "-") & (digits == 2) & (number >= 1) & (number <= 12))
+    )
+    year = (start - last + number).where(short, number)
+    return year.where(~is_date.fillna(False))
+
+
+def _parse_intervals(values):
+    text = _year_text(values).str.lower()
+    parts = text.str.extract(DATE_INTERVAL_PATTERN)
+
+    # Decades and centuries give way to an explicit year in the same text
+    coarse = parts[["hundreds", "decade", "century"]].notna().any(axis=1)
+    if coarse.any():
+        explicit = text[coarse].str.extract(YEAR_OR_RANGE_PATTERN)
+        found = explicit[["year", "range_start"]].notna().any(axis=1)
+        found = found[found].index
+        parts.loc[found, ["hundreds", "decade", "century"]] = pd.NA
+        for col in explicit.columns:
+            parts.loc[found, col] = explicit.loc[found, col]
+
+    to_int = lambda col: pd.to_numeric(parts[col]).astype("Int64")
+
+    start = pd.Series(pd.NA, index=parts.index, dtype="Int64")
+    end = pd.Series(pd.NA, index=parts.index, dtype="Int64")
+    precision = pd.Series(pd.NA, index=parts.index, dtype="object")
+    circa = parts["circa"].notna().to_numpy(dtype=bool, na_value=False)
+
+    year = to_int("year")
+    is_year = year.notna().to_numpy(dtype=bool, na_value=False)
+    start[is_year] = year[is_year]
+    end[is_year] = year[is_year]
+    precision[is_year] = "year"
+
+    range_start = to_int("range_start")
+    is_range = range_start.notna().to_numpy(dtype=bool, na_value=False)
+    range_end = _range_end(
+        range_start[is_range],
+        parts["range_end"][is_range].astype("string"),
+        parts["separator"][is_range].astype("string"),
+    )
+    # A range end that is a month or would wrap makes the range a date of its start year
+    is_date = is_range.copy()
+    is_date[is_range] = range_end.isna().to_numpy()
+    start[is_range] = range_start[is_range]
+    end[is_range] = range_end.fillna(range_start[is_range])
+    precision[is_range] = "range"
+    precision[is_date] = "year"
+    precision[(is_year | is_date) & circa] = "circa"
+
+    hundreds = to_int("hundreds")
+    is_hundreds = hundreds.notna().to_numpy(dtype=bool, na_value=False)
+    start[is_hundreds] = hundreds[is_hundreds] * 100
+    end[is_hundreds] = hundreds[is_hundreds] * 100 + 99
+    precision[is_hundreds] = "century"
+
+    decade = to_int("decade")
+    is_decade = decade.notna().to_numpy(dtype=bool, na_value=False)
+    start[is_decade] = decade[is_decade] * 10
+    end[is_decade] = decade[is_decade] * 10 + 9
+    precision[is_decade] = "decade"
+
+    century = to_int("century")
+    is_century = (century > 0).to_numpy(dtype=bool, na_value=False)
+    start[is_century] = (century[is_century] - 1) * 100
+    end[is_century] = (century[is_century] - 1) * 100 + 99
+    precision[is_century] = "century"
+
+    # Same limit as extract_first_number: dates starting after MAX_YEAR are rejected,
+    # ends after MAX_YEAR or before the start are unknown
+    valid = (start <= MAX_YEAR).to_numpy(dtype=bool, na_value=False)
+    valid_end = ((end >= start) & (end <= MAX_YEAR)).to_numpy(
+        dtype=bool, na_value=False
+    )
+    return pd.DataFrame(
+        {
+            "start_year": start.where(valid),
+            "end_year": end.where(valid & valid_end),
+            "precision": pd.Categorical(
+                precision.where(valid), categories=DATE_PRECISIONS
+            ),
+        },
+        index=parts.index,
+    )
+
+
+def parse_date_intervals(values):
+    """
+    Parse free text dates into intervals, once per distinct value.
+    Works for creation dates ("c. 1920–25", "1960s", "19th century") as well as
+    acquisition dates ("1999", "Purchased 1985-86").
+
+    Parameters:
+    values (pandas.Series): Column with dates
+
+    Returns:
+    pandas.DataFrame: start_year and end_year (Int64) and precision
+        (categorical of DATE_PRECISIONS) with the index of values, NA where nothing is found.
+        end_year is NA when it is after MAX_YEAR or before start_year.
+    """
+    return map_distinct(
+        values, _parse_intervals, name="parse_date_intervals", vectorized=True
+    )
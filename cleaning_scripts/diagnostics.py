@@ -0,0 +1,95 @@
+import numpy as np
+import pandas as pd
+
+
+class ColumnDiagnostics:
+    """
+    Rows where a candidate source column has data but the cleaned column is NA.
+
+    Only the positions of the failing rows, the failure counts and a few of the
+    most frequent failing values are stored, the full rows are built on request
+    with rows(). Memory grows with the number of failures, not with the number
+    of columns of the dataset.
+
+    Attributes:
+        target: cleaned column, e.g. "Year_acquisition"
+        positions: dict source column -> numpy array of row positions
+        counts: pandas.Series source column -> number of failing rows
+        samples: dict source column -> pandas.Series of the most frequent failing values
+    """
+
+    def __init__(self, df, target, positions, sample_size):
+        self._df = df
+        self.target = target
+        self.positions = positions
+        self.counts = pd.Series(
+            {col: len(rows) for col, rows in positions.items()},
+            dtype="int64",
+            name="failures",
+        )
+        self.samples = {
+            col: df[col].iloc[rows].value_counts().head(sample_size)
+            for col, rows in positions.items()
+        }
+
+    def index(self, column):
+        """Index labels of the failing rows of one source column."""
+        return self._df.index[self.positions[column]]
+
+    def summary(self):
+        """One row per source column: failures and the most frequent failing values."""
+        return pd.DataFrame(
+            {
+                "source_column": list(self.positions),
+                "failures": self.counts.to_numpy(),
+                "sample": [list(self.samples[col].index) for col in self.positions],
+            }
+        )
+
+    def rows(self, columns=None, source_columns=None):
+        """
+        Build the failing rows, like the DataFrames of the analyze_* functions.
+
+        Parameters:
+        columns (list): Columns to include, defaults to all columns of the dataset
+        source_columns (list): Source columns to include, defaults to all with failures
+
+        Returns:
+        pandas.DataFrame: Failing rows with a 'source_column' column, empty if there are none
+        """
+        if source_columns is None:
+            source_columns = list(self.positions)
+        data = self._df if columns is None else self._df[list(columns)]
+
+        parts = []
+        for col in source_columns:
+            rows = self.positions[col]
+            if len(rows):
+                parts.append(data.iloc[rows].assign(source_column=col))
+        if not parts:
+            return pd.DataFrame()
+        return pd.concat(parts, ignore_index=True)
+
+
+def diagnose_columns(df, possible_columns, new_column_name, sample_size=10):
+    """
+    Find the rows where a source column has data but new_column_name is NA,
+    for every present column of possible_columns.
+
+    Parameters:
+    df (pandas.DataFrame): Cleaned dataset
+    possible_columns (list): Candidate source columns, e.g. ACQUISITION_YEAR_COLUMNS
+    new_column_name (str): Cleaned column, e.g. "Year_acquisition"
+    sample_size (int): Number of distinct failing values kept per source column
+
+    Returns:
+    ColumnDiagnostics
+    """
+    missing = df[new_column_name].isna().to_numpy()
+    positions = {}
+    for col in possible_columns:
+        if col in df.columns:
+            failing = np.flatnonzero(df[col].notna().to_numpy() & missing)
+            if len(failing):
+                positions[col] = failing
+    return ColumnDiagnostics(df, new_column_name, positions, sample_size)
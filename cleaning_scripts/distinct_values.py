@@ -0,0 +1,77 @@
+import pandas as pd
+
+# Rows and distinct values seen by map_distinct, per function name
+DISTINCT_STATS = {}
+
+
+def _record(name, rows, distinct):
+    stats = DISTINCT_STATS.setdefault(name, {"calls": 0, "rows": 0, "distinct": 0})
+    stats["calls"] += 1
+    stats["rows"] += rows
+    stats["distinct"] += distinct
+
+
+def map_distinct(values, func, name=None, vectorized=False):
+    """
+    Apply a parser or classifier to every distinct value of a column only once
+    and broadcast the results back to all rows.
+
+    Columns like dates, credit lines or media repeat the same text many times,
+    so the work drops from the number of rows to the number of distinct values.
+    Values that compare equal (e.g. 1995 and 1995.0) share one result.
+
+    Parameters:
+    values (pandas.Series): Column to process
+    func (callable): Function of one value, like the functions passed to Series.apply,
+        or of a whole Series if vectorized is True (it may return a Series or a DataFrame)
+    name (str): Name used in the statistics, defaults to the function name
+    vectorized (bool): func takes and returns a Series
+
+    Returns:
+    pandas.Series: Results with the index of values (a DataFrame for vectorized
+        functions returning one)
+    """
+    if name is None:
+        name = getattr(func, "__name__", repr(func))
+
+    try:
+        codes, uniques = pd.factorize(values, use_na_sentinel=True)
+    except TypeError:
+        # Unhashable values (e.g. lists), process every row
+        _record(name, len(values), len(values))
+        return func(values) if vectorized else values.apply(func)
+
+    uniques = pd.Series(uniques)
+    if isinstance(uniques.dtype, pd.CategoricalDtype):
+        uniques = uniques.astype(object)
+
+    # Missing values are processed once as well, with the first missing value of the column
+    missing = codes == -1
+    if missing.any():
+        first_missing = values[missing].iloc[:1].astype(uniques.dtype)
+        uniques = pd.concat([uniques, first_missing], ignore_index=True)
+        codes[missing] = len(uniques) - 1
+
+    results = func(uniques) if vectorized else uniques.apply(func)
+    _record(name, len(values), len(uniques))
+
+    if isinstance(results, pd.DataFrame):
+        return results.iloc[codes].set_axis(values.index)
+    return pd.Series(results.array.take(codes), index=values.index, name=values.name)
+
+
+def distinct_stats():
+    """
+    Return the statistics of map_distinct: calls, rows, distinct values
+    and hit rate (share of rows answered from an already computed value) per function.
+    """
+    stats = pd.DataFrame.from_dict(
+        DISTINCT_STATS, orient="index", columns=["calls", "rows", "distinct"]
+    )
+    stats["hit_rate"] = (1 - stats["distinct"] / stats["rows"]).fillna(0)
+    return stats.rename_axis("function").reset_index()
+
+
+def reset_distinct_stats():
+    """Clear the statistics of map_distinct."""
+    DISTINCT_STATS.clear()
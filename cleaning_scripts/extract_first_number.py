@@ -1,5 +1,13 @@
 import pandas as pd
+import numpy as np
 import re
+from cleaning_scripts.distinct_values import map_distinct
+
+# Standalone 4-digit numbers are year candidates
+YEAR_PATTERN = r"\b(\d{4})\b"
+
+# Years after this one are rejected by the extraction functions
+MAX_YEAR = 2024
 
 
 def extract_first_number(value):
@@ -20,7 +28,7 @@ def extract_first_number(value):
         if years:
             year = pd.to_numeric(years[0])
             # Return year only if it's not greater than 2024
-            return year if year <= 2024 else pd.NA
+            return year if year <= MAX_YEAR else pd.NA
 
     # Return NA if no valid year is found
     return pd.NA
@@ -51,7 +59,150 @@ def extract_last_number(value):
         if years:
             year = pd.to_numeric(years[0])
             # Return year only if it's not greater than 2024
-            return year if year <= 2024 else pd.NA
+            return year if year <= MAX_YEAR else pd.NA
 
     # Return NA if no valid year is found
     return pd.NA
+
+
+def _year_text(values):
+    """
+    Text of every cell the scalar functions would parse, NA for the others:
+    missing values and anything that is not a str, int or float.
+    """
+    values = pd.Series(values)
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        values = values.astype(object)
+
+    missing = values.isna()
+    if pd.api.types.is_numeric_dtype(values.dtype):
+        # Same text as str(value), e.g. "1995.0" for floats
+        text = values.astype(object).astype(str)
+    elif pd.api.types.is_string_dtype(values.dtype):
+        # object columns can mix types, only str, int and float values are parsed
+        types = values.map(type)
+        parsed_types = [t for t in types.unique() if issubclass(t, (str, int, float))]
+        missing |= ~types.isin(parsed_types)
+        text = values.astype(object).astype(str)
+    else:
+        # e.g. datetime columns, never parsed by the scalar functions
+        return pd.Series(pd.NA, index=values.index, dtype="string")
+
+    return text.where(~missing).astype("string")
+
+
+def _first_year(text):
+    # First standalone 4-digit number of every cell, only years up to MAX_YEAR are kept
+    years = pd.to_numeric(
+        text.str.extract(YEAR_PATTERN, expand=False), errors="coerce"
+    ).astype("float64")
+    return years.where(years <= MAX_YEAR).astype("Int64")
+
+
+def extract_first_number_series(values):
+    """
+    Vectorized extract_first_number for a whole column.
+
+    Parameters:
+    values (pandas.Series): Column with dates, e.g. "c. 1890-1895"
+
+    Returns:
+    pandas.Series: Int64 years with the same index, NA where no valid year is found
+    """
+    return map_distinct(
+        values,
+        lambda column: _first_year(_year_text(column)),
+        name="extract_first_number",
+        vectorized=True,
+    )
+
+
+def extract_last_number_series(values):
+    """
+    Vectorized extract_last_number for a whole column: the first year
+    after the last hyphen, or in the whole value if there is no hyphen.
+
+    Parameters:
+    values (pandas.Series): Column with dates, e.g. "1890-1895"
+
+    Returns:
+    pandas.Series: Int64 years with the same index, NA where no valid year is found
+    """
+
+    def last_year(column):
+        # Values without a hyphen are kept whole
+        return _first_year(_year_text(column).str.split("-").str[-1])
+
+    return map_distinct(values, last_year, name="extract_last_number", vectorized=True)
+
+
+def keep_valid_years(years, min_year=1000, max_year=None):
+    """
+    Basic validation of extracted years: years outside min_year..max_year
+    (default: current year) are replaced with NA.
+    """
+    if max_year is None:
+        max_year = pd.Timestamp.now().year
+    in_range = (years >= min_year) & (years <= max_year)
+    return years.where(in_range.fillna(False).astype(bool)).astype("Int64")
+
+
+def coalesce_year_columns(
+    df, possible_columns, new_column_name, source_column=None, extract=None
+):
+    """
+    Coalescing mode of the year column finders: every present candidate column is
+    tried in priority order and each row takes the first valid year (1000..current year).
+    Later columns are only parsed for the rows that are still missing.
+
+    Parameters:
+    df (pandas.DataFrame): Dataset
+    possible_columns (list): Candidate columns in priority order
+    new_column_name (str): Column for the years, e.g. "Year_acquisition"
+    source_column (str): Categorical column recording the winning candidate per row,
+        defaults to new_column_name + "_source"
+    extract (callable): Column -> Int64 years, defaults to extract_first_number_series
+
+    Returns:
+    pandas.DataFrame: df with the new year and source columns
+    """
+    if source_column is None:
+        source_column = f"{new_column_name}_source"
+    if extract is None:
+        extract = extract_first_number_series
+    present = [col for col in possible_columns if col in df.columns]
+
+    years = pd.array([pd.NA] * len(df), dtype="Int64")
+    codes = np.full(len(df), -1, dtype=np.int8)
+    missing = np.ones(len(df), dtype=bool)
+
+    for i, col in enumerate(present):
+        rows = np.flatnonzero(missing & df[col].notna().to_numpy())
+        if len(rows) == 0:
+            continue
+        found = keep_valid_years(extract(df[col].iloc[rows]))
+        hit = found.notna().to_numpy()
+        years[rows[hit]] = found.array[hit]
+        codes[rows[hit]] = i
+        missing[rows[hit]] = False
+
+    df[new_column_name] = pd.Series(years, index=df.index)
+    df[source_column] = pd.Categorical.from_codes(codes, categories=present)
+
+    if not present:
+        print("Data is not found in any expected columns")
+        return df
+
+    # Calculate statistics
+    count_nans = df[new_column_name].notna().sum()
+    total_rows = len(df)
+    coverage_percent = (count_nans / total_rows) * 100 if total_rows else 0
+
+    print(f"Data coalesced from columns: {present}")
+    for col, count in df[source_column].value_counts(sort=False).items():
+        print(f"  {col}: {count}")
+    print(
+        f"Number of cleaned variables: {count_nans} out of {total_rows} ({coverage_percent:.1f}%)"
+    )
+    print("----------------------------------")
+    return df
@@ -0,0 +1,234 @@
+import json
+import pandas as pd
+
+WHITESPACE = " \t\n\r"
+
+
+def iter_json_array(path, chunk_size=1 << 20):
+    """
+    Yield the items of a top-level JSON array one by one,
+    without loading the whole file into memory.
+
+    Parameters:
+    path (str): Path to a JSON file containing an array of records
+    chunk_size (int): Number of characters read from the file at a time
+
+    Yields:
+    object: One decoded array item (usually a dict)
+    """
+    decoder = json.JSONDecoder()
+    with open(path, "r", encoding="utf-8") as file:
+        buffer = ""
+        pos = 0
+        eof = False
+        expect = "["
+
+        while True:
+            # Skip whitespace, refill the buffer when it runs out
+            while pos < len(buffer) and buffer[pos] in WHITESPACE:
+                pos += 1
+            if pos == len(buffer):
+                if eof:
+                    raise ValueError(f"Unexpected end of JSON array in {path}")
+                chunk = file.read(chunk_size)
+                buffer, pos, eof = chunk, 0, not chunk
+                continue
+
+            char = buffer[pos]
+            if expect == "[":
+                if char != "[":
+                    raise ValueError(f"Expected a JSON array in {path}")
+                pos += 1
+                expect = "value_or_end"
+                continue
+            if expect != "value" and char == "]":
+                return
+            if expect == "comma_or_end":
+                if char != ",":
+                    raise ValueError(f"Expected ',' at position {pos} in {path}")
+                pos += 1
+                expect = "value"
+                continue
+
+            try:
+                item, end = decoder.raw_decode(buffer, pos)
+                # A value is only complete when followed by a separator, a number
+                # cut off by the end of the buffer ("2" of "2.5e3") decodes as well
+                complete = eof or (
+                    end < len(buffer) and buffer[end] in WHITESPACE + ",]"
+                )
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                complete = False
+
+            if not complete:
+                chunk = file.read(chunk_size)
+                buffer, pos, eof = buffer[pos:] + chunk, 0, not chunk
+                continue
+
+            yield item
+            pos = end
+            expect = "comma_or_end"
+
+
+def column_projection(columns, separator="_"):
+    """
+    Prepare a projection for flatten_record from a list of flattened column names.
+    Returns the set of columns and the set of every key prefix leading to them.
+    """
+    columns = set(columns)
+    prefixes = set()
+    for column in columns:
+        parts = str(column).split(separator)
+        for i in range(1, len(parts) + 1):
+            prefixes.add(separator.join(parts[:i]))
+    return columns, prefixes
+
+
+def flatten_record(record, separator="_", skip_prefixes=(), projection=None):
+    """
+    Flatten a nested record the same way flatten_json.flatten does
+    ('people_0_firstName'), but skip every key that starts with one of
+    skip_prefixes while walking the record, so skipped branches are never built.
+    With a projection from column_projection only the projected columns are kept,
+    branches that cannot lead to one of them are not walked.
+    """
+    flat = {}
+    if projection is not None:
+        keep_columns, keep_prefixes = projection
+
+    def _flatten(value, key):
+        if key and skip_prefixes and key.startswith(skip_prefixes):
+            return
+        if projection is not None and key and key not in keep_prefixes:
+            return
+        # Empty containers and falsy scalars are kept as they are
+        if not value:
+            # An empty record has no columns, like in flatten_json.flatten
+            if key and (projection is None or key in keep_columns):
+                flat[key] = value
+        elif isinstance(value, dict):
+            for child_key, child_value in value.items():
+                new_key = f"{key}{separator}{child_key}" if key else str(child_key)
+                _flatten(child_value, new_key)
+        elif isinstance(value, (list, tuple, set)):
+            for index, child_value in enumerate(value):
+                _flatten(child_value, f"{key}{separator}{index}")
+        elif projection is None or key in keep_columns:
+            flat[key] = value
+
+    _flatten(record, "")
+    return flat
+
+
+def iter_flattened_batches(
+    path,
+    skip_prefixes=(),
+    batch_size=10000,
+    record_filter=None,
+    chunk_size=1 << 20,
+    columns=None,
+):
+    """
+    Stream a JSON array of records and yield flattened DataFrame batches.
+
+    Parameters:
+    path (str): Path to the JSON dump
+    skip_prefixes (tuple): Flattened column prefixes dropped during parsing
+    batch_size (int): Number of records per yielded DataFrame
+    record_filter (callable): Optional function, records for which it returns False are skipped
+    chunk_size (int): Number of characters read from the file at a time
+    columns (list): Optional flattened columns to keep, all other columns are never built
+
+    Yields:
+    pandas.DataFrame: Flattened records, at most batch_size rows
+    """
+    skip_prefixes = tuple(skip_prefixes)
+    projection = column_projection(columns) if columns is not None else None
+    batch = []
+    for record in iter_json_array(path, chunk_size=chunk_size):
+        if record_filter is not None and not record_filter(record):
+            continue
+        batch.append(
+            flatten_record(record, skip_prefixes=skip_prefixes, projection=projection)
+        )
+        if len(batch) >= batch_size:
+            yield pd.DataFrame(batch)
+            batch = []
+    if batch:
+        yield pd.DataFrame(batch)
+
+
+def load_flattened_json(
+    path, skip_prefixes=(), batch_size=10000, record_filter=None, columns=None
+):
+    """
+    Load a JSON array dump as one flattened DataFrame, batch by batch.
+    Only one batch of Python dicts exists at a time, instead of the full
+    parsed JSON plus the full list of flattened records.
+
+    The batch frames are kept until the final pd.concat, so the peak memory is
+    about twice the size of the returned frame. To stay within one batch, loop
+    over iter_flattened_batches (or dataset_registry.iter_dataset_batches) instead.
+    """
+    batches = list(
+        iter_flattened_batches(
+            path,
+            skip_prefixes=skip_prefixes,
+            batch_size=batch_size,
+            record_filter=record_filter,
+            columns=columns,
+        )
+    )
+    if not batches:
+        return pd.DataFrame()
+    return pd.concat(batches, ignore_index=True)
+
+
+def load_partitioned_json(
+    path, partition_key, partitions, skip_prefixes=(), batch_size=10000, columns=None
+):
+    """
+    Read a JSON dump that bundles several institutions once and split it
+    into one flattened DataFrame per institution in the same pass.
+
+    Parameters:
+    path (str): Path to the JSON dump
+    partition_key (str): Top-level record key holding the institution
+    partitions (dict): Maps output names to partition_key values,
+        e.g. {"kiasma": "Kansallisgalleria / Nykytaiteen museo Kiasma"}
+    skip_prefixes (tuple): Flattened column prefixes dropped during parsing
+    batch_size (int): Number of records collected per partition before building a batch
+    columns (list): Optional flattened columns to keep, all other columns are never built
+
+    Returns:
+    dict: Output name -> flattened DataFrame, in the order of partitions.
+        Records that belong to no partition are not flattened at all.
+    """
+    skip_prefixes = tuple(skip_prefixes)
+    projection = column_projection(columns) if columns is not None else None
+    names_by_value = {value: name for name, value in partitions.items()}
+    pending = {name: [] for name in partitions}
+    batches = {name: [] for name in partitions}
+
+    for record in iter_json_array(path):
+        name = names_by_value.get(record.get(partition_key))
+        if name is None:
+            continue
+        pending[name].append(
+            flatten_record(record, skip_prefixes=skip_prefixes, projection=projection)
+        )
+        if len(pending[name]) >= batch_size:
+            batches[name].append(pd.DataFrame(pending[name]))
+            pending[name] = []
+
+    result = {}
+    for name in partitions:
+        if pending[name]:
+            batches[name].append(pd.DataFrame(pending[name]))
+        if batches[name]:
+            result[name] = pd.concat(batches[name], ignore_index=True)
+        else:
+            result[name] = pd.DataFrame()
+    return result
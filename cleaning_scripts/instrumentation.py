@@ -0,0 +1,242 @@
+import contextlib
+import functools
+import inspect
+import json
+import resource
+import sys
+import time
+import tracemalloc
+import pandas as pd
+
+# Records of the instrumented steps, one dict per call
+METRICS = []
+
+# Settings of the metrics sink, see configure_metrics
+METRICS_CONFIG = {"jsonl_path": None, "quiet": False, "print_records": False}
+
+# Labels added to every record, e.g. the museum name, see metrics_labels
+_LABELS = {}
+
+# Open measurements, to hand the traced memory peak of nested steps to their parent
+_STACK = []
+
+
+class _Discard:
+    # Stand-in for stdout that drops the printed reports without keeping them
+    def write(self, text):
+        return len(text)
+
+    def flush(self):
+        pass
+
+
+def discard_output():
+    """Context manager dropping everything printed inside it, without buffering it."""
+    return contextlib.redirect_stdout(_Discard())
+
+
+def configure_metrics(jsonl_path=None, quiet=False, print_records=False):
+    """
+    Configure the metrics sink of the instrumented cleaning steps.
+
+    Parameters:
+    jsonl_path (str): Append every record as one JSON line to this file, None keeps them in memory only
+    quiet (bool): Drop the printed reports of the cleaning functions (coverage, head() samples)
+    print_records (bool): Print a one-line summary of every record
+    """
+    METRICS_CONFIG.update(
+        jsonl_path=jsonl_path, quiet=quiet, print_records=print_records
+    )
+
+
+@contextlib.contextmanager
+def metrics_labels(**labels):
+    """
+    Add labels (e.g. museum="met") to the records of all steps run inside the block.
+    """
+    previous = dict(_LABELS)
+    _LABELS.update(labels)
+    try:
+        yield
+    finally:
+        _LABELS.clear()
+        _LABELS.update(previous)
+
+
+def _peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes on Linux
+    if sys.platform == "darwin":
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+
+def _coverage(df, column):
+    if column is None or not isinstance(df, pd.DataFrame) or column not in df.columns:
+        return None
+    if len(df) == 0:
+        return 0.0
+    return float(df[column].notna().mean())
+
+
+def _write(record, stream):
+    METRICS.append(record)
+    if METRICS_CONFIG["jsonl_path"] is not None:
+        with open(METRICS_CONFIG["jsonl_path"], "a") as file:
+            file.write(json.dumps(record) + "\n")
+    if METRICS_CONFIG["print_records"]:
+        coverage = record["coverage_after"]
+        coverage = "" if coverage is None else f", coverage {coverage:.1%}"
+        print(
+            f"{record['step']}: {record['wall_time_s']:.3f}s, "
+            f"{record['rows_in']} -> {record['rows_out']} rows{coverage}",
+            file=stream,
+        )
+
+
+class StepMeasurement:
+    """
+    Measurement of one step, returned by measure_step.
+    Set result to the DataFrame the step produced if it is not the input DataFrame.
+    """
+
+    def __init__(self, step, df, output):
+        self.step = step
+        self.df = df
+        self.output = output
+        self.result = None
+        # stdout outside of all steps, the summaries are printed there even in quiet mode
+        self.stdout = _STACK[0].stdout if _STACK else sys.stdout
+        # Highest traced memory of finished nested steps
+        self.nested_peak = 0
+
+
+@contextlib.contextmanager
+def measure_step(step, df=None, output=None):
+    """
+    Record wall time, peak memory growth, rows in and out and the coverage of the
+    output column before and after a block of code.
+
+    Memory is the traced peak above the start of the step when tracemalloc is
+    running (tracemalloc.start() before the run), otherwise the growth of the
+    peak RSS of the process, which stays 0 for steps below an earlier peak.
+
+    Parameters:
+    step (str): Name of the step in the records
+    df (pandas.DataFrame): Input of the step
+    output (str): Column the step fills, e.g. "Year_acquisition"
+
+    Yields:
+    StepMeasurement
+    """
+    measurement = StepMeasurement(step, df, output)
+    rows_in = len(df) if df is not None else None
+    coverage_before = _coverage(df, output)
+
+    tracing = tracemalloc.is_tracing()
+    if tracing:
+        traced_start, traced_peak = tracemalloc.get_traced_memory()
+        if _STACK:
+            _STACK[-1].nested_peak = max(_STACK[-1].nested_peak, traced_peak)
+        tracemalloc.reset_peak()
+    rss_start = _peak_rss_mb()
+
+    _STACK.append(measurement)
+    output_stream = (
+        discard_output() if METRICS_CONFIG["quiet"] else contextlib.nullcontext()
+    )
+    start = time.perf_counter()
+    try:
+        with output_stream:
+            yield measurement
+    finally:
+        wall_time = time.perf_counter() - start
+        _STACK.pop()
+
+        if tracing and tracemalloc.is_tracing():
+            traced_peak = max(
+                tracemalloc.get_traced_memory()[1], measurement.nested_peak
+            )
+            memory = (traced_peak - traced_start) / (1024 * 1024)
+            if _STACK:
+                _STACK[-1].nested_peak = max(_STACK[-1].nested_peak, traced_peak)
+        else:
+            memory = _peak_rss_mb() - rss_start
+
+        result = measurement.result if measurement.result is not None else df
+        record = dict(_LABELS)
+        record.update(
+            step=step,
+            output=output,
+            rows_in=rows_in,
+            rows_out=len(result) if result is not None else None,
+            coverage_before=coverage_before,
+            coverage_after=_coverage(result, output),
+            wall_time_s=wall_time,
+            memory_delta_mb=memory,
+            memory_source="tracemalloc" if tracing else "rss",
+        )
+        _write(record, measurement.stdout)
+
+
+def instrumented(output=None, output_arg=None):
+    """
+    Decorator recording a measure_step record for every call of a cleaning function
+    whose first argument is the DataFrame.
+
+    Parameters:
+    output (str): Column the function fills
+    output_arg (str): Name of the argument holding that column instead, e.g. "new_column_name"
+    """
+
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(df, *args, **kwargs):
+            column = output
+            if output_arg is not None:
+                bound = signature.bind(df, *args, **kwargs)
+                bound.apply_defaults()
+                column = bound.arguments[output_arg]
+
+            with measure_step(func.__name__, df, column) as measurement:
+                result = func(df, *args, **kwargs)
+                if isinstance(result, pd.DataFrame):
+                    measurement.result = result
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def metrics_table():
+    """Return the records of the instrumented steps as a DataFrame."""
+    return pd.DataFrame(METRICS)
+
+
+def metrics_summary(by=("step",)):
+    """
+    Aggregate the records to find the hot steps: calls, total and mean wall time,
+    largest memory growth and rows, sorted by total wall time.
+
+    Parameters:
+    by (tuple): Record fields to group by, e.g. ("museum", "step")
+    """
+    table = metrics_table()
+    if table.empty:
+        return table
+    summary = table.groupby(list(by), sort=False).agg(
+        calls=("wall_time_s", "size"),
+        wall_time_s=("wall_time_s", "sum"),
+        mean_wall_time_s=("wall_time_s", "mean"),
+        max_memory_delta_mb=("memory_delta_mb", "max"),
+        rows=("rows_in", "sum"),
+    )
+    return summary.sort_values("wall_time_s", ascending=False).reset_index()
+
+
+def reset_metrics():
+    """Clear the in-memory records."""
+    METRICS.clear()
@@ -1,49 +1,27 @@
-import pandas as pd
-from flatten_json import flatten
-import json
-import re
+from cleaning_scripts.dataset_registry import DEFAULT_REGISTRY, load_datasets
 
 
-def load_data_to_clean():
-    # Load csv files and json files that do not require flattening or parsing
-    data_paths_standard = [
-        "/Users/CUDAN/Documents/TLU/Data analysis/data/Met/MetObjects.csv",
-        "/Users/CUDAN/Documents/TLU/Data analysis/data/Reina Sofia/raw_data/reina_sofia3.csv",
-        "/Users/CUDAN/Documents/TLU/Data analysis/data/Tate/tate_raw.csv",
-        "/Users/CUDAN/Documents/TLU/Data analysis/data/Centre Pompidou/merged_file.json",
-        "/Users/CUDAN/Documents/TLU/Data analysis/data/Moma/Artworks.csv",
-        "/Users/CUDAN/Documents/TLU/Data analysis/data/whitney/whitney_data_raw.csv",
-        "/Users/CUDAN/Documents/TLU/Data analysis/data/national gallery (DC)/national_gallery_raw.csv",
-        "/Users/CUDAN/Documents/TLU/Data analysis/data/Kiasma/APIexample-master/kiasma_flattened.csv",
-        "/Users/CUDAN/Documents/TLU/Data analysis/data/smk/smk_flattened.csv",
-        "/Users/CUDAN/Documents/TLU/Data analysis/data/Kiasma/APIexample-master/ateneum_flattened.csv",
-        "/Users/CUDAN/Documents/TLU/Data analysis/data/queensland/queensland_flattened.csv",
-    ]
-    raw_data = []
-    dataset_names = [
-        "met",
-        "reina_sofia",
-        "tate",
-        "pompidou",
-        "moma",
-        "whitney",
-        "national_gallery",
-        "kiasma",
-        "smk",
-        "ateneum",
-        "queensland",
-    ]
-    for df, dataset_name in zip(data_paths_standard, dataset_names):
-        # Step 1: Check if '.json' exists in the input
-        if ".json" in df:
-            data = pd.read_json(df)
-        elif ".csv" in df:
-            data = pd.read_csv(df, on_bad_lines="skip", low_memory=False)
-        else:
-            print(f"Cannot load {df}")
-            continue
+def load_data_to_clean(
+    parallel=False, max_workers=None, project_columns=False, names=None
+):
+    """
+    Load the raw datasets for cleaning, as described in cleaning_scripts/datasets.json.
 
-        raw_data.append(data)
-        print(f"Loaded {dataset_name} with shape: {data.shape}")
+    Parameters:
+    parallel (bool): Read the sources concurrently in a process pool. Frames are
+        handed back as memory-mapped Arrow IPC files instead of pickled objects.
+    max_workers (int): Size of the process pool, defaults to the number of CPUs
+    project_columns (bool): Read only the columns used by the cleaning functions
+        (see column_registry.pipeline_columns) instead of every column
+    names (list): Load only these datasets, e.g. ["whitney", "queensland"]
 
-    return raw_data, dataset_names
+    Returns:
+    tuple: list of raw DataFrames and list of dataset names in the same order
+    """
+    return load_datasets(
+        names=names,
+        config_path=DEFAULT_REGISTRY,
+        parallel=parallel,
+        max_workers=max_workers,
+        project_columns=project_columns,
+    )
@@ -1,4 +1,6 @@
 import pandas as pd
+import numpy as np
+from cleaning_scripts.schema import YEAR_COLUMNS
 
 
 def find_outliers(df, col):
@@ -22,3 +24,254 @@ def find_outliers(df, col):
             print(f"\nPotential outliers detected ({len(outliers)} values):")
             print(outliers.value_counts().head())
             print("----------------------------------")
+
+
+# Columns of the outlier reports, one row per (museum, column) pair
+REPORT_COLUMNS = [
+    "museum",
+    "column",
+    "count",
+    "min",
+    "max",
+    "q1",
+    "q3",
+    "iqr",
+    "lower_fence",
+    "upper_fence",
+    "q_low",
+    "q_high",
+    "n_outliers",
+    "outlier_share",
+    "top_outliers",
+]
+
+
+def _add_fences(report, k):
+    # Tukey fences: values further than k * IQR from the quartiles are outliers
+    report["iqr"] = report["q3"] - report["q1"]
+    report["lower_fence"] = report["q1"] - k * report["iqr"]
+    report["upper_fence"] = report["q3"] + k * report["iqr"]
+    return report
+
+
+def _long_values(museum_data, museum_names, columns):
+    # One (museum, column, value) row per non-missing value
+    if isinstance(museum_data, pd.DataFrame):
+        # Long collection table with a 'museum' column
+        frames = [museum_data]
+    else:
+        frames = [df.assign(museum=name) for df, name in zip(museum_data, museum_names)]
+
+    parts = []
+    for df in frames:
+        present = [col for col in columns if col in df.columns]
+        if not present:
+            continue
+        part = df[["museum"] + present].melt(
+            id_vars="museum", var_name="column", value_name="value"
+        )
+        part["museum"] = part["museum"].astype(str)
+        parts.append(part.dropna(subset=["value"]))
+
+    if not parts:
+        return pd.DataFrame(columns=["museum", "column", "value"])
+    long = pd.concat(parts, ignore_index=True)
+    long["value"] = long["value"].astype("float64")
+    # Report rows follow the museum order of the data and the order of columns
+    long["museum"] = pd.Categorical(long["museum"], categories=long["museum"].unique())
+    long["column"] = pd.Categorical(
+        long["column"],
+        categories=[col for col in columns if col in set(long["column"])],
+    )
+    return long
+
+
+def outlier_report(
+    museum_data,
+    museum_names=None,
+    columns=None,
+    k=1.5,
+    tail_quantiles=(0.01, 0.99),
+    top=5,
+):
+    """
+    IQR and quantile fences for every (museum, column) pair in one grouped computation.
+
+    Parameters:
+    museum_data: a list of pandas dataframes, or one long DataFrame with a 'museum' column
+    museum_names: a list of strings with museum names from museum_data
+    columns (list): Numeric columns to screen, defaults to the year columns of the clean schema
+    k (float): IQR multiplier of the fences
+    tail_quantiles (tuple): Lower and upper quantile reported as q_low and q_high
+    top (int): Number of most frequent outlier values kept in top_outliers
+
+    Returns:
+    pandas.DataFrame: REPORT_COLUMNS, one row per (museum, column) pair with data
+    """
+    if columns is None:
+        columns = YEAR_COLUMNS
+    long = _long_values(museum_data, museum_names, columns)
+    if long.empty:
+        return pd.DataFrame(columns=REPORT_COLUMNS)
+
+    grouped = long.groupby(["museum", "column"], observed=True)["value"]
+    low, high = tail_quantiles
+    quantiles = grouped.quantile([0.25, 0.75, low, high]).unstack()
+
+    report = grouped.agg(["count", "min", "max"])
+    report["q1"] = quantiles[0.25]
+    report["q3"] = quantiles[0.75]
+    report["q_low"] = quantiles[low]
+    report["q_high"] = quantiles[high]
+    report = _add_fences(report, k)
+
+    # Compare every value with the fences of its group
+    fences = report[["lower_fence", "upper_fence"]].reindex(
+        pd.MultiIndex.from_frame(long[["museum", "column"]])
+    )
+    is_outlier = (long["value"].to_numpy() < fences["lower_fence"].to_numpy()) | (
+        long["value"].to_numpy() > fences["upper_fence"].to_numpy()
+    )
+    outliers = long[is_outlier]
+    report["n_outliers"] = (
+        outliers.groupby(["museum", "column"])
+        .size()
+        .reindex(report.index, fill_value=0)
+    )
+    report["outlier_share"] = report["n_outliers"] / report["count"]
+
+    # Most frequent outlier values, like value_counts().head() in find_outliers
+    top_values = (
+        outliers.groupby(["museum", "column", "value"], observed=True)
+        .size()
+        .sort_values(ascending=False, kind="stable")
+        .groupby(level=["museum", "column"])
+        .head(top)
+        .reset_index()
+        .groupby(["museum", "column"], observed=True)["value"]
+        .agg(list)
+    )
+    report["top_outliers"] = top_values.reindex(report.index)
+    report["top_outliers"] = report["top_outliers"].apply(
+        lambda values: values if isinstance(values, list) else []
+    )
+
+    report = report.reset_index()
+    report["museum"] = report["museum"].astype(str)
+    report["column"] = report["column"].astype(str)
+    return report[REPORT_COLUMNS]
+
+
+def _quantile_from_counts(values, cumulative, q):
+    # Linear interpolation between the closest ranks, like Series.quantile
+    n = cumulative[-1]
+    position = (n - 1) * q
+    lower = int(np.floor(position))
+    upper = int(np.ceil(position))
+    lower_value = values[np.searchsorted(cumulative, lower, side="right")]
+    upper_value = values[np.searchsorted(cumulative, upper, side="right")]
+    return lower_value + (position - lower) * (upper_value - lower_value)
+
+
+class StreamingOutlierReport:
+    """
+    Streaming version of outlier_report for chunked or out-of-core runs.
+
+    Every (museum, column) pair keeps a histogram of its values, rounded to a
+    multiple of resolution, so memory depends on the value range and not on the
+    number of rows. With the default resolution of 1 the quantiles of integer
+    columns like years are exact, coarser resolutions give approximate quantiles
+    (error up to resolution / 2) for continuous data.
+
+    Usage:
+        stream = StreamingOutlierReport()
+        for chunk in pd.read_csv(path, chunksize=50000):
+            stream.update(chunk, "met")
+        report = stream.report()
+    """
+
+    def __init__(
+        self, columns=None, k=1.5, tail_quantiles=(0.01, 0.99), top=5, resolution=1
+    ):
+        self.columns = YEAR_COLUMNS if columns is None else list(columns)
+        self.k = k
+        self.tail_quantiles = tail_quantiles
+        self.top = top
+        self.resolution = resolution
+        self.histograms = {}
+
+    def update(self, df, museum):
+        """Add the values of one chunk of a museum."""
+        for col in self.columns:
+            if col not in df.columns:
+                continue
+            values = df[col].dropna().astype("float64")
+            if values.empty:
+                continue
+            if self.resolution:
+                values = (values / self.resolution).round() * self.resolution
+            counts = values.value_counts()
+            key = (str(museum), col)
+            if key in self.histograms:
+                counts = self.histograms[key].add(counts, fill_value=0)
+            self.histograms[key] = counts
+
+    def report(self):
+        """
+        Return the outlier report of everything seen so far.
+
+        Returns:
+        pandas.DataFrame: REPORT_COLUMNS, same layout as outlier_report
+        """
+        # Same row order as outlier_report: museums as seen, then the order of columns
+        museums = list(dict.fromkeys(museum for museum, _ in self.histograms))
+        keys = sorted(
+            self.histograms,
+            key=lambda key: (museums.index(key[0]), self.columns.index(key[1])),
+        )
+
+        rows = []
+        low, high = self.tail_quantiles
+        for museum, col in keys:
+            counts = self.histograms[(museum, col)].sort_index()
+            values = counts.index.to_numpy(dtype="float64")
+            cumulative = counts.to_numpy().cumsum()
+            row = {
+                "museum": museum,
+                "column": col,
+                "count": int(cumulative[-1]),
+                "min": values[0],
+                "max": values[-1],
+            }
+            for name, q in (
+                ("q1", 0.25),
+                ("q3", 0.75),
+                ("q_low", low),
+                ("q_high", high),
+            ):
+                row[name] = _quantile_from_counts(values, cumulative, q)
+            rows.append(row)
+
+        if not rows:
+            return pd.DataFrame(columns=REPORT_COLUMNS)
+        report = _add_fences(pd.DataFrame(rows), self.k)
+
+        n_outliers = []
+        top_outliers = []
+        for (museum, col), fence_low, fence_high in zip(
+            keys, report["lower_fence"], report["upper_fence"]
+        ):
+            counts = self.histograms[(museum, col)].sort_index()
+            outliers = counts[(counts.index < fence_low) | (counts.index > fence_high)]
+            n_outliers.append(int(outliers.sum()))
+            top_outliers.append(
+                list(
+                    outliers.sort_values(ascending=False, kind="stable").index[
+                        : self.top
+                    ]
+                )
+            )
+        report["n_outliers"] = n_outliers
+        report["outlier_share"] = report["n_outliers"] / report["count"]
+        report["top_outliers"] = top_outliers
+        return report[REPORT_COLUMNS]
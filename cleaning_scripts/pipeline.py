@@ -0,0 +1,312 @@
+import contextlib
+import os
+from functools import partial
+import numpy as np
+import pandas as pd
+from cleaning_scripts.string_operations import (
+    create_artist_name_col,
+    create_artwork_title,
+    classify_medium,
+    create_artist_nationality,
+    create_acquisition_method,
+    create_artist_gender,
+)
+from cleaning_scripts.acquisition_operations import clean_acquisition_year
+from cleaning_scripts.production_operations import artwork_creation_date
+from cleaning_scripts.cleaning_dates import (
+    extract_date,
+    ARTIST_BIRTH_YEAR_COLUMNS,
+    ARTIST_DEATH_YEAR_COLUMNS,
+)
+from cleaning_scripts.dataset_registry import (
+    DEFAULT_REGISTRY,
+    apply_hooks,
+    load_registry,
+)
+from cleaning_scripts.column_registry import pipeline_columns
+from cleaning_scripts.instrumentation import (
+    discard_output,
+    measure_step,
+    metrics_labels,
+)
+from cleaning_scripts.schema import CLEAN_COLUMNS, clean_schema, enforce_schema
+
+# Hash of the source columns of every row in the output of clean_incremental
+ROW_HASH_COLUMN = "_row_hash"
+
+# Cleaning steps in notebook order, each with the registry hook step run right after it
+PIPELINE_STEPS = [
+    (create_artist_name_col, None),
+    (create_artwork_title, None),
+    (clean_acquisition_year, "acquisition"),
+    (artwork_creation_date, "production"),
+    (
+        partial(
+            extract_date,
+            possible_columns=ARTIST_BIRTH_YEAR_COLUMNS,
+            new_column_name="Artist_birth_year",
+        ),
+        "birth_year",
+    ),
+    (
+        partial(
+            extract_date,
+            possible_columns=ARTIST_DEATH_YEAR_COLUMNS,
+            new_column_name="Artist_death_year",
+        ),
+        "death_year",
+    ),
+    (classify_medium, None),
+    (create_artist_nationality, None),
+    (create_acquisition_method, None),
+    (create_artist_gender, None),
+]
+
+
+# Year steps with a coalescing mode across all their candidate columns
+COALESCING_STEPS = (clean_acquisition_year, artwork_creation_date, extract_date)
+
+
+def clean_dataset(df, spec=None, verbose=True, coalesce=False):
+    """
+    Run every cleaning step on one raw dataset.
+
+    Parameters:
+    df (pandas.DataFrame): Raw dataset
+    spec (dict): Optional registry entry of the museum, its hooks run after the matching step
+    verbose (bool): Show the printed statistics of the cleaning functions
+    coalesce (bool): Fill the year columns row by row from all their candidate columns,
+        the winning column is kept in a categorical <year column>_source column
+
+    Returns:
+    pandas.DataFrame: Dataset with all derived columns
+    """
+    # The cleaning functions report by printing, drop the reports in batch runs
+    output = contextlib.nullcontext() if verbose else discard_output()
+    # Every step is recorded by cleaning_scripts.instrumentation, plus the whole run here
+    with output, measure_step("clean_dataset", df) as measurement:
+        for step, hook_step in PIPELINE_STEPS:
+            if coalesce and getattr(step, "func", step) in COALESCING_STEPS:
+                result = step(df, coalesce=True)
+            else:
+                result = step(df)
+            if result is not None:
+                df = result
+            if spec is not None and hook_step is not None:
+                df = apply_hooks(df, spec, hook_step)
+        measurement.result = df
+    return df
+
+
+def clean_in_chunks(
+    source_path,
+    output_path,
+    dataset_name=None,
+    chunksize=50000,
+    columns=None,
+    config_path=DEFAULT_REGISTRY,
+    verbose=False,
+    coalesce=False,
+):
+    """
+    Clean a large csv source batch by batch with bounded memory.
+
+    Each batch of rows is read, run through all cleaning steps (and the registry
+    hooks of dataset_name), reduced to the clean columns and appended to output_path.
+    Only one batch and its intermediate columns (Medium_raw, nationality_raw, ...)
+    are in memory at any time, whatever the size of the source.
+
+    Parameters:
+    source_path (str): Raw csv file, e.g. MetObjects.csv
+    output_path (str): Cleaned csv file, overwritten
+    dataset_name (str): Registry name of the museum, to run its improve hooks
+    chunksize (int): Number of rows per batch
+    columns (list): Optional projection, e.g. column_registry.pipeline_columns()
+    config_path (str): Registry config used to look up dataset_name
+    verbose (bool): Show the printed statistics of the cleaning functions for every batch
+    coalesce (bool): Coalescing mode of the year columns, see clean_dataset
+
+    Returns:
+    int: Number of cleaned rows written
+    """
+    spec = None
+    if dataset_name is not None:
+        spec = load_registry(config_path)[dataset_name]
+    schema = clean_schema()
+
+    usecols = None
+    if columns is not None:
+        columns = set(columns)
+        usecols = lambda col: col in columns
+
+    # Read everything as text: dtypes inferred per batch could differ between batches
+    reader = pd.read_csv(
+        source_path,
+        chunksize=chunksize,
+        dtype=str,
+        usecols=usecols,
+        on_bad_lines="skip",
+    )
+
+    if os.path.exists(output_path):
+        os.remove(output_path)
+
+    total_rows = 0
+    for i, chunk in enumerate(reader):
+        with metrics_labels(museum=dataset_name, batch=i):
+            chunk = clean_dataset(chunk, spec=spec, verbose=verbose, coalesce=coalesce)
+        chunk = enforce_schema(chunk, schema)[CLEAN_COLUMNS]
+        chunk.to_csv(output_path, mode="a", header=(i == 0), index=False)
+        total_rows += len(chunk)
+        print(f"Cleaned batch {i + 1}: {total_rows} rows written")
+
+    return total_rows
+
+
+def row_hashes(df, columns):
+    """
+    Hash the given source columns of every row (uint64, stable between runs).
+    Values are hashed as text, so a column read as int in one run and as float
+    or string in the next one keeps the hashes of its unchanged rows.
+    """
+    columns = sorted(col for col in columns if col in df.columns)
+    text = {}
+    for col in columns:
+        values = df[col]
+        # Integer columns turn into float as soon as one value is missing, 1900.0 -> 1900
+        if pd.api.types.is_float_dtype(values) and (values.dropna() % 1 == 0).all():
+            values = values.astype("Int64")
+        text[col] = values.astype("string")
+    return pd.util.hash_pandas_object(pd.DataFrame(text, index=df.index), index=False)
+
+
+def dependency_columns(spec=None):
+    """
+    Raw columns the cleaned output of a dataset depends on: every column the
+    cleaning steps read plus the columns named in its hooks and year rules.
+    """
+    extra = []
+    if spec is not None:
+        for hooks in spec.get("hooks", {}).values():
+            for hook in hooks:
+                if isinstance(hook, dict):
+                    extra.extend(
+                        value
+                        for value in hook.get("kwargs", {}).values()
+                        if isinstance(value, str)
+                    )
+        for rules in spec.get("year_rules", {}).values():
+            for rule in rules:
+                extra.extend([rule["when_present"], rule["source"]])
+    return pipeline_columns(extra)
+
+
+def clean_incremental(
+    raw_data,
+    state_path,
+    dataset_name=None,
+    key=None,
+    config_path=DEFAULT_REGISTRY,
+    verbose=False,
+    coalesce=False,
+):
+    """
+    Re-clean only the new and changed rows of a dataset and merge them into the
+    previous cleaned output.
+
+    Every row is identified by a stable key column (the "key" of the dataset in the
+    registry, e.g. "Object ID" for the MET) and carries a hash of the source columns
+    its cleaned values depend on. Rows with a known key and an unchanged hash are
+    taken from the previous output, rows that left the dump are dropped.
+
+    Parameters:
+    raw_data (pandas.DataFrame): Current raw dump of the dataset
+    state_path (str): Parquet file with the previous cleaned output, created on the first run
+    dataset_name (str): Registry name of the museum, for its key and hooks
+    key (str): Key column, overrides the registry
+    config_path (str): Registry config used to look up dataset_name
+    verbose (bool): Show the printed statistics of the cleaning functions
+    coalesce (bool): Coalescing mode of the year columns, see clean_dataset.
+        Unchanged rows are not re-cleaned, use the same mode for every run of a state file
+
+    Returns:
+    pandas.DataFrame: Clean columns plus the key and ROW_HASH_COLUMN, in the row order of raw_data
+    """
+    spec = None
+    if dataset_name is not None:
+        spec = load_registry(config_path)[dataset_name]
+    if key is None:
+        key = spec.get("key") if spec is not None else None
+    if key is None:
+        raise ValueError(
+            "A key column is required, set 'key' in the registry or pass key"
+        )
+    if raw_data[key].isna().any() or raw_data[key].duplicated().any():
+        raise ValueError(f"Key column {key} must be unique and not null")
+
+    hashes = row_hashes(raw_data, dependency_columns(spec)).to_numpy()
+
+    previous = None
+    if os.path.exists(state_path):
+        previous = pd.read_parquet(state_path)
+
+    # A state without rows, or written before a clean column was added, is rebuilt
+    if (
+        previous is not None
+        and len(previous)
+        and {key, ROW_HASH_COLUMN, *CLEAN_COLUMNS} <= set(previous.columns)
+    ):
+        # Position of every current key in the previous output, -1 for new keys
+        positions = pd.Index(previous[key]).get_indexer(raw_data[key])
+        is_new = positions == -1
+        previous_hashes = previous[ROW_HASH_COLUMN].to_numpy()
+        previous_hash = np.where(
+            is_new, 0, previous_hashes[np.maximum(positions, 0)]
+        ).astype(previous_hashes.dtype)
+        unchanged = ~is_new & (previous_hash == hashes)
+    else:
+        previous = None
+        is_new = np.ones(len(raw_data), dtype=bool)
+        unchanged = np.zeros(len(raw_data), dtype=bool)
+    changed = ~unchanged & ~is_new
+
+    schema = clean_schema()
+    parts = []
+    if previous is not None and unchanged.any():
+        parts.append(previous[previous[key].isin(raw_data[key][unchanged])])
+
+    # Only new and changed rows go through the cleaning steps
+    if (~unchanged).any():
+        dirty = raw_data[~unchanged].copy()
+        with metrics_labels(museum=dataset_name):
+            cleaned = clean_dataset(
+                dirty, spec=spec, verbose=verbose, coalesce=coalesce
+            )
+        cleaned = enforce_schema(cleaned, schema)[CLEAN_COLUMNS]
+        cleaned[key] = dirty[key].to_numpy()
+        cleaned[ROW_HASH_COLUMN] = hashes[~unchanged]
+        parts.append(cleaned)
+    elif not parts:
+        # Nothing to clean, the coverage prints of clean_dataset divide by the row count
+        empty = pd.DataFrame(
+            {column: pd.Series(dtype=schema[column]) for column in CLEAN_COLUMNS}
+        )
+        empty[key] = raw_data[key].iloc[:0].to_numpy()
+        empty[ROW_HASH_COLUMN] = hashes[:0]
+        parts.append(empty)
+
+    # Back in the row order of the current dump
+    result = pd.concat(parts, ignore_index=True)
+    result = result.set_index(key).reindex(raw_data[key]).reset_index()
+    result = enforce_schema(result, schema)[CLEAN_COLUMNS + [key, ROW_HASH_COLUMN]]
+
+    tmp_path = f"{state_path}.tmp"
+    result.to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, state_path)
+
+    deleted = 0 if previous is None else len(previous) - unchanged.sum() - changed.sum()
+    print(
+        f"Rows: {len(raw_data)}, unchanged: {unchanged.sum()}, changed: {changed.sum()}, "
+        f"new: {is_new.sum()}, deleted: {deleted}"
+    )
+    return result
@@ -1,35 +1,86 @@
 import pandas as pd
-import re
-from cleaning_scripts.extract_first_number import extract_first_number
+from cleaning_scripts.instrumentation import instrumented
+from cleaning_scripts.extract_first_number import (
+    coalesce_year_columns,
+    keep_valid_years,
+)
+from cleaning_scripts.date_intervals import DATE_PRECISIONS, parse_date_intervals
+from cleaning_scripts.diagnostics import diagnose_columns
+from cleaning_scripts.year_rules import apply_year_rules, museum_year_rules
+
+CREATION_YEAR_COLUMNS = [
+    "Object Date",
+    "year_production",
+    "year",
+    "object_date",
+    "Date",
+    "display_date",
+    "endyear_x",
+    "yearFrom",
+    "production_date_0_end",
+    "DateCreated",
+]
+
+
+def start_years(values):
+    """Start year of the date intervals of a column, e.g. 1920 for "c. 1920–25"."""
+    return parse_date_intervals(values)["start_year"]
+
+
+def add_interval_columns(df, source_column="Date_creation_year_source"):
+    """
+    Add Date_creation_end_year and Date_creation_precision to a coalesced dataset,
+    from the interval of the column each row took its creation year from.
+    """
+    end_years = pd.Series(pd.NA, index=df.index, dtype="Int64")
+    precisions = pd.Series(
+        pd.Categorical([None] * len(df), categories=DATE_PRECISIONS), index=df.index
+    )
+    sources = df[source_column]
+    for col in sources.cat.categories:
+        rows = (sources == col).to_numpy()
+        if rows.any():
+            intervals = parse_date_intervals(df.loc[rows, col])
+            end_years[rows] = intervals["end_year"]
+            precisions[rows] = intervals["precision"]
+
+    df["Date_creation_end_year"] = end_years
+    df["Date_creation_precision"] = precisions
+    return df
 
 
-def artwork_creation_date(df):
-    possible_columns = [
-        "Object Date",
-        "year_production",
-        "year",
-        "object_date",
-        "Date",
-        "display_date",
-        "endyear_x",
-        "yearFrom",
-        "production_date_0_end",
-        "DateCreated",
-    ]
+@instrumented(output="Date_creation_year")
+def artwork_creation_date(df, coalesce=False):
+    """
+    Extract the artwork creation year from the first existing column of CREATION_YEAR_COLUMNS.
+    The dates are parsed as intervals: Date_creation_year is the start year,
+    Date_creation_end_year and Date_creation_precision describe the interval
+    ("1960s" -> 1960, 1969, "decade").
+    With coalesce=True every row is filled from the first candidate column with a valid year.
+    """
+    possible_columns = CREATION_YEAR_COLUMNS
+
+    if coalesce:
+        df = coalesce_year_columns(
+            df, possible_columns, "Date_creation_year", extract=start_years
+        )
+        return add_interval_columns(df)
 
     df["Date_creation_year"] = pd.NA
+    df["Date_creation_end_year"] = pd.NA
+    df["Date_creation_precision"] = pd.NA
     found_column = False
 
     # Loop over the possible column names and use the first one that exists
     for col in possible_columns:
         if col in df.columns:
-            df["Date_creation_year"] = df[col].apply(extract_first_number)
+            intervals = parse_date_intervals(df[col])
+
             # Basic validation: years should be between 1000 and current year
-            current_year = pd.Timestamp.now().year
-            mask = (df["Date_creation_year"] >= 1000) & (
-                df["Date_creation_year"] <= current_year
-            )
-            df.loc[~mask, "Date_creation_year"] = pd.NA
+            df["Date_creation_year"] = keep_valid_years(intervals["start_year"])
+            valid = df["Date_creation_year"].notna()
+            df["Date_creation_end_year"] = intervals["end_year"].where(valid)
+            df["Date_creation_precision"] = intervals["precision"].where(valid)
 
             # Calculate statistics
             count_nans = df["Date_creation_year"].notna().sum()
@@ -50,218 +101,60 @@ def artwork_creation_date(df):
     return df
 
 
-def analyze_production_columns(df):
-
-    diagnostic_results = []
-    possible_columns = [
-        "acquisition_date",
-        "credit_line",
-        "AccessionYear",
-        "artwork_acquisition",
-        "year_adquisition",
-        "acquisitionYear",
-        "DateAcquired",
-        "accession_number",
-        "accessionnum",
-        "inventoryNumber",
-        "acquisition_date_precision",
-        "AcquiredDate",
-    ]
-
-    for col in possible_columns:
-        if col in df.columns:
-            # Keep rows where original column has data but Date_creation_year is NA
-            problematic_rows = df[
-                (df[col].notna()) & (df["Date_creation_year"].isna())
-            ].copy()
+def diagnose_production_columns(df, sample_size=10):
+    """
+    Positions, counts and sample values of the rows where a creation date column
+    has data but Date_creation_year is NA, see diagnostics.ColumnDiagnostics.
+    """
+    return diagnose_columns(
+        df, CREATION_YEAR_COLUMNS, "Date_creation_year", sample_size=sample_size
+    )
 
-            if not problematic_rows.empty:
-                # Add column name for reference
-                problematic_rows["source_column"] = col
-                diagnostic_results.append(problematic_rows)
 
+def analyze_production_columns(df):
+    """
+    Rows where a creation date column has data but Date_creation_year is NA,
+    with the column in 'source_column'.
+    """
     # Combine all problematic rows into one DataFrame
-    if diagnostic_results:
-        diagnostic_df = pd.concat(diagnostic_results, ignore_index=True)
-    else:
-        diagnostic_df = pd.DataFrame()
-
-    return diagnostic_df
+    return diagnose_production_columns(df).rows()
 
 
 def improve_production_met(df):
     """
-    Using this function we add data from "Object End Date" column
+    MET: creation year from the 'Object End Date' column.
+    The rule is configured in the year_rules of datasets.json.
     """
-    # Create mask for problematic rows
-    mask = (df["Object Date"].notna()) & (df["Date_creation_year"].isna())
-
-    # Apply the date extraction directly to the main DataFrame
-    df.loc[mask, "Date_creation_year"] = df.loc[mask, "Object End Date"].apply(
-        extract_first_number
-    )
-
-    # mark changes
-    df.loc[mask, "source_column"] = "Object End Date"
-    # Print summary of improvements
-    total_fixed = mask.sum() - df[mask]["Date_creation_year"].isna().sum()
-    print(f"Fixed {total_fixed} out of {mask.sum()} problematic rows")
-    count_nans = df["Date_creation_year"].notna().sum()
-    total_rows = len(df)
-    coverage_percent = (count_nans / total_rows) * 100
-
-    print(
-        f"MET - Number of cleaned variables: {count_nans} out of {total_rows} ({coverage_percent:.1f}%)"
-    )
-    print("---------------------------------------")
-    return df
+    return apply_year_rules(df, museum_year_rules("met", "production"))
 
 
 def improve_production_moma(df):
     """
-    Using this function we use the same column, but change the regex pattern
+    MOMA: first 18xx/19xx year of the Date column.
+    The rule is configured in the year_rules of datasets.json.
     """
-    # Create mask for problematic rows
-    mask = (df["Date"].notna()) & (df["Date_creation_year"].isna())
-
-    # Function to extract year using regex
-    def extract_moma_prod(text):
-        if pd.isna(text):
-            return pd.NA
-        # Look for pattern
-        match = re.findall(r"(1[89]\d{2}).*", str(text))
-        if match:
-            return int(match[0])
-        return pd.NA
-
-    # Apply the date extraction directly to the main DataFrame
-    df.loc[mask, "Date_creation_year"] = df.loc[mask, "Date"].apply(extract_moma_prod)
-
-    # mark changes
-    df.loc[mask, "source_column"] = "Date"
-    # Print summary of improvements
-    total_fixed = mask.sum() - df[mask]["Date_creation_year"].isna().sum()
-    print(f"Fixed {total_fixed} out of {mask.sum()} problematic rows")
-    count_nans = df["Date_creation_year"].notna().sum()
-    total_rows = len(df)
-    coverage_percent = (count_nans / total_rows) * 100
-
-    print(
-        f"MOMA - Number of cleaned variables: {count_nans} out of {total_rows} ({coverage_percent:.1f}%)"
-    )
-    print("---------------------------------------")
-    return df
+    return apply_year_rules(df, museum_year_rules("moma", "production"))
 
 
 def improve_production_whitney(df):
     """
-    Using this function we use the same column, but change the regex pattern
+    Whitney: first 18xx/19xx year of display_date.
+    The rule is configured in the year_rules of datasets.json.
     """
-    # Create mask for problematic rows
-    mask = (df["display_date"].notna()) & (df["Date_creation_year"].isna())
-
-    # Function to extract year using regex
-    def extract_moma_prod(text):
-        if pd.isna(text):
-            return pd.NA
-        # Look for pattern
-        match = re.findall(r"(1[89]\d{2}).*", str(text))
-        if match:
-            return int(match[0])
-        return pd.NA
-
-    # Apply the date extraction directly to the main DataFrame
-    df.loc[mask, "Date_creation_year"] = df.loc[mask, "display_date"].apply(
-        extract_moma_prod
-    )
-
-    # mark changes
-    df.loc[mask, "source_column"] = "display_date"
-    # Print summary of improvements
-    total_fixed = mask.sum() - df[mask]["Date_creation_year"].isna().sum()
-    print(f"Fixed {total_fixed} out of {mask.sum()} problematic rows")
-    count_nans = df["Date_creation_year"].notna().sum()
-    total_rows = len(df)
-    coverage_percent = (count_nans / total_rows) * 100
-
-    print(
-        f"whitney - Number of cleaned variables: {count_nans} out of {total_rows} ({coverage_percent:.1f}%)"
-    )
-    print("---------------------------------------")
-    return df
+    return apply_year_rules(df, museum_year_rules("whitney", "production"))
 
 
 def improve_production_nga(df):
     """
-    use regex formula on another column
+    NGA: first 18xx/19xx year of displaydate_x.
+    The rule is configured in the year_rules of datasets.json.
     """
-    # Create mask for problematic rows
-    mask = (df["endyear_x"].notna()) & (df["Date_creation_year"].isna())
-
-    # Function to extract year using regex
-    def extract_moma_prod(text):
-        if pd.isna(text):
-            return pd.NA
-        # Look for pattern
-        match = re.findall(r"(1[89]\d{2}).*", str(text))
-        if match:
-            return int(match[0])
-        return pd.NA
-
-    # Apply the date extraction directly to the main DataFrame
-    df.loc[mask, "Date_creation_year"] = df.loc[mask, "displaydate_x"].apply(
-        extract_moma_prod
-    )
-
-    # mark changes
-    df.loc[mask, "source_column"] = "displaydate_x"
-    # Print summary of improvements
-    total_fixed = mask.sum() - df[mask]["Date_creation_year"].isna().sum()
-    print(f"Fixed {total_fixed} out of {mask.sum()} problematic rows")
-    count_nans = df["Date_creation_year"].notna().sum()
-    total_rows = len(df)
-    coverage_percent = (count_nans / total_rows) * 100
-
-    print(
-        f"NGA - Number of cleaned variables: {count_nans} out of {total_rows} ({coverage_percent:.1f}%)"
-    )
-    print("---------------------------------------")
-    return df
+    return apply_year_rules(df, museum_year_rules("national_gallery", "production"))
 
 
 def improve_production_queensland(df):
     """
-    use another regex formula on original column
+    Queensland: first 18xx/19xx year of DateCreated.
+    The rule is configured in the year_rules of datasets.json.
     """
-    # Create mask for problematic rows
-    mask = (df["DateCreated"].notna()) & (df["Date_creation_year"].isna())
-
-    # Function to extract year using regex
-    def extract_moma_prod(text):
-        if pd.isna(text):
-            return pd.NA
-        # Look for pattern
-        match = re.findall(r"(1[89]\d{2}).*", str(text))
-        if match:
-            return int(match[0])
-        return pd.NA
-
-    # Apply the date extraction directly to the main DataFrame
-    df.loc[mask, "Date_creation_year"] = df.loc[mask, "DateCreated"].apply(
-        extract_moma_prod
-    )
-
-    # mark changes
-    df.loc[mask, "source_column"] = "DateCreated"
-    # Print summary of improvements
-    total_fixed = mask.sum() - df[mask]["Date_creation_year"].isna().sum()
-    print(f"Fixed {total_fixed} out of {mask.sum()} problematic rows")
-    count_nans = df["Date_creation_year"].notna().sum()
-    total_rows = len(df)
-    coverage_percent = (count_nans / total_rows) * 100
-
-    print(
-        f"Queensland - Number of cleaned variables: {count_nans} out of {total_rows} ({coverage_percent:.1f}%)"
-    )
-    print("---------------------------------------")
-    return df
+    return apply_year_rules(df, museum_year_rules("queensland", "production"))
@@ -0,0 +1,82 @@
+import json
+import os
+import tempfile
+import pandas as pd
+
+
+def read_source(path, columns=None):
+    """
+    Read one raw source file into a DataFrame, based on the file extension.
+    If columns is given, only these columns are kept (missing ones are ignored).
+    Returns None if the format is not supported.
+    """
+    if columns is not None:
+        columns = set(columns)
+
+    # Step 1: Check if '.json' exists in the input
+    if ".json" in path:
+        data = pd.read_json(path)
+        # read_json cannot project, drop the other columns right after parsing
+        if columns is not None:
+            data = data[[col for col in data.columns if col in columns]]
+        return data
+    elif ".csv" in path:
+        # usecols skips the other columns while parsing
+        usecols = (lambda col: col in columns) if columns is not None else None
+        return pd.read_csv(path, on_bad_lines="skip", low_memory=False, usecols=usecols)
+    return None
+
+
+def read_fields_records_json(path, columns=None):
+    """
+    Read an open data portal dump with a "fields" list (column ids)
+    and a "records" list of rows, like the Queensland collection.
+    """
+    with open(path, "r") as file:
+        data = json.load(file)
+
+    # Extract the column names from the "fields" part of the JSON
+    source_columns = [field["id"] for field in data["fields"]]
+
+    # Create the DataFrame from the records (the data)
+    df = pd.DataFrame(data["records"], columns=source_columns)
+    if columns is not None:
+        columns = set(columns)
+        df = df[[col for col in df.columns if col in columns]]
+    return df
+
+
+def read_source_to_arrow(path, output_dir, columns=None):
+    """
+    Worker for the parallel mode: read a source and write it as an Arrow IPC file,
+    so the parent process can memory-map it instead of unpickling the frame.
+    Returns the IPC path, or the DataFrame itself if Arrow cannot encode it.
+    """
+    import pyarrow as pa
+
+    data = read_source(path, columns=columns)
+    if data is None:
+        return None
+
+    try:
+        table = pa.Table.from_pandas(data, preserve_index=False)
+    except (pa.ArrowException, TypeError, ValueError):
+        # e.g. object columns mixing numbers and strings, fall back to pickling
+        return data
+
+    fd, ipc_path = tempfile.mkstemp(suffix=".arrow", dir=output_dir)
+    os.close(fd)
+    with pa.OSFile(ipc_path, "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    return ipc_path
+
+
+def read_arrow_file(ipc_path):
+    """Load an Arrow IPC file written by read_source_to_arrow and delete it."""
+    import pyarrow as pa
+
+    with pa.memory_map(ipc_path, "r") as source:
+        data = pa.ipc.open_file(source).read_all().to_pandas()
+    os.remove(ipc_path)
+    return data
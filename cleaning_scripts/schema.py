@@ -0,0 +1,144 @@
+import os
+import numpy as np
+import pandas as pd
+from cleaning_scripts.load_tags import (
+    load_medium_tags,
+    load_nationality_tags,
+    load_acquisition_tags,
+)
+from cleaning_scripts.date_intervals import DATE_PRECISIONS
+
+# Columns of the cleaned museum tables, in output order
+CLEAN_COLUMNS = [
+    "Artist",
+    "Title",
+    "Medium",
+    "Medium_classified",
+    "Acquisition_classified",
+    "Year_acquisition",
+    "Gender_classified",
+    "Artist_birth_year",
+    "Artist_death_year",
+    "Country_calculated",
+    "Date_creation_year",
+    "Date_creation_end_year",
+    "Date_creation_precision",
+]
+
+YEAR_COLUMNS = [
+    "Year_acquisition",
+    "Date_creation_year",
+    "Date_creation_end_year",
+    "Artist_birth_year",
+    "Artist_death_year",
+]
+
+STRING_COLUMNS = ["Artist", "Title", "Medium"]
+
+GENDER_CATEGORIES = ["female", "male"]
+
+
+def _string_dtype():
+    # Arrow-backed strings when pyarrow is installed, plain nullable strings otherwise
+    try:
+        import pyarrow  # noqa: F401
+
+        return pd.StringDtype("pyarrow")
+    except ImportError:
+        return pd.StringDtype()
+
+
+def _categories(labels):
+    # Tag lists may repeat a label, categories have to be unique
+    return pd.CategoricalDtype(list(dict.fromkeys(labels)))
+
+
+def clean_schema():
+    """
+    Return the canonical dtypes of the cleaned museum tables.
+
+    Years are nullable Int16, the classified columns are categoricals with the
+    same categories for every museum (taken from the tag lists in load_tags, and
+    DATE_PRECISIONS for the creation date precision), and free text columns are
+    Arrow-backed strings.
+
+    Returns:
+    dict: Column name -> pandas dtype
+    """
+    _, medium_names = load_medium_tags()
+    _, country_names = load_nationality_tags()
+    _, acquisition_methods = load_acquisition_tags()
+
+    schema = {col: _string_dtype() for col in STRING_COLUMNS}
+    schema.update({col: pd.Int16Dtype() for col in YEAR_COLUMNS})
+    schema["Medium_classified"] = _categories(medium_names)
+    schema["Acquisition_classified"] = _categories(acquisition_methods)
+    schema["Country_calculated"] = _categories(country_names)
+    schema["Gender_classified"] = _categories(GENDER_CATEGORIES)
+    schema["Date_creation_precision"] = _categories(DATE_PRECISIONS)
+    return schema
+
+
+def enforce_schema(df, schema=None):
+    """
+    Convert a cleaned museum table to the canonical schema.
+
+    Missing columns are added as empty columns, extra columns are kept after the
+    schema columns. Values that are not valid years become NA. Labels of the
+    categorical columns that are not in the tag lists (e.g. gender values other
+    than female/male) are kept by appending them to the categories of this table.
+
+    Parameters:
+    df (pandas.DataFrame): Cleaned museum table
+    schema (dict): Optional precomputed result of clean_schema()
+
+    Returns:
+    pandas.DataFrame: New DataFrame with the schema dtypes
+    """
+    if schema is None:
+        schema = clean_schema()
+
+    typed = {}
+    for col, dtype in schema.items():
+        if col not in df.columns:
+            typed[col] = pd.Series(pd.NA, index=df.index, dtype=dtype)
+            continue
+
+        values = df[col]
+        if col in YEAR_COLUMNS:
+            years = pd.to_numeric(values, errors="coerce")
+            # Fractions and numbers outside of the Int16 range are not years either
+            limits = np.iinfo(dtype.numpy_dtype)
+            valid = (years % 1 == 0) & years.between(limits.min, limits.max)
+            typed[col] = years.where(valid.fillna(False).astype(bool)).astype(dtype)
+        elif isinstance(dtype, pd.CategoricalDtype):
+            # Labels missing from the tag lists would silently become NA, keep them
+            values = values.astype(_string_dtype())
+            extra = sorted(set(values.dropna()) - set(dtype.categories))
+            typed[col] = values.astype(
+                pd.CategoricalDtype(list(dtype.categories) + extra)
+            )
+        else:
+            typed[col] = values.astype(dtype)
+
+    extra_columns = [col for col in df.columns if col not in schema]
+    result = pd.DataFrame(typed, index=df.index)
+    for col in extra_columns:
+        result[col] = df[col]
+    return result
+
+
+def save_clean_data(clean_data, dataset_names, folder_path):
+    """
+    Save cleaned museum tables as CSV files after enforcing the schema.
+
+    Parameters:
+    clean_data (list): List of cleaned DataFrames
+    dataset_names (list): Names used as file names, in the same order
+    folder_path (str): Output folder
+    """
+    schema = clean_schema()
+    for dataset, name in zip(clean_data, dataset_names):
+        file_name = os.path.join(folder_path, f"{name}.csv")
+        enforce_schema(dataset, schema)[CLEAN_COLUMNS].to_csv(file_name, index=False)
+        print(f"Saved {file_name}")
@@ -1,11 +1,82 @@
+from functools import lru_cache
 import pandas as pd
+from cleaning_scripts.instrumentation import instrumented
 from cleaning_scripts.load_tags import (
     load_medium_tags,
     load_nationality_tags,
     load_acquisition_tags,
 )
-
-
+from cleaning_scripts.distinct_values import map_distinct
+from cleaning_scripts.tag_matcher import TagClassifier
+
+ARTIST_NAME_COLUMNS = [
+    "artist",
+    "author",
+    "artist_name",
+    "Artist Display Name",
+    "artist name",
+    "Artist Display Name",
+    "Artist",
+    "artists",
+    "forwarddisplayname",
+    "production_0_creator",
+    "display_name",
+    "artist_0",
+]
+
+TITLE_COLUMNS = [
+    "object_title",
+    "artwork_name",
+    "Title",
+    "url",
+    "name",
+    "title",
+    "title_fi",
+    "titles_0_title",
+]
+
+MEDIUM_COLUMNS = [
+    "Medium",
+    "type_artwork",
+    "medium",
+    "object_type",
+    "Classification",
+    "classification",
+    "classifications_0_en",
+    "object_names_1_name",
+    "PhysicalCategory",
+]
+
+NATIONALITY_COLUMNS = [
+    "Country",
+    "Artist Nationality",
+    "nationality_artist",
+    "artist_nationality",
+    "Nationality",
+    "nationality",
+    "production_0_creator_nationality",
+]
+
+ACQUISITION_METHOD_COLUMNS = [
+    "Credit Line",
+    "creditLine",
+    "acquisition_type",
+    "CreditLine",
+    "credit_line",
+    "creditline",
+    "CreditLine",
+]
+
+GENDER_COLUMNS = [
+    "Artist Gender",
+    "gender",
+    "artist_gender",
+    "Gender",
+    "production_0_creator_gender",
+]
+
+
+@instrumented(output="Artist")
 def create_artist_name_col(df):
     """
     The function creates a new column with Artist name based on the original column across several datasets
@@ -17,20 +88,7 @@ def create_artist_name_col(df):
         pandas.DataFrame: DataFrame with standardized Artist column
     """
     # List of possible column names for the artist name
-    possible_columns = [
-        "artist",
-        "author",
-        "artist_name",
-        "Artist Display Name",
-        "artist name",
-        "Artist Display Name",
-        "Artist",
-        "artists",
-        "forwarddisplayname",
-        "production_0_creator",
-        "display_name",
-        "artist_0",
-    ]
+    possible_columns = ARTIST_NAME_COLUMNS
 
     found_artist = False
 
@@ -49,18 +107,10 @@ def create_artist_name_col(df):
     return df
 
 
+@instrumented(output="Title")
 def create_artwork_title(df):
     # List of possible column names for the artist name
-    possible_columns = [
-        "object_title",
-        "artwork_name",
-        "Title",
-        "url",
-        "name",
-        "title",
-        "title_fi",
-        "titles_0_title",
-    ]
+    possible_columns = TITLE_COLUMNS
     found_artist = False
     # Loop over the possible column names and use the first one that exists
     for col in possible_columns:
@@ -76,191 +126,148 @@ def create_artwork_title(df):
     return df
 
 
-def classify_medium(df):
+# Tag lists of the classifiers in load_tags, compiled once per process by tag_classifier
+TAG_LOADERS = {
+    "medium": load_medium_tags,
+    "nationality": load_nationality_tags,
+    "acquisition": load_acquisition_tags,
+}
+
+
+@lru_cache(maxsize=None)
+def tag_classifier(name):
+    """TagClassifier of one tag list of TAG_LOADERS, built once per process."""
+    tags, names = TAG_LOADERS[name]()
+    return TagClassifier(tags, names)
+
+
+def classify_tags(
+    df, possible_columns, raw_column, new_column, tags, label, prepare=None, name=None
+):
     """
-    Classifies artwork medium based on predefined columns and tags.
+    Classify the first column of possible_columns found in df with a tag list.
 
     Args:
-        df (pandas.DataFrame): Input DataFrame containing artwork data
+        df (pandas.DataFrame): Input DataFrame
+        possible_columns (list): Candidate source columns in priority order
+        raw_column (str): Column for the lowercased (and prepared) source values
+        new_column (str): Column for the categorical labels
+        tags (str): Key of TAG_LOADERS
+        label (str): Name of the data in the printed statistics, e.g. "Nationality data"
+        prepare (callable): Optional transformation of the lowercased source column
+        name (str): Name in the map_distinct statistics
 
     Returns:
-        pandas.DataFrame: DataFrame with added Medium_raw and Medium_classified columns
+        pandas.DataFrame: DataFrame with added raw_column and new_column columns
     """
-    # Load medium tags
-    medium_tags, medium_name = load_medium_tags()
-
-    # iterate over columns to find medium data
-    possible_columns = [
-        "Medium",
-        "type_artwork",
-        "medium",
-        "object_type",
-        "Classification",
-        "classification",
-        "classifications_0_en",
-        "object_names_1_name",
-        "PhysicalCategory",
-    ]
-
-    # create Medium_raw and fill it with original data
-    df["Medium_raw"] = pd.NA
-    df["Medium_classified"] = pd.NA
+    classifier = tag_classifier(tags)
 
-    found_column = False
-    for col in possible_columns:
-        if col in df.columns:
-            df["Medium_raw"] = df[col].str.lower()  # Fixed typo here
-            print(f"Data found in column: {col}")
-            found_column = True
-
-            # Calculate statistics
-            count_nans = df["Medium_raw"].notna().sum()
-            total_rows = len(df)
-            coverage_percent = (count_nans / total_rows) * 100
-            print(
-                f"Number of variables in the original column: {count_nans} out of {total_rows} ({coverage_percent:.1f}%)"
-            )
-            break  # Exit loop once we find the first match
+    # Initialize new columns
+    df[raw_column] = pd.NA
+    df[new_column] = pd.Series(pd.NA, index=df.index, dtype=classifier.dtype)
 
-    if not found_column:
-        print("Data is not found in any expected columns")
+    # Find the first matching column
+    col = next((col for col in possible_columns if col in df.columns), None)
+    if col is None:
+        print(f"{label} not found in any expected columns")
         return df
 
-    # Only proceed with classification if we found data
-    if found_column:
-        # Iterate over each row in the DataFrame
-        for idx, row in df.iterrows():
-            medium = row["Medium_raw"]
-
-            # Skip if the medium value is not a string
-            if not isinstance(medium, str):
-                continue
-
-            # Check each tag group
-            for i, tag_group in enumerate(medium_tags):
-                # Check if any keyword from the tag group exists in the medium
-                if any(tag.lower() in medium.lower() for tag in tag_group):
-                    # Assign the corresponding medium name
-                    df.at[idx, "Medium_classified"] = medium_name[i]
-                    break  # Stop once we find a match
-
-        # Calculate statistics after cleaning
-        count_nans = df["Medium_classified"].notna().sum()
-        total_rows = len(df)
-        coverage_percent = (count_nans / total_rows) * 100
-        print(
-            f"Number of cleaned variables: {count_nans} out of {total_rows} ({coverage_percent:.1f}%)"
-        )
-        print("----------------------------------")
-
-        # Show a sample of the results
-        print("\nSample of results:")
-        print(df[["Medium_raw", "Medium_classified"]].head())
+    print(f"{label} found in column: {col}")
+    raw = df[col].str.lower()
+    if prepare is not None:
+        raw = prepare(raw)
+    df[raw_column] = raw
+
+    # Calculate initial statistics
+    count_nans = df[raw_column].notna().sum()
+    total_rows = len(df)
+    coverage_percent = (count_nans / total_rows) * 100
+    print(
+        f"Number of variables in the original column: {count_nans} out of {total_rows} ({coverage_percent:.1f}%)"
+    )
+
+    # Every distinct value is classified once
+    df[new_column] = classifier.classify(df[raw_column], name=name)
+
+    # Calculate final statistics
+    stats = classifier.stats
+    print(
+        f"Number of classified variables: {stats['matched']} out of {stats['rows']} ({stats['coverage']:.1f}%)"
+    )
+    print(
+        f"Distinct values: {stats['distinct']}, equal to a tag: {stats['distinct_index']}, "
+        f"containing a tag: {stats['distinct_substring']}"
+    )
+
+    # Show sample of results
+    print("\nSample of classification results:")
+    print(df[[raw_column, new_column]].head())
+    print("----------------------------------")
 
     return df
 
 
-def create_artist_nationality(df):
+@instrumented(output="Medium_classified")
+def classify_medium(df):
     """
-    Classifies artist nationality based on predefined columns and nationality tags.
+    Classifies artwork medium based on predefined columns and tags.
 
     Args:
-        df (pandas.DataFrame): Input DataFrame containing artist data
+        df (pandas.DataFrame): Input DataFrame containing artwork data
 
     Returns:
-        pandas.DataFrame: DataFrame with added nationality_raw and Country_calculated columns
+        pandas.DataFrame: DataFrame with added Medium_raw and Medium_classified columns
     """
-    # Load nationality tags
-    nationality_tags, country_name = load_nationality_tags()
-
-    # Define possible columns for nationality information
-    possible_columns = [
-        "Country",
-        "Artist Nationality",
-        "nationality_artist",
-        "artist_nationality",
-        "Nationality",
-        "nationality",
-        "production_0_creator_nationality",
-    ]
-
-    # Initialize new columns
-    df["nationality_raw"] = pd.NA
-    df["Country_calculated"] = pd.NA
-
-    # Find and process the first matching column
-    found_column = False
-    for col in possible_columns:
-        if col in df.columns:
-            print(f"Nationality data found in column: {col}")
-
-            # Process the nationality string: lowercase, remove 'the', parentheses,
-            # take first word, and strip commas
-            df["nationality_raw"] = (
-                df[col]
-                .str.lower()
-                .str.strip("the")
-                .str.replace("(", "")
-                .str.replace(")", "")
-                .str.split(" ")
-                .str[0]
-                .str.strip(",")
-            )
-
-            # Calculate initial statistics
-            count_nans = df["nationality_raw"].notna().sum()
-            total_rows = len(df)
-            coverage_percent = (count_nans / total_rows) * 100
-            print(
-                f"Number of variables in the original column: {count_nans} out of {total_rows} ({coverage_percent:.1f}%)"
-            )
+    return classify_tags(
+        df,
+        MEDIUM_COLUMNS,
+        "Medium_raw",
+        "Medium_classified",
+        "medium",
+        label="Medium data",
+        name="classify_medium",
+    )
 
-            found_column = True
-            break
 
-    if not found_column:
-        print("Nationality data not found in any expected columns")
-        return df
+def nationality_token(values):
+    """
+    Reduce lowercased nationality strings to one token: remove 'the', parentheses,
+    take first word, and strip commas.
+    """
+    return (
+        values.str.strip("the")
+        .str.replace("(", "")
+        .str.replace(")", "")
+        # Text before the first space, kept as text even if every value is missing
+        .str.replace(r"(?s) .*", "", regex=True)
+        .str.strip(",")
+    )
 
-    # Only proceed with classification if we found data
-    if found_column:
-        # Counter for matches
-        match_count = 0
-
-        # Iterate over each row in the DataFrame
-        for idx, row in df.iterrows():
-            nationality = row["nationality_raw"]
-
-            # Skip if the nationality value is not a string
-            if not isinstance(nationality, str):
-                continue
-
-            # Check each tag group
-            for i, tag_group in enumerate(nationality_tags):
-                # Check if any keyword from the tag group matches the nationality
-                if any(tag.lower() in nationality.lower() for tag in tag_group):
-                    # Assign the corresponding country name
-                    df.at[idx, "Country_calculated"] = country_name[i]
-                    match_count += 1
-                    break  # Stop once we find a match
 
-        # Calculate final statistics
-        count_nans = df["Country_calculated"].notna().sum()
-        total_rows = len(df)
-        coverage_percent = (count_nans / total_rows) * 100
-        print(f"\nMatches found: {match_count}")
-        print(
-            f"Number of classified nationalities: {count_nans} out of {total_rows} ({coverage_percent:.1f}%)"
-        )
+@instrumented(output="Country_calculated")
+def create_artist_nationality(df):
+    """
+    Classifies artist nationality based on predefined columns and nationality tags.
 
-        # Show sample of results
-        print("\nSample of classification results:")
-        print(df[["nationality_raw", "Country_calculated"]].head())
-        print("----------------------------------")
+    Args:
+        df (pandas.DataFrame): Input DataFrame containing artist data
 
-    return df
+    Returns:
+        pandas.DataFrame: DataFrame with added nationality_raw and Country_calculated columns
+    """
+    return classify_tags(
+        df,
+        NATIONALITY_COLUMNS,
+        "nationality_raw",
+        "Country_calculated",
+        "nationality",
+        label="Nationality data",
+        prepare=nationality_token,
+        name="create_artist_nationality",
+    )
 
 
+@instrumented(output="Acquisition_classified")
 def create_acquisition_method(df):
     """
     Classifies artwork acquisition methods based on credit line information.
@@ -271,87 +278,18 @@ def create_acquisition_method(df):
     Returns:
         pandas.DataFrame: DataFrame with added acquisition_raw and Acquisition_classified columns
     """
-    # Load acquisition tags
-    acquisition_tags, acquisition_methods = load_acquisition_tags()
-
-    # Define possible columns for acquisition information
-    possible_columns = [
-        "Credit Line",
-        "creditLine",
-        "acquisition_type",
-        "CreditLine",
-        "credit_line",
-        "creditline",
-        "CreditLine",
-    ]
-
-    # Initialize new columns
-    df["acquisition_raw"] = pd.NA
-    df["Acquisition_classified"] = pd.NA  # Fixed typo in column name
-
-    # Find and process the first matching column
-    found_column = False
-    for col in possible_columns:
-        if col in df.columns:
-            print(f"Acquisition data found in column: {col}")
-
-            # Process the acquisition string: lowercase
-            df["acquisition_raw"] = df[col].str.lower()
-
-            # Calculate initial statistics
-            count_nans = df["acquisition_raw"].notna().sum()
-            total_rows = len(df)
-            coverage_percent = (count_nans / total_rows) * 100
-            print(
-                f"Number of variables in the original column: {count_nans} out of {total_rows} ({coverage_percent:.1f}%)"
-            )
-
-            found_column = True
-            break
-
-    if not found_column:
-        print("Acquisition data not found in any expected columns")
-        return df
-
-    # Only proceed with classification if we found data
-    if found_column:
-        # Counter for matches
-        match_count = 0
-
-        # Iterate over each row in the DataFrame
-        for idx, row in df.iterrows():
-            acquisition = row["acquisition_raw"]
-
-            # Skip if the acquisition value is not a string
-            if not isinstance(acquisition, str):
-                continue
-
-            # Check each tag group
-            for i, tag_group in enumerate(acquisition_tags):
-                # Check if any keyword from the tag group matches the acquisition text
-                if any(tag.lower() in acquisition.lower() for tag in tag_group):
-                    # Assign the corresponding acquisition method
-                    df.at[idx, "Acquisition_classified"] = acquisition_methods[i]
-                    match_count += 1
-                    break  # Stop once we find a match
-
-        # Calculate final statistics
-        count_nans = df["Acquisition_classified"].notna().sum()
-        total_rows = len(df)
-        coverage_percent = (count_nans / total_rows) * 100
-        print(f"\nMatches found: {match_count}")
-        print(
-            f"Number of classified acquisition methods: {count_nans} out of {total_rows} ({coverage_percent:.1f}%)"
-        )
-
-        # Show sample of results
-        print("\nSample of classification results:")
-        print(df[["acquisition_raw", "Acquisition_classified"]].head())
-        print("----------------------------------")
-
-    return df
-
-
+    return classify_tags(
+        df,
+        ACQUISITION_METHOD_COLUMNS,
+        "acquisition_raw",
+        "Acquisition_classified",
+        "acquisition",
+        label="Acquisition data",
+        name="create_acquisition_method",
+    )
+
+
+@instrumented(output="Gender_classified")
 def create_artist_gender(df):
     """
     Classifies artist gender based on predefined columns and gender mapping.
@@ -363,13 +301,7 @@ def create_artist_gender(df):
         pandas.DataFrame: DataFrame with added Gender_raw and Gender_classified columns
     """
     # Define possible columns for gender information
-    possible_columns = [
-        "Artist Gender",
-        "gender",
-        "artist_gender",
-        "Gender",
-        "production_0_creator_gender",
-    ]
+    possible_columns = GENDER_COLUMNS
 
     # Define gender mapping dictionary
     gender_dict = {"female": ["female", "woman"], "male": ["male", "man"]}
@@ -430,7 +362,7 @@ def create_artist_gender(df):
                 return "male"
             return x
 
-        df["Gender_classified"] = df["Gender_classified"].apply(classify_gender)
+        df["Gender_classified"] = map_distinct(df["Gender_classified"], classify_gender)
 
         # Calculate final statistics
         count_nans = df["Gender_classified"].notna().sum()
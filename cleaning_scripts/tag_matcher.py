@@ -0,0 +1,157 @@
+from collections import deque
+import pandas as pd
+from cleaning_scripts.distinct_values import map_distinct
+
+
+class TagMatcher:
+    """
+    Aho–Corasick automaton over prioritised groups of tags.
+
+    All tags are compiled into one trie with failure links, so a text is scanned
+    once, character by character, whatever the number of tags. match() returns
+    the first group (in list order) with a tag contained in the text, the same
+    result as checking the groups in order with tag.lower() in text.lower().
+
+    Attributes:
+        labels: label of every tag group, e.g. the medium names
+    """
+
+    def __init__(self, tag_groups, labels):
+        self.labels = list(labels)
+        no_match = len(self.labels)
+
+        # State 0 is the root, every state has its transitions, failure link and
+        # the best (lowest) group of the tags ending in it
+        self._goto = [{}]
+        self._fail = [0]
+        self._best = [no_match]
+
+        for group, tags in enumerate(tag_groups):
+            for tag in tags:
+                state = 0
+                for char in tag.lower():
+                    next_state = self._goto[state].get(char)
+                    if next_state is None:
+                        next_state = len(self._goto)
+                        self._goto[state][char] = next_state
+                        self._goto.append({})
+                        self._fail.append(0)
+                        self._best.append(no_match)
+                    state = next_state
+                self._best[state] = min(self._best[state], group)
+
+        # Breadth first, so the failure state of a node is finished before the node
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                if state and char in self._goto[fail]:
+                    self._fail[next_state] = self._goto[fail][char]
+                # Tags ending in the failure state end here as well
+                self._best[next_state] = min(
+                    self._best[next_state], self._best[self._fail[next_state]]
+                )
+
+    def match_group(self, text):
+        """Index of the first group with a tag in text, None if there is none."""
+        goto, fail, best_of = self._goto, self._fail, self._best
+        # An empty tag is contained in every text
+        best = best_of[0]
+        state = 0
+        for char in text.lower():
+            if best == 0:
+                break
+            while True:
+                next_state = goto[state].get(char)
+                if next_state is not None:
+                    state = next_state
+                    break
+                if state == 0:
+                    break
+                state = fail[state]
+            if best_of[state] < best:
+                best = best_of[state]
+        return best if best < len(self.labels) else None
+
+    def match(self, text):
+        """Label of the first group with a tag in text, None if there is none."""
+        group = self.match_group(text)
+        return None if group is None else self.labels[group]
+
+
+class TagClassifier:
+    """
+    Classifier of text columns with prioritised tag groups, e.g. the (tags, names)
+    pairs of load_tags, compiled once and reused for every museum.
+
+    Distinct values equal to a tag are looked up in a token index, the others are
+    scanned once by the TagMatcher automaton. Both give the label of the first
+    tag group with a tag contained in the value.
+
+    Attributes:
+        dtype: categorical dtype of the labels, in tag list order
+        index: dict lowercase tag -> label
+        matcher: TagMatcher of all tags
+        stats: match statistics of the last classify call
+    """
+
+    def __init__(self, tag_groups, labels):
+        self.matcher = TagMatcher(tag_groups, labels)
+        # A tag can contain a tag of an earlier group, so tags are classified as well
+        self.index = {
+            tag.lower(): self.matcher.match(tag) for tags in tag_groups for tag in tags
+        }
+        # Tag lists may repeat a label, categories have to be unique
+        self.dtype = pd.CategoricalDtype(list(dict.fromkeys(labels)))
+        self.stats = {}
+
+    def _classify_distinct(self, values):
+        # Skip values that are not strings
+        is_text = values.map(lambda value: isinstance(value, str)).astype(bool)
+        keys = values[is_text].str.lower()
+
+        labels = keys.map(self.index).astype(object)
+        from_index = labels.notna()
+        labels[~from_index] = keys[~from_index].map(self.matcher.match).astype(object)
+
+        self.stats["distinct"] = len(values)
+        self.stats["distinct_index"] = int(from_index.sum())
+        self.stats["distinct_substring"] = int(labels.notna().sum() - from_index.sum())
+        labels = labels.reindex(values.index)
+        return labels.where(labels.notna(), pd.NA)
+
+    def classify(self, values, name=None):
+        """
+        Classify a column, every distinct value once.
+
+        Parameters:
+        values (pandas.Series): Text column
+        name (str): Name in the map_distinct statistics, e.g. "classify_medium"
+
+        Returns:
+        pandas.Series: Categorical labels with the index of values, NA where no tag matches.
+            The match statistics (rows, text, matched, coverage in %, distinct values,
+            distinct values found in the token index / by substring) are in stats.
+        """
+        self.stats = {}
+        labels = map_distinct(
+            values,
+            self._classify_distinct,
+            name=name or "TagClassifier",
+            vectorized=True,
+        )
+        labels = labels.astype(self.dtype)
+
+        rows = len(values)
+        matched = int(labels.notna().sum())
+        self.stats.update(
+            rows=rows,
+            text=int(values.notna().sum()),
+            matched=matched,
+            coverage=(matched / rows) * 100 if rows else 0.0,
+        )
+        return labels
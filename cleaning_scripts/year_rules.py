@@ -0,0 +1,165 @@
+import json
+import re
+from functools import lru_cache
+import pandas as pd
+from cleaning_scripts.instrumentation import instrumented
+from cleaning_scripts.extract_first_number import extract_first_number_series
+
+# Keys of a year rule, see the "year_rules" of the datasets in datasets.json:
+#   target        column to fill, e.g. "Year_acquisition"
+#   when_present  only rows where this column has data and target is NA are filled
+#   source        column the year is extracted from
+#   method        "first_number" (extract_first_number) or "patterns" (default)
+#   patterns      regexes with one capture group (no numbered backreferences),
+#                 the first pattern that matches wins
+#   lower, strip, split   text preparation: lowercase, str.strip with every character
+#                 set in order (null strips whitespace), keep the text before split
+#   century       prefix of 2-digit years, e.g. "19" for "93" -> 1993
+#   max_year      larger years are replaced with NA
+#   label         museum name in the printed summary
+RULE_METHODS = ("patterns", "first_number")
+
+
+def combine_patterns(patterns):
+    """
+    Combine prioritised patterns into one regex, evaluated in a single scan per value.
+
+    A plain alternation would prefer the leftmost match of any pattern. Here every
+    pattern is a lookahead from the start of the value, tried in order, so the first
+    pattern that matches anywhere wins and captures the same text as re.search.
+    Group i of the combined regex is the capture group of pattern i.
+    """
+    alternatives = [f"(?=[\\s\\S]*?(?:{pattern}))" for pattern in patterns]
+    return re.compile(r"\A(?:" + "|".join(alternatives) + ")")
+
+
+def compile_year_rule(rule):
+    """
+    Validate a year rule and compile its patterns.
+    Raises ValueError for unknown methods or patterns without exactly one capture group.
+    """
+    rule = dict(rule)
+    for key in ("target", "when_present", "source"):
+        if key not in rule:
+            raise ValueError(f"Year rule is missing '{key}': {rule}")
+
+    rule.setdefault("method", "patterns")
+    if rule["method"] not in RULE_METHODS:
+        raise ValueError(
+            f"Unknown year rule method {rule['method']}, expected any of {RULE_METHODS}"
+        )
+
+    patterns = rule.get("patterns", [])
+    for pattern in patterns:
+        if re.compile(pattern).groups != 1:
+            raise ValueError(f"Pattern {pattern} must have exactly one capture group")
+    if rule["method"] == "patterns" and not patterns:
+        raise ValueError(f"Year rule without patterns: {rule}")
+
+    # Single pattern rules keep their own regex
+    if len(patterns) == 1:
+        rule["regex"] = re.compile(patterns[0])
+    elif patterns:
+        rule["regex"] = combine_patterns(patterns)
+    return rule
+
+
+@lru_cache(maxsize=None)
+def _compile_rules(rules_json):
+    return [compile_year_rule(rule) for rule in json.loads(rules_json)]
+
+
+def compile_year_rules(rules):
+    """Compile a list of year rules, identical rule lists are compiled only once."""
+    return _compile_rules(json.dumps(rules, sort_keys=True))
+
+
+def _prepare_text(values, rule):
+    text = values.astype(str)
+    if rule.get("lower"):
+        text = text.str.lower()
+    for chars in rule.get("strip", []):
+        text = text.str.strip(chars)
+    if rule.get("split"):
+        text = text.str.split(rule["split"], regex=False).str[0]
+    return text
+
+
+def extract_rule_years(values, rule):
+    """
+    Extract years from a column with one compiled year rule.
+
+    Parameters:
+    values (pandas.Series): Source column
+    rule (dict): Rule from compile_year_rule
+
+    Returns:
+    pandas.Series: Int64 years with the index of values
+    """
+    if rule["method"] == "first_number":
+        return extract_first_number_series(values)
+
+    text = _prepare_text(values.dropna(), rule)
+
+    # One column per pattern, only the group of the winning pattern is set
+    found = text.str.extract(rule["regex"], expand=True)
+    years = found.iloc[:, 0]
+    for col in found.columns[1:]:
+        years = years.fillna(found[col])
+    years = years.astype("string")
+
+    if rule.get("century"):
+        short = years.str.len() == 2
+        years = years.where(~short.fillna(False), rule["century"] + years)
+
+    years = pd.to_numeric(years, errors="coerce").astype("Int64")
+    if rule.get("max_year") is not None:
+        years = years.where((years <= rule["max_year"]).fillna(True))
+    return years.reindex(values.index)
+
+
+@instrumented()
+def apply_year_rules(df, rules):
+    """
+    Fill missing years of a dataset with its year rules, in one pass over the rules.
+    Filled rows get the rule source in 'source_column'.
+
+    Parameters:
+    df (pandas.DataFrame): Dataset after clean_acquisition_year / artwork_creation_date
+    rules (list): Year rules of the dataset, see the rule keys at the top of this module
+
+    Returns:
+    pandas.DataFrame: The same DataFrame with the filled years
+    """
+    for rule in compile_year_rules(rules):
+        target = rule["target"]
+
+        # Create mask for problematic rows
+        mask = (df[rule["when_present"]].notna()) & (df[target].isna())
+
+        # Only the problematic rows are parsed
+        df.loc[mask, target] = extract_rule_years(df.loc[mask, rule["source"]], rule)
+
+        # mark changes
+        df.loc[mask, "source_column"] = rule["source"]
+
+        # Print summary of improvements
+        total_fixed = mask.sum() - df[mask][target].isna().sum()
+        print(f"Fixed {total_fixed} out of {mask.sum()} problematic rows")
+        count_nans = df[target].notna().sum()
+        total_rows = len(df)
+        coverage_percent = (count_nans / total_rows) * 100
+
+        print(
+            f"{rule.get('label', rule['source'])} - Number of cleaned variables: {count_nans} out of {total_rows} ({coverage_percent:.1f}%)"
+        )
+        print("---------------------------------------")
+    return df
+
+
+def museum_year_rules(name, step, config_path=None):
+    """Return the year rules of one dataset for a pipeline step ("acquisition" or "production")."""
+    from cleaning_scripts.dataset_registry import DEFAULT_REGISTRY, load_registry
+
+    registry = load_registry(config_path or DEFAULT_REGISTRY)
+    return registry[name].get("year_rules", {}).get(step, [])
@@ -0,0 +1,139 @@
+import json
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+# Schema metadata key holding the row range of every museum
+OFFSETS_KEY = b"museum_offsets"
+
+
+def build_collection_table(museum_data, museum_names):
+    """
+    Combine per-museum DataFrames into one long DataFrame
+    with a categorical 'museum' column, rows grouped by museum.
+
+    Parameters:
+        museum_data: a list of pandas dataframes
+        museum_names: a list of strings with museum names from museum_data
+    Returns:
+        pandas.DataFrame: all museums stacked, in the order of museum_names
+    """
+    if len(museum_data) != len(museum_names):
+        raise ValueError("The number of datasets must match the number of names.")
+
+    frames = [df.copy() for df in museum_data]
+
+    # Categorical columns with different categories (e.g. extra gender values)
+    # would fall back to object on concat, align them first
+    for col in frames[0].columns if frames else []:
+        values = [df[col] for df in frames if col in df.columns]
+        if all(isinstance(v.dtype, pd.CategoricalDtype) for v in values):
+            categories = union_categoricals(
+                [v.array for v in values], ignore_order=True
+            ).categories
+            for df in frames:
+                if col in df.columns:
+                    df[col] = df[col].cat.set_categories(categories)
+
+    for df, name in zip(frames, museum_names):
+        df["museum"] = pd.Categorical([name] * len(df), categories=museum_names)
+
+    return pd.concat(frames, ignore_index=True)
+
+
+def write_collection_table(museum_data, museum_names, path):
+    """
+    Store all museums as one uncompressed Feather (Arrow IPC) file,
+    so it can be memory-mapped on open. The museum column is dictionary encoded
+    and the row range of every museum is kept in the schema metadata.
+    """
+    import pyarrow as pa
+    import pyarrow.feather as feather
+
+    collection = build_collection_table(museum_data, museum_names)
+
+    offsets = {}
+    start = 0
+    for df, name in zip(museum_data, museum_names):
+        offsets[name] = [start, len(df)]
+        start += len(df)
+
+    table = pa.Table.from_pandas(collection, preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata[OFFSETS_KEY] = json.dumps(offsets).encode("utf-8")
+    table = table.replace_schema_metadata(metadata)
+
+    feather.write_feather(table, path, compression="uncompressed")
+
+
+def open_collection_table(path):
+    """
+    Open a collection table written by write_collection_table.
+    The file is memory-mapped, columns are only paged in when they are used.
+
+    Returns:
+        pyarrow.Table
+    """
+    import pyarrow as pa
+
+    source = pa.memory_map(path, "r")
+    return pa.ipc.open_file(source).read_all()
+
+
+def museum_offsets(table):
+    """Return {museum name: (first row, number of rows)} of a collection table."""
+    offsets = json.loads(table.schema.metadata[OFFSETS_KEY])
+    return {name: tuple(value) for name, value in offsets.items()}
+
+
+def museum_slice(table, museum_name):
+    """Zero-copy Arrow slice with the rows of one museum."""
+    start, length = museum_offsets(table)[museum_name]
+    return table.slice(start, length)
+
+
+def load_collection(path, columns=None):
+    """
+    Backward compatible loader: returns the same (museum_data, museum_names)
+    lists as load_data, built from slices of the memory-mapped collection table.
+
+    Parameters:
+        path: Feather file written by write_collection_table
+        columns: optional list of columns to convert to pandas
+    Returns:
+        museum_data: a list of pandas dataframes
+        museum_names: a list of strings with museum names from museum_data
+    """
+    table = open_collection_table(path)
+    if columns is not None:
+        table = table.select(list(columns))
+
+    museum_data = []
+    museum_names = []
+    for name in museum_offsets(table):
+        df = museum_slice(table, name).to_pandas()
+        museum_data.append(df.drop(columns="museum", errors="ignore"))
+        museum_names.append(name)
+    return museum_data, museum_names
+
+
+def collection_counts(collection, by, min_year=None, year_column="Date_creation_year"):
+    """
+    Count artworks per museum and category in one grouped pass over the
+    whole collection, instead of one groupby per museum.
+
+    Parameters:
+        collection: long DataFrame from build_collection_table or open_collection_table(...).to_pandas()
+        by: column (or list of columns) to count, e.g. "Medium_classified"
+        min_year: optional minimum of year_column
+        year_column: column the min_year filter applies to
+    Returns:
+        pandas.DataFrame: museum, by columns and Count
+    """
+    if min_year is not None:
+        collection = collection[collection[year_column] >= min_year]
+    by = [by] if isinstance(by, str) else list(by)
+    return (
+        collection.groupby(["museum"] + by, observed=True)
+        .size()
+        .reset_index(name="Count")
+    )
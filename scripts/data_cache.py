@@ -0,0 +1,198 @@
+import hashlib
+import json
+import os
+import pandas as pd
+
+CACHE_DIR_NAME = ".cache"
+
+# Rows per Parquet row group, each group keeps min/max statistics per column
+ROW_GROUP_SIZE = 10000
+
+_FILTER_OPERATORS = {
+    "==": lambda col, value: col == value,
+    "=": lambda col, value: col == value,
+    "!=": lambda col, value: col != value,
+    "<": lambda col, value: col < value,
+    "<=": lambda col, value: col <= value,
+    ">": lambda col, value: col > value,
+    ">=": lambda col, value: col >= value,
+    "in": lambda col, value: col.isin(value),
+    "not in": lambda col, value: ~col.isin(value),
+}
+
+# Like pyarrow, missing values never match a comparison, but are "not in" any list
+_COMPARISONS = ("==", "=", "!=", "<", "<=", ">", ">=")
+
+
+def file_content_hash(file_path, chunk_size=1 << 20):
+    """Return the sha256 hex digest of a file, read in fixed-size chunks."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as file:
+        for chunk in iter(lambda: file.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _normalize_filters(filters):
+    # A flat list of predicates is one AND group, a list of lists is an OR of AND groups
+    if not filters:
+        return None
+    if isinstance(filters[0], tuple):
+        return [list(filters)]
+    return [list(group) for group in filters]
+
+
+def filter_frame(df, filters):
+    """
+    Apply predicates to a DataFrame in memory, with the same semantics as the
+    Parquet filters: [("Date_creation_year", ">=", 1860), ...] or a list of such lists (OR).
+    Rows with missing values never match a comparison (also not "!="), and the
+    result gets a fresh index, like a filtered Parquet read.
+    """
+    groups = _normalize_filters(filters)
+    if groups is None:
+        return df
+
+    keep = pd.Series(False, index=df.index)
+    for group in groups:
+        group_mask = pd.Series(True, index=df.index)
+        for column, operator, value in group:
+            if operator not in _FILTER_OPERATORS:
+                raise ValueError(f"Unsupported filter operator: {operator}")
+            mask = _FILTER_OPERATORS[operator](df[column], value)
+            mask = mask.fillna(False).astype(bool)
+            if operator in _COMPARISONS:
+                mask &= df[column].notna()
+            group_mask &= mask
+        keep |= group_mask
+    return df[keep].reset_index(drop=True)
+
+
+def _read_cached(cache_path, filters):
+    import pyarrow as pa
+
+    # Row groups whose statistics cannot match the filters are skipped without decoding
+    try:
+        return pd.read_parquet(cache_path, filters=_normalize_filters(filters))
+    except pa.ArrowException:
+        # Columns without any value are stored as double, comparing them with a
+        # string has no Arrow kernel: filter in pandas like on the cold path
+        return filter_frame(pd.read_parquet(cache_path), filters)
+
+
+def _options_key(read_options):
+    # read_csv options change the parsed frame, so they are part of the cache key
+    options = json.dumps(read_options, sort_keys=True, default=str)
+    return hashlib.sha256(options.encode("utf-8")).hexdigest()[:8]
+
+
+def _load_manifest(manifest_path):
+    if not os.path.exists(manifest_path):
+        return None
+    try:
+        with open(manifest_path, "r") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_atomic(write_function, target_path):
+    # write next to the target first so that an interrupted run never leaves a broken cache entry
+    tmp_path = f"{target_path}.tmp"
+    write_function(tmp_path)
+    os.replace(tmp_path, target_path)
+
+
+def cached_read_csv(file_path, cache_dir=None, filters=None, **read_options):
+    """
+    Read a CSV file through a content-addressed Parquet cache.
+
+    The first call parses the CSV and stores the frame as Parquet next to a small
+    manifest with the source size, mtime and sha256. Later calls with an unchanged
+    source load the Parquet file and skip text parsing and dtype inference.
+    A changed source gets a new content hash and its cache entry is rebuilt.
+
+    Parameters:
+    file_path (str): Path to the CSV file
+    cache_dir (str): Folder for cache files, defaults to '.cache' next to the CSV
+    filters (list): Optional predicates like [("Date_creation_year", ">=", 1860)],
+        evaluated at scan time with the row group statistics of the Parquet file
+    **read_options: Extra keyword arguments passed to pd.read_csv
+
+    Returns:
+    pandas.DataFrame: Parsed data
+    """
+    if cache_dir is None:
+        cache_dir = os.path.join(os.path.dirname(file_path), CACHE_DIR_NAME)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+    except OSError as e:
+        # e.g. a read-only data folder, read without the cache
+        print(f"Could not cache {file_path}: {str(e)}")
+        return filter_frame(pd.read_csv(file_path, **read_options), filters)
+
+    stem = os.path.splitext(os.path.basename(file_path))[0]
+    manifest_path = os.path.join(cache_dir, f"{stem}.json")
+    manifest = _load_manifest(manifest_path)
+    options_key = _options_key(read_options)
+    stat = os.stat(file_path)
+
+    # Fast path: size and mtime unchanged, no need to hash the file
+    if (
+        manifest is not None
+        and manifest.get("size") == stat.st_size
+        and manifest.get("mtime_ns") == stat.st_mtime_ns
+        and manifest.get("options_key") == options_key
+    ):
+        cache_path = os.path.join(cache_dir, manifest["cache_file"])
+        if os.path.exists(cache_path):
+            return _read_cached(cache_path, filters)
+
+    # Slow path: the cache entry is addressed by the content hash of the source
+    content_hash = file_content_hash(file_path)
+    cache_file = f"{stem}-{content_hash[:16]}-{options_key}.parquet"
+    cache_path = os.path.join(cache_dir, cache_file)
+
+    if os.path.exists(cache_path):
+        # File was touched but the content is the same
+        df = _read_cached(cache_path, filters)
+    else:
+        df = pd.read_csv(file_path, **read_options)
+        try:
+            _write_atomic(
+                lambda path: df.to_parquet(
+                    path, index=False, row_group_size=ROW_GROUP_SIZE
+                ),
+                cache_path,
+            )
+        except Exception as e:
+            print(f"Could not cache {file_path}: {str(e)}")
+            return filter_frame(df, filters)
+        df = filter_frame(df, filters)
+
+    new_manifest = {
+        "source": os.path.abspath(file_path),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": content_hash,
+        "options_key": options_key,
+        "cache_file": cache_file,
+    }
+
+    def write_manifest(path):
+        with open(path, "w") as file:
+            json.dump(new_manifest, file, indent=2)
+
+    try:
+        _write_atomic(write_manifest, manifest_path)
+
+        # Remove the previous entry of this source if it was replaced
+        if manifest is not None and manifest.get("cache_file") != cache_file:
+            old_path = os.path.join(cache_dir, manifest.get("cache_file", ""))
+            if os.path.isfile(old_path):
+                os.remove(old_path)
+    except OSError as e:
+        # The frame is read already, only the cache entry is incomplete
+        print(f"Could not update the cache manifest of {file_path}: {str(e)}")
+
+    return df
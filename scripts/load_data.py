@@ -1,8 +1,36 @@
 import os
 import pandas as pd
+from scripts.data_cache import cached_read_csv, filter_frame
+from cleaning_scripts.schema import clean_schema, enforce_schema
 
+# Predicate applied by filter_data=True
+MODERN_ART_FILTER = ("Date_creation_year", ">=", 1860)
 
-def load_data(folder_path, filter_data=False):
+
+def load_data(
+    folder_path,
+    filter_data=False,
+    use_cache=True,
+    cache_dir=None,
+    typed=True,
+    filters=None,
+):
+    """
+    Load every cleaned museum CSV in a folder.
+
+    Parameters:
+    folder_path (str): Folder with one CSV per museum
+    filter_data (bool): Keep only artworks created in or after 1860
+    use_cache (bool): Read through the Parquet cache (see data_cache.cached_read_csv)
+    cache_dir (str): Cache folder, defaults to '.cache' inside folder_path
+    typed (bool): Enforce the cleaned table schema (see cleaning_scripts.schema)
+    filters (list): Column predicates like [("Year_acquisition", ">=", 1900)],
+        or a list of such lists combined with OR. With the cache they are pushed
+        down to the Parquet scan, so row groups that cannot match are not decoded.
+
+    Returns:
+    tuple: list of DataFrames and list of museum names
+    """
     # List all files in the given folder
     all_files = os.listdir(folder_path)
 
@@ -11,15 +39,30 @@ def load_data(folder_path, filter_data=False):
 
     dataframes = []
     museum_names = []
+    schema = clean_schema() if typed else None
+
+    # filter_data is a shortcut for the 1860 creation year predicate
+    if filter_data:
+        if not filters:
+            filters = [MODERN_ART_FILTER]
+        elif isinstance(filters[0], tuple):
+            filters = list(filters) + [MODERN_ART_FILTER]
+        else:
+            filters = [list(group) + [MODERN_ART_FILTER] for group in filters]
 
     # Loop through each CSV file and read the data into a dataframe
     for csv_file in csv_files:
         file_path = os.path.join(folder_path, csv_file)
-        df = pd.read_csv(file_path)  # Read the CSV file into a DataFrame
+        if use_cache:
+            # Read from the Parquet cache, the CSV is parsed only when it changed
+            df = cached_read_csv(file_path, cache_dir=cache_dir, filters=filters)
+        else:
+            df = pd.read_csv(file_path)  # Read the CSV file into a DataFrame
+            df = filter_frame(df, filters)
 
-        # Apply filter if filter_data is True
-        if filter_data:
-            df = df[df["Date_creation_year"] >= 1860]
+        # Nullable Int16 years, shared categoricals and Arrow strings
+        if typed:
+            df = enforce_schema(df, schema)
 
         dataframes.append(df)  # Add the dataframe to the list
         museum_names.append(os.path.splitext(csv_file)[0])
@@ -11,7 +11,7 @@ def plot_acquisition_method(museum_data, museum_names, min_year=1860):
 
         # Group by "Acquistion_classified" and count the number of occurrences
         df_grouped = (
-            df_filtered.groupby(["Acquistion_classified"])
+            df_filtered.groupby(["Acquistion_classified"], observed=True)
             .size()
             .reset_index(name="Count")
         )
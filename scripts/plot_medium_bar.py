@@ -32,7 +32,9 @@ def plot_medium_bar(museum_data, museum_names, min_year=1860):
 
         # Group by "Medium_classified" and count the number of occurrences
         df_grouped = (
-            df_filtered.groupby(["Medium_classified"]).size().reset_index(name="Count")
+            df_filtered.groupby(["Medium_classified"], observed=True)
+            .size()
+            .reset_index(name="Count")
         )
 
         data_transformed.append(df_grouped)
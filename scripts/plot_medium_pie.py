@@ -36,7 +36,9 @@ def plot_medium_pie(museums_data, museum_names, min_year=1860):
         df_filtered = df[df["Date_creation_year"] >= min_year]
         # Group by "Medium_classified" and count the number of occurrences
         df_grouped = (
-            df_filtered.groupby(["Medium_classified"]).size().reset_index(name="Count")
+            df_filtered.groupby(["Medium_classified"], observed=True)
+            .size()
+            .reset_index(name="Count")
         )
         data_transformed.append(df_grouped)
 
@@ -37,7 +37,11 @@ def plot_origin_countries(museum_data, museum_names, min_year=1860):
         # Remove rows where 'Country_calculated' is NaN (empty)
         df = df.dropna(subset=["Country_calculated"])
 
-        grouped = df.groupby(["Country_calculated"]).size().reset_index(name="Count")
+        grouped = (
+            df.groupby(["Country_calculated"], observed=True)
+            .size()
+            .reset_index(name="Count")
+        )
 
         # If there is valid data, add it to the list for plotting
         if not grouped.empty:
@@ -0,0 +1,25 @@
+# Reference implementations of the code the vectorized cleaning functions replaced
+
+
+def substring_loop(values, tag_groups, labels):
+    """
+    The per-row loop the tag classifiers used before TagMatcher and TagClassifier.
+
+    Parameters:
+    values (iterable): Texts to classify, values that are not strings get no label
+    tag_groups (list): Lists of tags, the first group with a tag in the text wins
+    labels (list): Label of each tag group
+
+    Returns:
+    list: Label or None for every value
+    """
+    result = []
+    for value in values:
+        label = None
+        if isinstance(value, str):
+            for i, tag_group in enumerate(tag_groups):
+                if any(tag.lower() in value.lower() for tag in tag_group):
+                    label = labels[i]
+                    break
+        result.append(label)
+    return result
@@ -0,0 +1,39 @@
+import json
+import pandas as pd
+from benchmarks.benchmark_ingestion import run_benchmarks, scale_csv
+
+
+def test_scale_csv(tmp_path):
+    source = tmp_path / "met.csv"
+    pd.DataFrame({"Title": ["a", "b"]}).to_csv(source, index=False)
+    output_dir = tmp_path / "scaled"
+    output_dir.mkdir()
+
+    path = scale_csv(str(source), 3, str(output_dir))
+
+    assert pd.read_csv(path)["Title"].tolist() == ["a", "b"] * 3
+
+
+def test_clean_folder_report(tmp_path):
+    folder = tmp_path / "data"
+    folder.mkdir()
+    pd.DataFrame({"Title": ["a", "b"], "Year_acquisition": [1990, None]}).to_csv(
+        folder / "met.csv", index=False
+    )
+
+    report = run_benchmarks(data_folder=str(folder), scale_factors=(2,))
+
+    json.dumps(report)
+    results = report["results"]
+    assert [record["path_type"] for record in results] == [
+        "csv",
+        "cached_columnar_cold",
+        "cached_columnar",
+        "csv",
+        "cached_columnar",
+    ]
+    for record in results:
+        assert record["status"] == "ok"
+        assert record["rows"] == 4
+        assert record["scale"] == 2
+        assert record["wall_time_s"] >= 0
@@ -0,0 +1,88 @@
+import pandas as pd
+import pytest
+from cleaning_scripts.schema import enforce_schema
+from scripts.collection_table import (
+    build_collection_table,
+    collection_counts,
+    load_collection,
+    museum_offsets,
+    museum_slice,
+    open_collection_table,
+    write_collection_table,
+)
+
+
+@pytest.fixture
+def museums():
+    met = enforce_schema(
+        pd.DataFrame(
+            {
+                "Title": ["a", "b", "c"],
+                "Medium_classified": ["painting", "sculpture", None],
+                "Gender_classified": ["female", "male", "female"],
+                "Date_creation_year": [1850, 1920, 1990],
+            }
+        )
+    )
+    smk = enforce_schema(
+        pd.DataFrame(
+            {
+                "Title": ["d", "e"],
+                "Medium_classified": ["painting", "painting"],
+                "Gender_classified": ["unknown", None],
+                "Date_creation_year": [1700, None],
+            }
+        )
+    )
+    return [met, smk], ["met", "smk"]
+
+
+def test_collection_round_trip(tmp_path, museums):
+    museum_data, museum_names = museums
+    path = str(tmp_path / "collection.feather")
+    write_collection_table(museum_data, museum_names, path)
+
+    loaded, names = load_collection(path)
+
+    assert names == museum_names
+    for result, expected in zip(loaded, museum_data):
+        pd.testing.assert_frame_equal(result, expected, check_categorical=False)
+
+    table = open_collection_table(path)
+    assert museum_offsets(table) == {"met": (0, 3), "smk": (3, 2)}
+    assert museum_slice(table, "smk").column("Title").to_pylist() == ["d", "e"]
+
+    subset, _ = load_collection(path, columns=["Title", "museum"])
+    assert [list(df.columns) for df in subset] == [["Title"], ["Title"]]
+
+
+def test_categories_are_aligned(museums):
+    collection = build_collection_table(*museums)
+
+    assert isinstance(collection["Gender_classified"].dtype, pd.CategoricalDtype)
+    assert set(collection["Gender_classified"].cat.categories) == {
+        "female",
+        "male",
+        "unknown",
+    }
+    assert collection["museum"].tolist() == ["met"] * 3 + ["smk"] * 2
+
+
+def test_collection_counts_match_per_museum_counts(museums):
+    museum_data, museum_names = museums
+    collection = build_collection_table(museum_data, museum_names)
+
+    counts = collection_counts(collection, "Medium_classified", min_year=1800)
+
+    expected = []
+    for df, name in zip(museum_data, museum_names):
+        df = df[df["Date_creation_year"] >= 1800]
+        for medium, count in df["Medium_classified"].value_counts(sort=False).items():
+            if count:
+                expected.append((name, medium, count))
+    assert sorted(counts.itertuples(index=False, name=None)) == sorted(expected)
+
+
+def test_names_must_match_the_datasets(museums):
+    with pytest.raises(ValueError):
+        build_collection_table(museums[0], ["met"])
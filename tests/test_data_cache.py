@@ -0,0 +1,192 @@
+import itertools
+import json
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from scripts import data_cache
+from scripts.data_cache import cached_read_csv, file_content_hash, filter_frame
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(0)
+    n = 500
+    years = rng.choice([1850.0, 1900.0, 1950.0, 1990.0, 2000.0, np.nan], n)
+    names = rng.choice(["a", "b", "c", None], n)
+    return pd.DataFrame({"Year_acquisition": years, "Medium": names})
+
+
+PREDICATES = [
+    ("Year_acquisition", "==", 1990),
+    ("Year_acquisition", "!=", 1990),
+    ("Year_acquisition", "<", 1950),
+    ("Year_acquisition", "<=", 1950),
+    ("Year_acquisition", ">", 1900),
+    ("Year_acquisition", ">=", 1900),
+    ("Year_acquisition", "in", [1850, 2000]),
+    ("Year_acquisition", "not in", [1850, 2000]),
+    ("Medium", "==", "a"),
+    ("Medium", "!=", "a"),
+    ("Medium", "in", ["a", "b"]),
+    ("Medium", "not in", ["a", "b"]),
+]
+
+
+def _parquet_filter(df, tmp_path, filters):
+    path = tmp_path / "frame.parquet"
+    df.to_parquet(path, index=False)
+    return pd.read_parquet(path, filters=filters)
+
+
+@pytest.mark.parametrize("predicate", PREDICATES)
+def test_filter_frame_matches_parquet_filters(frame, tmp_path, predicate):
+    expected = _parquet_filter(frame, tmp_path, [predicate])
+    result = filter_frame(frame, [predicate])
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+
+@pytest.mark.parametrize("first, second", list(itertools.combinations(PREDICATES, 2)))
+def test_filter_frame_matches_parquet_and_or_groups(frame, tmp_path, first, second):
+    for filters in ([first, second], [[first], [second]]):
+        expected = _parquet_filter(frame, tmp_path, filters)
+        result = filter_frame(frame, filters)
+        pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+
+def test_cached_and_uncached_reads_are_identical(frame, tmp_path):
+    csv_path = tmp_path / "museum.csv"
+    frame.to_csv(csv_path, index=False)
+    cache_dir = tmp_path / "cache"
+    filters = [("Year_acquisition", "!=", 1990)]
+
+    uncached = filter_frame(pd.read_csv(csv_path), filters)
+    # First call builds the cache, the second one reads it
+    cold = cached_read_csv(str(csv_path), cache_dir=str(cache_dir), filters=filters)
+    warm = cached_read_csv(str(csv_path), cache_dir=str(cache_dir), filters=filters)
+
+    pd.testing.assert_frame_equal(cold, uncached)
+    pd.testing.assert_frame_equal(warm, uncached)
+    assert uncached["Year_acquisition"].notna().all()
+
+
+def _cache_files(cache_dir):
+    return sorted(path.name for path in cache_dir.iterdir())
+
+
+def test_changed_source_rebuilds_the_cache(tmp_path):
+    csv_path = tmp_path / "museum.csv"
+    cache_dir = tmp_path / "cache"
+    pd.DataFrame({"Year": [1900, 1950]}).to_csv(csv_path, index=False)
+    first = cached_read_csv(str(csv_path), cache_dir=str(cache_dir))
+    first_files = _cache_files(cache_dir)
+
+    pd.DataFrame({"Year": [1900, 1950, 2000]}).to_csv(csv_path, index=False)
+    second = cached_read_csv(str(csv_path), cache_dir=str(cache_dir))
+
+    assert first["Year"].tolist() == [1900, 1950]
+    assert second["Year"].tolist() == [1900, 1950, 2000]
+    # The entry of the old content is replaced, not kept next to the new one
+    assert len(_cache_files(cache_dir)) == 2
+    assert _cache_files(cache_dir) != first_files
+
+
+def test_touched_source_keeps_the_cache_entry(tmp_path):
+    csv_path = tmp_path / "museum.csv"
+    cache_dir = tmp_path / "cache"
+    pd.DataFrame({"Year": [1900]}).to_csv(csv_path, index=False)
+    cached_read_csv(str(csv_path), cache_dir=str(cache_dir))
+    files = _cache_files(cache_dir)
+
+    stat = os.stat(csv_path)
+    os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    df = cached_read_csv(str(csv_path), cache_dir=str(cache_dir))
+
+    assert df["Year"].tolist() == [1900]
+    assert _cache_files(cache_dir) == files
+    with open(cache_dir / "museum.json") as file:
+        assert json.load(file)["sha256"] == file_content_hash(csv_path)
+
+
+def test_read_options_are_part_of_the_key(tmp_path):
+    csv_path = tmp_path / "museum.csv"
+    cache_dir = tmp_path / "cache"
+    pd.DataFrame({"Year": [1900], "Title": ["x"]}).to_csv(csv_path, index=False)
+
+    full = cached_read_csv(str(csv_path), cache_dir=str(cache_dir))
+    subset = cached_read_csv(str(csv_path), cache_dir=str(cache_dir), usecols=["Year"])
+
+    assert list(full.columns) == ["Year", "Title"]
+    assert list(subset.columns) == ["Year"]
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        [("Gender_classified", "==", "female")],
+        [("Gender_classified", "in", ["female", "male"])],
+        [("Gender_classified", "not in", ["female"])],
+        [[("Gender_classified", "!=", "male")], [("Year_acquisition", ">", 1900)]],
+    ],
+)
+def test_string_filter_on_an_empty_column_cold_and_warm(frame, tmp_path, filters):
+    csv_path = tmp_path / "museum.csv"
+    frame.assign(Gender_classified=np.nan).to_csv(csv_path, index=False)
+    cache_dir = str(tmp_path / "cache")
+
+    cold = cached_read_csv(str(csv_path), cache_dir=cache_dir, filters=filters)
+    warm = cached_read_csv(str(csv_path), cache_dir=cache_dir, filters=filters)
+
+    pd.testing.assert_frame_equal(warm, cold)
+    pd.testing.assert_frame_equal(cold, filter_frame(pd.read_csv(csv_path), filters))
+
+
+def test_unwritable_cache_dir_reads_the_csv(frame, tmp_path):
+    csv_path = tmp_path / "museum.csv"
+    frame.to_csv(csv_path, index=False)
+    # A file where the cache folder should be, os.makedirs fails
+    cache_dir = tmp_path / "cache"
+    cache_dir.write_text("")
+    filters = [("Medium", "==", "a")]
+
+    df = cached_read_csv(str(csv_path), cache_dir=str(cache_dir), filters=filters)
+
+    pd.testing.assert_frame_equal(df, filter_frame(pd.read_csv(csv_path), filters))
+
+
+@pytest.mark.skipif(
+    not hasattr(os, "geteuid") or os.geteuid() == 0,
+    reason="file permissions do not apply to root",
+)
+def test_read_only_data_folder(frame, tmp_path):
+    folder = tmp_path / "data"
+    folder.mkdir()
+    frame.to_csv(folder / "museum.csv", index=False)
+    folder.chmod(0o555)
+    try:
+        df = cached_read_csv(str(folder / "museum.csv"))
+    finally:
+        folder.chmod(0o755)
+
+    pd.testing.assert_frame_equal(df, pd.read_csv(folder / "museum.csv"))
+    assert not (folder / ".cache").exists()
+
+
+def test_failed_manifest_write_returns_the_frame(frame, tmp_path, monkeypatch):
+    csv_path = tmp_path / "museum.csv"
+    frame.to_csv(csv_path, index=False)
+    # The Parquet file is written, the manifest is not
+    written = []
+
+    def write_parquet_only(write_function, target_path):
+        if target_path.endswith(".json"):
+            raise PermissionError(target_path)
+        write_function(target_path)
+        written.append(target_path)
+
+    monkeypatch.setattr(data_cache, "_write_atomic", write_parquet_only)
+
+    df = cached_read_csv(str(csv_path), cache_dir=str(tmp_path / "cache"))
+
+    pd.testing.assert_frame_equal(df, pd.read_csv(csv_path))
+    assert len(written) == 1
@@ -0,0 +1,232 @@
+import json
+import os
+import pandas as pd
+import pytest
+from cleaning_scripts.pipeline import clean_incremental
+from cleaning_scripts.dataset_registry import (
+    DATA_ROOT_ENV,
+    DEFAULT_REGISTRY,
+    RAW_REGISTRY,
+    apply_hooks,
+    iter_dataset_batches,
+    load_datasets,
+    load_registry,
+    select_datasets,
+)
+
+
+@pytest.fixture(autouse=True)
+def no_data_root(monkeypatch):
+    monkeypatch.delenv(DATA_ROOT_ENV, raising=False)
+
+
+def _write_config(tmp_path, config):
+    path = tmp_path / "datasets.json"
+    path.write_text(json.dumps(config))
+    return str(path)
+
+
+def test_root_resolution(tmp_path, monkeypatch):
+    config_path = _write_config(
+        tmp_path,
+        {
+            "data_root": "/data",
+            "data_roots": {"icloud": "/icloud"},
+            "datasets": {
+                "met": {"path": "met.csv", "format": "csv"},
+                "smk": {"path": "SMK/smk.json", "format": "json", "root": "icloud"},
+            },
+        },
+    )
+
+    registry = load_registry(config_path)
+    assert registry["met"]["path"] == os.path.join("/data", "met.csv")
+    assert registry["smk"]["path"] == os.path.join("/icloud", "SMK/smk.json")
+    assert registry["met"]["hooks"] == {}
+
+    # The environment variable and the argument replace every root
+    monkeypatch.setenv(DATA_ROOT_ENV, "/env")
+    assert load_registry(config_path)["smk"]["path"] == os.path.join(
+        "/env", "SMK/smk.json"
+    )
+    registry = load_registry(config_path, data_root="/arg")
+    assert registry["met"]["path"] == os.path.join("/arg", "met.csv")
+
+
+def test_missing_root(tmp_path, monkeypatch):
+    config_path = _write_config(
+        tmp_path,
+        {
+            "data_roots": {"icloud": "/icloud"},
+            "datasets": {"met": {"path": "met.csv", "format": "csv"}},
+        },
+    )
+    with pytest.raises(ValueError, match=DATA_ROOT_ENV):
+        load_registry(config_path)
+
+    config_path = _write_config(
+        tmp_path,
+        {"datasets": {"met": {"path": "met.csv", "format": "csv", "root": "usb"}}},
+    )
+    with pytest.raises(ValueError, match="Unknown root usb"):
+        load_registry(config_path)
+
+    monkeypatch.setenv(DATA_ROOT_ENV, "/env")
+    assert load_registry(config_path)["met"]["path"] == os.path.join("/env", "met.csv")
+
+
+@pytest.mark.parametrize("config_path", [DEFAULT_REGISTRY, RAW_REGISTRY])
+def test_shipped_registries_load(config_path):
+    registry = load_registry(config_path)
+    assert registry
+    for spec in registry.values():
+        assert os.path.isabs(spec["path"])
+
+
+def test_select_datasets():
+    registry = {"met": {}, "moma": {}, "smk": {}}
+    assert select_datasets(registry) == ["met", "moma", "smk"]
+    # Config order, not the order of names
+    assert select_datasets(registry, ["smk", "met"]) == ["met", "smk"]
+    with pytest.raises(ValueError):
+        select_datasets(registry, ["louvre"])
+
+
+def test_hooks_and_year_rules():
+    df = pd.DataFrame(
+        {
+            "acquisition_date": ["x", "y", None],
+            "object_inventory": ["AM 1977-12", "AM 2050-1", "AM 1980-3"],
+            "Year_acquisition": pd.array([pd.NA, pd.NA, pd.NA], dtype="Int64"),
+        }
+    )
+    spec = {
+        "hooks": {"acquisition": []},
+        "year_rules": {
+            "acquisition": [
+                {
+                    "target": "Year_acquisition",
+                    "when_present": "acquisition_date",
+                    "source": "object_inventory",
+                    "patterns": [r"AM (1[89]\d{2}|20[01]\d|202[01234])-.*"],
+                }
+            ]
+        },
+    }
+
+    result = apply_hooks(df, spec, "acquisition")
+
+    assert result["Year_acquisition"].tolist() == [1977, pd.NA, pd.NA]
+    assert result["source_column"].tolist()[:2] == ["object_inventory"] * 2
+
+
+def test_load_datasets_by_format(tmp_path):
+    pd.DataFrame({"Title": ["a", "b"]}).to_csv(tmp_path / "met.csv", index=False)
+    records = [
+        {"responsibleOrganisation": "Kiasma", "people": [{"firstName": "A"}]},
+        {"responsibleOrganisation": "Ateneum", "people": [{"firstName": "B"}]},
+        {"responsibleOrganisation": "Kiasma", "people": []},
+    ]
+    (tmp_path / "finnish.json").write_text(json.dumps(records))
+    fields = {"fields": [{"id": "Title"}, {"id": "Person"}], "records": [["c", "D"]]}
+    (tmp_path / "queensland.json").write_text(json.dumps(fields))
+    organisation = lambda value: {"key": "responsibleOrganisation", "value": value}
+    config_path = _write_config(
+        tmp_path,
+        {
+            "data_root": str(tmp_path),
+            "datasets": {
+                "met": {"path": "met.csv", "format": "csv"},
+                "kiasma": {
+                    "path": "finnish.json",
+                    "format": "json_records",
+                    "organisation": organisation("Kiasma"),
+                },
+                "ateneum": {
+                    "path": "finnish.json",
+                    "format": "json_records",
+                    "organisation": organisation("Ateneum"),
+                },
+                "queensland": {
+                    "path": "queensland.json",
+                    "format": "fields_records_json",
+                },
+                "missing": {"path": "missing.xml", "format": "xml"},
+            },
+        },
+    )
+
+    raw_data, names = load_datasets(config_path=config_path)
+
+    assert names == ["met", "kiasma", "ateneum", "queensland"]
+    assert raw_data[0]["Title"].tolist() == ["a", "b"]
+    assert raw_data[1]["people_0_firstName"].iloc[0] == "A"
+    assert raw_data[1]["people_0_firstName"].isna().tolist() == [False, True]
+    assert raw_data[2]["people_0_firstName"].tolist() == ["B"]
+    assert raw_data[3].to_dict("list") == {"Title": ["c"], "Person": ["D"]}
+
+
+def test_projected_load_keeps_the_key(tmp_path):
+    pd.DataFrame(
+        {
+            "Object ID": [1, 2],
+            "Object Date": ["1920", None],
+            "Medium": ["bronze", "oil on canvas"],
+            "Unused": ["x", "y"],
+        }
+    ).to_csv(tmp_path / "met.csv", index=False)
+    config_path = _write_config(
+        tmp_path,
+        {
+            "data_root": str(tmp_path),
+            "datasets": {
+                "met": {"path": "met.csv", "format": "csv", "key": "Object ID"}
+            },
+        },
+    )
+
+    (raw,), _ = load_datasets(config_path=config_path, project_columns=True)
+    result = clean_incremental(
+        raw,
+        str(tmp_path / "state.parquet"),
+        dataset_name="met",
+        config_path=config_path,
+        verbose=False,
+    )
+
+    assert "Unused" not in raw.columns
+    assert result["Object ID"].tolist() == [1, 2]
+
+
+def test_iter_dataset_batches_matches_load_datasets(tmp_path):
+    records = [
+        {"responsibleOrganisation": org, "title": str(i), "people": [{"firstName": i}]}
+        for i, org in enumerate(["Kiasma", "Ateneum", "Kiasma"] * 5)
+    ]
+    (tmp_path / "finnish.json").write_text(json.dumps(records))
+    pd.DataFrame({"Title": ["a"]}).to_csv(tmp_path / "met.csv", index=False)
+    config_path = _write_config(
+        tmp_path,
+        {
+            "data_root": str(tmp_path),
+            "datasets": {
+                "met": {"path": "met.csv", "format": "csv"},
+                "kiasma": {
+                    "path": "finnish.json",
+                    "format": "json_records",
+                    "organisation": {
+                        "key": "responsibleOrganisation",
+                        "value": "Kiasma",
+                    },
+                },
+            },
+        },
+    )
+
+    batches = list(iter_dataset_batches("kiasma", config_path, batch_size=4))
+
+    (expected,), _ = load_datasets(names=["kiasma"], config_path=config_path)
+    assert [len(batch) for batch in batches] == [4, 4, 2]
+    pd.testing.assert_frame_equal(pd.concat(batches, ignore_index=True), expected)
+    with pytest.raises(ValueError, match="Cannot stream met"):
+        next(iter_dataset_batches("met", config_path))
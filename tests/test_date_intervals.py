@@ -0,0 +1,112 @@
+import random
+import pandas as pd
+import pytest
+from cleaning_scripts.date_intervals import parse_date_intervals
+from cleaning_scripts.extract_first_number import extract_first_number_series
+
+NA = None
+
+
+@pytest.mark.parametrize(
+    "text, start, end, precision",
+    [
+        ("1920", 1920, 1920, "year"),
+        ("c. 1920", 1920, 1920, "circa"),
+        ("about 1700", 1700, 1700, "circa"),
+        ("1920-1925", 1920, 1925, "range"),
+        ("c. 1920–25", 1920, 1925, "range"),
+        ("1920/21", 1920, 1921, "range"),
+        ("1925-7", 1925, 1927, "range"),
+        ("1960s", 1960, 1969, "decade"),
+        ("1960's", 1960, 1969, "decade"),
+        ("19th century", 1800, 1899, "century"),
+        ("19th-century", 1800, 1899, "century"),
+        # Hundreds are centuries, not the first decade
+        ("1800s", 1800, 1899, "century"),
+        ("late 1800s", 1800, 1899, "century"),
+        ("1800's", 1800, 1899, "century"),
+        # Abbreviated ends that would wrap and months are dates, not ranges
+        ("2010-09", 2010, 2010, "year"),
+        ("1999-01", 1999, 1999, "year"),
+        ("1905-10", 1905, 1905, "year"),
+        ("c. 1999-01", 1999, 1999, "circa"),
+        ("1929-1", 1929, 1929, "year"),
+        ("1999-01-15", 1999, 1999, "year"),
+        # Slashes are seasons and ranges, not months
+        ("1905/10", 1905, 1910, "range"),
+        # Ends after MAX_YEAR or before the start are unknown
+        ("1995–2030", 1995, NA, "range"),
+        ("1920-1910", 1920, NA, "range"),
+        # An explicit year wins over a century or decade
+        ("19th century, 1850", 1850, 1850, "year"),
+        ("1960s, c. 1965-70", 1965, 1970, "range"),
+        ("2050", NA, NA, NA),
+        ("18th century, 2050", NA, NA, NA),
+        ("no date", NA, NA, NA),
+        (NA, NA, NA, NA),
+    ],
+)
+def test_parse_date_intervals(text, start, end, precision):
+    result = parse_date_intervals(pd.Series([text], dtype=object)).iloc[0]
+    for value, expected in (
+        (result["start_year"], start),
+        (result["end_year"], end),
+        (result["precision"], precision),
+    ):
+        if expected is NA:
+            assert pd.isna(value)
+        else:
+            assert value == expected
+
+
+def test_numbers_are_years():
+    result = parse_date_intervals(pd.Series([1995, 1995.0, None], dtype=object))
+    assert result["start_year"].tolist()[:2] == [1995, 1995]
+    assert result["precision"].tolist()[:2] == ["year", "year"]
+
+
+def _random_dates(n, seed=0):
+    rng = random.Random(seed)
+    pieces = [
+        "c.",
+        "ca",
+        "late",
+        "19th century",
+        "1800s",
+        "1960s",
+        "-",
+        "–",
+        "/",
+        "to",
+        ",",
+        "09",
+        "25",
+        "7",
+        "01-15",
+        "'s",
+    ]
+    values = []
+    for _ in range(n):
+        words = []
+        for _ in range(rng.randint(1, 5)):
+            if rng.random() < 0.5:
+                words.append(str(rng.randint(900, 2100)))
+            else:
+                words.append(rng.choice(pieces))
+        values.append(rng.choice(["", " "]).join(words))
+    return pd.Series(values)
+
+
+def test_start_year_never_differs_from_extract_first_number():
+    values = _random_dates(5000)
+    intervals = parse_date_intervals(values)
+    first = extract_first_number_series(values)
+
+    found = first.notna()
+    pd.testing.assert_series_equal(
+        intervals["start_year"][found], first[found], check_names=False
+    )
+    # Ends are known only within the interval limits
+    ends = intervals["end_year"].dropna()
+    assert (ends >= intervals["start_year"][ends.index]).all()
+    assert (ends <= 2024).all()
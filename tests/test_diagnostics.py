@@ -0,0 +1,80 @@
+import numpy as np
+import pandas as pd
+import pytest
+from cleaning_scripts.acquisition_operations import (
+    ACQUISITION_YEAR_COLUMNS,
+    analyze_acquisition_columns,
+)
+from cleaning_scripts.cleaning_dates import analyze_data_quality
+from cleaning_scripts.diagnostics import diagnose_columns
+
+
+def masked_rows(df, possible_columns, new_column_name):
+    # The copy-per-column code of the analyze_* functions before diagnose_columns
+    diagnostic_results = []
+    for col in possible_columns:
+        if col in df.columns:
+            problematic_rows = df[
+                (df[col].notna()) & (df[new_column_name].isna())
+            ].copy()
+            if not problematic_rows.empty:
+                problematic_rows["source_column"] = col
+                diagnostic_results.append(problematic_rows)
+    if diagnostic_results:
+        return pd.concat(diagnostic_results, ignore_index=True)
+    return pd.DataFrame()
+
+
+@pytest.fixture
+def cleaned():
+    rng = np.random.default_rng(0)
+    n = 200
+    return pd.DataFrame(
+        {
+            "AccessionYear": rng.choice(["1999", "x", None], n),
+            "credit_line": rng.choice(["Gift", None], n),
+            "Title": rng.choice(["a", "b"], n),
+            "Year_acquisition": rng.choice([1999, np.nan], n),
+        },
+        index=rng.permutation(n) + 1000,
+    )
+
+
+def test_rows_match_the_masked_copies(cleaned):
+    columns = ["credit_line", "missing", "AccessionYear"]
+
+    pd.testing.assert_frame_equal(
+        analyze_data_quality(cleaned, columns, "Year_acquisition"),
+        masked_rows(cleaned, columns, "Year_acquisition"),
+    )
+    pd.testing.assert_frame_equal(
+        analyze_acquisition_columns(cleaned),
+        masked_rows(cleaned, ACQUISITION_YEAR_COLUMNS, "Year_acquisition"),
+    )
+
+
+def test_counts_samples_and_index(cleaned):
+    diagnostics = diagnose_columns(
+        cleaned, ["AccessionYear", "credit_line"], "Year_acquisition", sample_size=1
+    )
+
+    failing = cleaned["AccessionYear"].notna() & cleaned["Year_acquisition"].isna()
+    assert diagnostics.counts["AccessionYear"] == failing.sum()
+    assert (
+        diagnostics.index("AccessionYear").tolist() == cleaned.index[failing].tolist()
+    )
+    summary = diagnostics.summary()
+    assert summary["source_column"].tolist() == ["AccessionYear", "credit_line"]
+    assert summary["sample"].tolist()[0] == [
+        cleaned.loc[failing, "AccessionYear"].value_counts().index[0]
+    ]
+    rows = diagnostics.rows(columns=["Title"], source_columns=["credit_line"])
+    assert list(rows.columns) == ["Title", "source_column"]
+
+
+def test_no_failures():
+    df = pd.DataFrame({"Date": ["1999"], "Year_acquisition": [1999]})
+    diagnostics = diagnose_columns(df, ["Date"], "Year_acquisition")
+
+    assert diagnostics.rows().empty
+    assert diagnostics.summary().empty
@@ -0,0 +1,63 @@
+import numpy as np
+import pandas as pd
+from cleaning_scripts.distinct_values import (
+    distinct_stats,
+    map_distinct,
+    reset_distinct_stats,
+)
+
+
+def test_same_result_as_apply():
+    values = pd.Series(
+        ["oil", None, "ink", "oil", np.nan, 1995, 1995.0, "ink"],
+        index=[9, 8, 7, 6, 5, 4, 3, 2],
+        name="Medium",
+    )
+    calls = []
+
+    def describe(value):
+        calls.append(value)
+        return f"{type(value).__name__}:{value}"
+
+    result = map_distinct(values, describe)
+
+    # Missing values are processed once, with the first missing value
+    expected = values.apply(describe).where(values.notna(), "NoneType:None")
+    expected[3] = "int:1995"
+    pd.testing.assert_series_equal(result, expected)
+    assert len(calls) == 4 + len(values)
+
+
+def test_vectorized_data_frame_result():
+    values = pd.Series(["a", "b", "a", None], index=[3, 2, 1, 0])
+
+    def parts(column):
+        return pd.DataFrame({"upper": column.str.upper(), "length": column.str.len()})
+
+    result = map_distinct(values, parts, vectorized=True)
+
+    pd.testing.assert_frame_equal(result, parts(values))
+
+
+def test_categorical_and_unhashable_values():
+    categories = pd.Series(["x", "y", "x", None], dtype="category")
+    upper = lambda value: value.upper() if isinstance(value, str) else None
+    result = map_distinct(categories, upper)
+    assert result.tolist()[:3] == ["X", "Y", "X"]
+    assert pd.isna(result.iloc[3])
+
+    lists = pd.Series([["a"], ["a"], ["b"]])
+    assert map_distinct(lists, len).tolist() == [1, 1, 1]
+
+
+def test_stats():
+    reset_distinct_stats()
+    map_distinct(pd.Series(["a", "a", "a", "b"]), str.upper, name="upper")
+    map_distinct(pd.Series(["a", "c"]), str.upper, name="upper")
+
+    stats = distinct_stats().set_index("function").loc["upper"]
+    assert stats["calls"] == 2
+    assert stats["rows"] == 6
+    assert stats["distinct"] == 4
+    assert stats["hit_rate"] == 1 - 4 / 6
+    reset_distinct_stats()
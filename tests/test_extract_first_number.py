@@ -0,0 +1,61 @@
+import random
+import numpy as np
+import pandas as pd
+import pytest
+from cleaning_scripts.extract_first_number import (
+    extract_first_number,
+    extract_first_number_series,
+    extract_last_number,
+    extract_last_number_series,
+)
+
+
+def _random_values(n, seed=0):
+    rng = random.Random(seed)
+    pieces = ["c.", "-", "–", "/", ",", "s", "'s", "1st", "ca", "x"]
+    values = []
+    for _ in range(n):
+        words = []
+        for _ in range(rng.randint(1, 5)):
+            if rng.random() < 0.5:
+                words.append(str(rng.randint(1, 30000)))
+            else:
+                words.append(rng.choice(pieces))
+        values.append(rng.choice(["", " "]).join(words))
+    return values
+
+
+def scalar(values, func):
+    return [None if pd.isna(year) else int(year) for year in values.map(func)]
+
+
+def series(years):
+    return [None if pd.isna(year) else int(year) for year in years]
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        pd.Series(_random_values(3000)),
+        pd.Series(_random_values(300, seed=1) + [None, np.nan]),
+        pd.Series([1995, 2030, 123, 19950], dtype="int64"),
+        pd.Series([1995.0, np.nan, 2001.5]),
+        pd.Series(["1995", 1880, 1901.0, None, b"1950", ["1960"]], dtype=object),
+        pd.Series(["c. 1890-1895", "1890-1895", None] * 3, dtype="category"),
+        pd.Series(pd.to_datetime(["1995-01-01", None])),
+    ],
+)
+def test_series_functions_match_the_scalar_functions(values):
+    assert series(extract_first_number_series(values)) == scalar(
+        values, extract_first_number
+    )
+    assert series(extract_last_number_series(values)) == scalar(
+        values, extract_last_number
+    )
+
+
+def test_index_is_kept():
+    values = pd.Series(["1920", "x", "c. 1850"], index=[7, 3, 5])
+    years = extract_first_number_series(values)
+    assert years.index.tolist() == [7, 3, 5]
+    assert years.dtype == "Int64"
@@ -0,0 +1,142 @@
+import json
+import random
+import pandas as pd
+import pytest
+from flatten_json import flatten
+from cleaning_scripts.column_registry import PIPELINE_COLUMN_GROUPS, pipeline_columns
+from cleaning_scripts.flatten_stream import (
+    column_projection,
+    flatten_record,
+    iter_json_array,
+    load_flattened_json,
+    load_partitioned_json,
+)
+
+
+def _random_value(rng, depth=0):
+    kind = rng.randint(0, 7 if depth < 3 else 4)
+    if kind == 0:
+        return rng.randint(-(10**6), 10**6)
+    if kind == 1:
+        return rng.random() * 1000
+    if kind == 2:
+        return rng.choice(["", "oil", 'say "hi"', "é ü", "a,b]", None, True, False, 0])
+    if kind == 3:
+        return "x" * rng.randint(0, 50)
+    if kind in (4, 5):
+        return {
+            rng.choice(["people", "title", "date", "id", "x"])
+            + str(i): _random_value(rng, depth + 1)
+            for i in range(rng.randint(0, 4))
+        }
+    return [_random_value(rng, depth + 1) for _ in range(rng.randint(0, 4))]
+
+
+@pytest.fixture
+def records():
+    rng = random.Random(0)
+    return [
+        {f"key{i}": _random_value(rng) for i in range(rng.randint(0, 5))}
+        for _ in range(200)
+    ]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 20])
+@pytest.mark.parametrize("indent", [None, 2])
+def test_iter_json_array_matches_json_load(tmp_path, records, chunk_size, indent):
+    path = tmp_path / "dump.json"
+    path.write_text(json.dumps(records, indent=indent), encoding="utf-8")
+
+    assert list(iter_json_array(str(path), chunk_size=chunk_size)) == records
+
+
+@pytest.mark.parametrize(
+    "text", ["[]", " [ ] ", '[1, 2.5e3, "x"]', "[1950.5,-0.25E+2]", "[[],{}]", "[{}]"]
+)
+def test_iter_json_array_small_arrays(tmp_path, text):
+    path = tmp_path / "dump.json"
+    path.write_text(text, encoding="utf-8")
+
+    assert list(iter_json_array(str(path), chunk_size=1)) == json.loads(text)
+
+
+@pytest.mark.parametrize("text", ["{}", "[1, 2", "[1 2]", "[1,"])
+def test_iter_json_array_invalid(tmp_path, text):
+    path = tmp_path / "dump.json"
+    path.write_text(text, encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        list(iter_json_array(str(path), chunk_size=2))
+
+
+def test_flatten_record_matches_flatten_json(records):
+    for record in records:
+        assert flatten_record(record) == flatten(record)
+
+
+def test_skipped_prefixes_are_dropped(records):
+    for record in records:
+        expected = {
+            key: value
+            for key, value in flatten(record).items()
+            if not key.startswith(("key1", "key3_"))
+        }
+        assert flatten_record(record, skip_prefixes=("key1", "key3_")) == expected
+
+
+def test_load_flattened_json_matches_flattening_everything(tmp_path, records):
+    path = tmp_path / "dump.json"
+    path.write_text(json.dumps(records), encoding="utf-8")
+    keep = lambda record: "key0" in record
+
+    df = load_flattened_json(str(path), batch_size=13, record_filter=keep)
+
+    expected = pd.DataFrame([flatten(record) for record in records if keep(record)])
+    # Batches without a value in a column give NaN instead of None
+    missing = lambda frame: frame.astype(object).where(frame.notna(), None)
+    pd.testing.assert_frame_equal(missing(df), missing(expected))
+
+
+def test_partitioned_json_matches_filtering_each_partition(tmp_path, records):
+    rng = random.Random(1)
+    institutions = ["Kiasma", "Ateneum", "Sinebrychoff"]
+    for record in records:
+        record["responsibleOrganisation"] = rng.choice(institutions)
+    path = tmp_path / "dump.json"
+    path.write_text(json.dumps(records), encoding="utf-8")
+
+    result = load_partitioned_json(
+        str(path),
+        "responsibleOrganisation",
+        {"ateneum": "Ateneum", "kiasma": "Kiasma", "empty": "Other"},
+        batch_size=7,
+    )
+
+    assert list(result) == ["ateneum", "kiasma", "empty"]
+    assert result["empty"].empty
+    for name, value in (("ateneum", "Ateneum"), ("kiasma", "Kiasma")):
+        expected = load_flattened_json(
+            str(path),
+            batch_size=7,
+            record_filter=lambda record: record["responsibleOrganisation"] == value,
+        )
+        pd.testing.assert_frame_equal(result[name], expected)
+
+
+def test_projection_keeps_only_the_projected_columns(records):
+    columns = ["key0", "key1_people0", "key2_0", "key2_1_x0", "key4"]
+    projection = column_projection(columns)
+    for record in records:
+        expected = {
+            key: value for key, value in flatten(record).items() if key in columns
+        }
+        assert flatten_record(record, projection=projection) == expected
+
+
+def test_pipeline_columns():
+    columns = pipeline_columns(extra_columns=["Medium", "inspection"])
+
+    assert len(columns) == len(set(columns))
+    assert columns[-1] == "inspection"
+    for group in PIPELINE_COLUMN_GROUPS.values():
+        assert set(group) <= set(columns)
@@ -0,0 +1,97 @@
+import json
+import tracemalloc
+import pandas as pd
+import pytest
+from cleaning_scripts.instrumentation import (
+    METRICS,
+    configure_metrics,
+    instrumented,
+    measure_step,
+    metrics_labels,
+    metrics_summary,
+    metrics_table,
+    reset_metrics,
+)
+
+
+@pytest.fixture(autouse=True)
+def clean_metrics():
+    reset_metrics()
+    configure_metrics()
+    yield
+    reset_metrics()
+    configure_metrics()
+
+
+@instrumented(output_arg="new_column")
+def add_years(df, new_column="Year"):
+    print("report")
+    df[new_column] = [1990, None, 2000][: len(df)]
+    return df
+
+
+@instrumented(output="Year")
+def drop_rows(df):
+    return df.iloc[:1]
+
+
+def test_records_of_instrumented_steps(capsys):
+    df = pd.DataFrame({"Title": ["a", "b", "c"]})
+    with metrics_labels(museum="met"):
+        add_years(df, new_column="Year_acquisition")
+        drop_rows(df.rename(columns={"Year_acquisition": "Year"}))
+    add_years(df)
+
+    first, second, third = METRICS
+    assert first["museum"] == "met"
+    assert first["step"] == "add_years"
+    assert first["output"] == "Year_acquisition"
+    assert first["coverage_before"] is None
+    assert first["coverage_after"] == pytest.approx(2 / 3)
+    assert (second["rows_in"], second["rows_out"]) == (3, 1)
+    assert "museum" not in third
+    assert capsys.readouterr().out.count("report") == 2
+
+
+def test_quiet_mode_and_jsonl(tmp_path, capsys):
+    path = tmp_path / "metrics.jsonl"
+    configure_metrics(jsonl_path=str(path), quiet=True, print_records=True)
+
+    add_years(pd.DataFrame({"Title": ["a", "b", "c"]}))
+
+    out = capsys.readouterr().out
+    assert "report" not in out
+    assert out.startswith("add_years: ")
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert records == METRICS
+
+
+def test_nested_steps_with_tracemalloc():
+    tracemalloc.start()
+    try:
+        with measure_step("outer"):
+            with measure_step("inner"):
+                data = bytearray(5 * 1024 * 1024)
+            del data
+    finally:
+        tracemalloc.stop()
+
+    inner, outer = METRICS
+    assert inner["memory_source"] == "tracemalloc"
+    # The peak of the nested step is part of the peak of its parent
+    assert inner["memory_delta_mb"] >= 4
+    assert outer["memory_delta_mb"] >= inner["memory_delta_mb"]
+
+
+def test_summary():
+    for _ in range(3):
+        add_years(pd.DataFrame({"Title": ["a", "b", "c"]}))
+    drop_rows(pd.DataFrame({"Year": [1, 2]}))
+
+    summary = metrics_summary()
+
+    assert len(metrics_table()) == 4
+    assert summary.set_index("step").loc["add_years", "calls"] == 3
+    assert summary.set_index("step").loc["drop_rows", "rows"] == 2
+    # Hot steps first
+    assert summary["wall_time_s"].is_monotonic_decreasing
@@ -0,0 +1,48 @@
+import random
+import re
+import pandas as pd
+from cleaning_scripts.load_data_to_clean import parse_queensland_person
+
+
+def row_wise(person):
+    # The split and re.findall code prepare_queensland used before
+    lines = person.split("\n")
+    years = re.findall(r"\b\d{4}\b", person)
+    return {
+        "Artist": lines[0],
+        "Nationality": lines[-1].split("1")[0],
+        "birth_date": int(years[0]) if years else None,
+        "death_date": int(years[1]) if len(years) >= 2 else None,
+    }
+
+
+def _random_people(n, seed=0):
+    rng = random.Random(seed)
+    pieces = ["Jane Doe", "Australian", "b.", "d.", "1901", "1980", "19", "\n", " "]
+    pieces += ["12345", "1", "-", "c.", "Wiradjuri"]
+    return [
+        "".join(rng.choice(pieces) for _ in range(rng.randint(0, 8))) for _ in range(n)
+    ]
+
+
+def test_matches_the_row_wise_parsing():
+    people = pd.Series(_random_people(5000))
+
+    parsed = parse_queensland_person(people)
+
+    for person, row in zip(people, parsed.itertuples(index=False)):
+        expected = row_wise(person)
+        result = {
+            key: None if pd.isna(value) else value
+            for key, value in row._asdict().items()
+        }
+        assert result == expected, person
+
+
+def test_missing_person():
+    parsed = parse_queensland_person(pd.Series(["Jane Doe\nAustralian b.1901", None]))
+
+    assert parsed.loc[0, "Artist"] == "Jane Doe"
+    assert parsed.loc[0, "Nationality"] == "Australian b."
+    assert parsed.loc[0, "birth_date"] == 1901
+    assert parsed.loc[1].isna().all()
@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+import pytest
+from cleaning_scripts.outliers_operations import (
+    REPORT_COLUMNS,
+    StreamingOutlierReport,
+    outlier_report,
+)
+
+COLUMNS = ["Year_acquisition", "Date_creation_year"]
+
+
+@pytest.fixture
+def museums():
+    rng = np.random.default_rng(0)
+    frames = []
+    for size in (500, 80, 3):
+        df = pd.DataFrame(
+            {
+                "Year_acquisition": rng.normal(1950, 30, size).round(),
+                "Date_creation_year": rng.integers(1000, 2024, size).astype(float),
+            }
+        )
+        # Missing values and a few extreme years
+        df.loc[df.sample(frac=0.2, random_state=1).index, "Year_acquisition"] = np.nan
+        df.loc[: min(2, size - 1), "Date_creation_year"] = [100, 100, 5000][
+            : min(3, size)
+        ]
+        frames.append(df.astype("Int64"))
+    # One museum without the creation years
+    frames[1] = frames[1].drop(columns="Date_creation_year")
+    return frames, ["met", "moma", "smk"]
+
+
+def test_report_matches_per_group_statistics(museums):
+    frames, names = museums
+    report = outlier_report(frames, names, columns=COLUMNS)
+
+    assert list(report.columns) == REPORT_COLUMNS
+    assert list(zip(report["museum"], report["column"])) == [
+        ("met", "Year_acquisition"),
+        ("met", "Date_creation_year"),
+        ("moma", "Year_acquisition"),
+        ("smk", "Year_acquisition"),
+        ("smk", "Date_creation_year"),
+    ]
+    for row in report.itertuples():
+        frame = frames[names.index(row.museum)]
+        values = frame[row.column].dropna().astype(float)
+        q1, q3 = values.quantile(0.25), values.quantile(0.75)
+        outliers = values[
+            (values < q1 - 1.5 * (q3 - q1)) | (values > q3 + 1.5 * (q3 - q1))
+        ]
+        assert row.count == len(values)
+        assert row.q1 == pytest.approx(q1)
+        assert row.q3 == pytest.approx(q3)
+        assert row.q_low == pytest.approx(values.quantile(0.01))
+        assert row.n_outliers == len(outliers)
+        # Most frequent first, ties in ascending order of the value
+        counts = outliers.value_counts().sort_index()
+        assert row.top_outliers == list(
+            counts.sort_values(ascending=False, kind="stable").head().index
+        )
+
+
+def test_long_table_gives_the_same_report(museums):
+    frames, names = museums
+    long = pd.concat(
+        [df.assign(museum=name) for df, name in zip(frames, names)], ignore_index=True
+    )
+    pd.testing.assert_frame_equal(
+        outlier_report(long, columns=COLUMNS),
+        outlier_report(frames, names, columns=COLUMNS),
+    )
+
+
+@pytest.mark.parametrize("chunksize", [1, 7, 1000])
+def test_streaming_report_equals_the_report(museums, chunksize):
+    frames, names = museums
+    stream = StreamingOutlierReport(columns=COLUMNS)
+    for df, name in zip(frames, names):
+        for start in range(0, len(df), chunksize):
+            stream.update(df.iloc[start : start + chunksize], name)
+
+    expected = outlier_report(frames, names, columns=COLUMNS)
+    result = stream.report()
+    pd.testing.assert_frame_equal(
+        result.drop(columns="top_outliers"),
+        expected.drop(columns="top_outliers"),
+        check_dtype=False,
+    )
+    assert result["top_outliers"].tolist() == expected["top_outliers"].tolist()
+
+
+def test_no_data():
+    assert outlier_report([pd.DataFrame({"x": [1]})], ["met"]).empty
+    assert StreamingOutlierReport().report().empty
@@ -0,0 +1,111 @@
+import warnings
+import numpy as np
+import pandas as pd
+import pytest
+from cleaning_scripts.pipeline import (
+    ROW_HASH_COLUMN,
+    clean_dataset,
+    clean_in_chunks,
+    clean_incremental,
+)
+from cleaning_scripts.schema import CLEAN_COLUMNS, enforce_schema
+
+
+def _raw(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "Object ID": np.arange(n),
+            "AccessionYear": rng.choice(["1999", "c. 1950", "x", None], n),
+            "Object Date": rng.choice(["1920-25", "1960s", "1850", None], n),
+            "Date": rng.choice(["1800", "19th century", None], n),
+            "Medium": rng.choice(["oil on canvas", "bronze", None], n),
+            "Artist Nationality": rng.choice(["French", "American", None], n),
+            "Credit Line": rng.choice(["Gift of x", "Purchase", None], n),
+        }
+    )
+
+
+def _full(raw, tmp_path, **kwargs):
+    return clean_incremental(
+        raw, str(tmp_path / "full.parquet"), key="Object ID", **kwargs
+    )
+
+
+@pytest.mark.parametrize("coalesce", [False, True])
+def test_incremental_run_equals_full_clean(tmp_path, coalesce):
+    state = str(tmp_path / "state.parquet")
+    raw = _raw(300)
+    clean_incremental(raw, state, key="Object ID", coalesce=coalesce)
+
+    # Change, delete and add rows
+    update = raw.drop(index=range(0, 20)).copy()
+    update.loc[50:60, "Object Date"] = "c. 1700"
+    update.loc[70:80, "Medium"] = "bronze"
+    update = pd.concat([update, _raw(350, seed=1).iloc[300:]], ignore_index=True)
+
+    result = clean_incremental(update, state, key="Object ID", coalesce=coalesce)
+    expected = _full(update, tmp_path, coalesce=coalesce)
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_incremental_run_with_an_empty_state(tmp_path):
+    state = str(tmp_path / "state.parquet")
+    raw = _raw(100)
+    clean_incremental(raw.iloc[:0], state, key="Object ID")
+
+    result = clean_incremental(raw, state, key="Object ID")
+    pd.testing.assert_frame_equal(result, _full(raw, tmp_path))
+
+
+def test_new_keys_never_reuse_a_previous_hash(tmp_path):
+    state = str(tmp_path / "state.parquet")
+    raw = _raw(100)
+    raw.iloc[-1, 1:] = ["1999", "1960s", "1800", "bronze", "French", "Purchase"]
+    previous = clean_incremental(raw, state, key="Object ID")
+
+    # A new key with the same source values as the last row of the state
+    update = pd.concat([raw, raw.iloc[[-1]].assign(**{"Object ID": 1000})])
+    result = clean_incremental(update, state, key="Object ID")
+    assert result[ROW_HASH_COLUMN].iloc[-1] == previous[ROW_HASH_COLUMN].iloc[-1]
+    pd.testing.assert_frame_equal(result, _full(update, tmp_path))
+
+
+def test_nothing_to_clean(tmp_path, capsys):
+    state = str(tmp_path / "state.parquet")
+    raw = _raw(50)
+    previous = clean_incremental(raw, state, key="Object ID")
+    capsys.readouterr()
+
+    # Coverage prints of an empty frame divide by zero, they must not run
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", RuntimeWarning)
+        rerun = clean_incremental(raw, state, key="Object ID")
+        empty = clean_incremental(
+            raw.iloc[:0], str(tmp_path / "empty.parquet"), key="Object ID"
+        )
+
+    pd.testing.assert_frame_equal(rerun, previous)
+    assert "%" not in capsys.readouterr().out
+    assert empty.empty
+    pd.testing.assert_series_equal(empty.dtypes, previous.dtypes)
+
+
+@pytest.mark.parametrize("chunksize", [1, 7, 1000])
+@pytest.mark.parametrize("coalesce", [False, True])
+def test_chunked_clean_equals_full_clean(tmp_path, chunksize, coalesce):
+    source = str(tmp_path / "raw.csv")
+    _raw(60).to_csv(source, index=False)
+    output = str(tmp_path / "clean.csv")
+
+    rows = clean_in_chunks(source, output, chunksize=chunksize, coalesce=coalesce)
+
+    full = clean_dataset(
+        pd.read_csv(source, dtype=str), verbose=False, coalesce=coalesce
+    )
+    expected = enforce_schema(full)[CLEAN_COLUMNS]
+    expected.to_csv(tmp_path / "expected.csv", index=False)
+    assert rows == 60
+    pd.testing.assert_frame_equal(
+        pd.read_csv(output), pd.read_csv(tmp_path / "expected.csv")
+    )
@@ -0,0 +1,43 @@
+import pandas as pd
+import pytest
+from cleaning_scripts.production_operations import artwork_creation_date
+
+INTERVAL_COLUMNS = [
+    "Date_creation_year",
+    "Date_creation_end_year",
+    "Date_creation_precision",
+]
+
+
+@pytest.fixture
+def dates():
+    return pd.DataFrame(
+        {
+            "Object Date": ["c. 1920-25", None, "x", "1960s", "1850"],
+            "Date": ["1800", "19th century", "1955-60", None, "1700"],
+        }
+    )
+
+
+def test_coalesce_mode_adds_the_interval_columns(dates):
+    default = artwork_creation_date(dates.copy())
+    coalesced = artwork_creation_date(dates.copy(), coalesce=True)
+
+    assert set(INTERVAL_COLUMNS) <= set(coalesced.columns)
+    assert set(default.columns) <= set(coalesced.columns)
+    # Rows taken from the first column are the same as in the default mode
+    first = coalesced["Date_creation_year_source"] == "Object Date"
+    pd.testing.assert_frame_equal(
+        coalesced.loc[first, INTERVAL_COLUMNS],
+        default.loc[first, INTERVAL_COLUMNS],
+        check_dtype=False,
+        check_categorical=False,
+    )
+
+
+def test_coalesce_mode_takes_the_interval_of_the_winning_column(dates):
+    coalesced = artwork_creation_date(dates.copy(), coalesce=True)
+    row = coalesced.iloc[2]
+    assert row["Date_creation_year_source"] == "Date"
+    assert (row["Date_creation_year"], row["Date_creation_end_year"]) == (1955, 1960)
+    assert row["Date_creation_precision"] == "range"
@@ -0,0 +1,83 @@
+import json
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from cleaning_scripts.dataset_registry import load_datasets
+from cleaning_scripts.readers import read_arrow_file, read_source, read_source_to_arrow
+
+
+@pytest.fixture
+def source(tmp_path):
+    df = pd.DataFrame(
+        {
+            "Title": ["Untitled", None, "Ölbild"],
+            "Year_acquisition": [1950, np.nan, 2001],
+            "Medium": ["oil", "ink", None],
+        }
+    )
+    paths = {}
+    paths["csv"] = str(tmp_path / "museum.csv")
+    df.to_csv(paths["csv"], index=False)
+    paths["json"] = str(tmp_path / "museum.json")
+    df.to_json(paths["json"], orient="records")
+    return paths
+
+
+@pytest.mark.parametrize("fmt", ["csv", "json"])
+def test_arrow_round_trip_equals_read_source(tmp_path, source, fmt):
+    expected = read_source(source[fmt])
+
+    ipc_path = read_source_to_arrow(source[fmt], str(tmp_path))
+    result = read_arrow_file(ipc_path)
+
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+    assert not os.path.exists(ipc_path)
+
+
+def test_mixed_columns_are_returned_as_frames(tmp_path):
+    path = str(tmp_path / "mixed.json")
+    pd.DataFrame({"Date": [1950, "c. 1950"]}).to_json(path, orient="records")
+
+    result = read_source_to_arrow(path, str(tmp_path))
+
+    assert isinstance(result, pd.DataFrame)
+    assert result["Date"].tolist() == [1950, "c. 1950"]
+
+
+def test_unsupported_format(tmp_path):
+    path = tmp_path / "museum.xml"
+    path.write_text("<museum/>")
+    assert read_source(str(path)) is None
+    assert read_source_to_arrow(str(path), str(tmp_path)) is None
+
+
+def test_parallel_load_equals_sequential_load(tmp_path, source, monkeypatch):
+    monkeypatch.delenv("MUSEUM_DATA_ROOT", raising=False)
+    config = {
+        "data_root": str(tmp_path),
+        "datasets": {
+            "from_csv": {"path": "museum.csv", "format": "csv"},
+            "from_json": {"path": "museum.json", "format": "json"},
+        },
+    }
+    config_path = tmp_path / "datasets.json"
+    config_path.write_text(json.dumps(config))
+
+    sequential, names = load_datasets(config_path=str(config_path))
+    parallel, parallel_names = load_datasets(
+        config_path=str(config_path), parallel=True, max_workers=2
+    )
+
+    assert names == parallel_names == ["from_csv", "from_json"]
+    for expected, result in zip(sequential, parallel):
+        pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+
+@pytest.mark.parametrize("fmt", ["csv", "json"])
+def test_read_source_projection(source, fmt):
+    full = read_source(source[fmt])
+
+    result = read_source(source[fmt], columns=["Medium", "Title", "Missing"])
+
+    pd.testing.assert_frame_equal(result, full[["Title", "Medium"]])
@@ -0,0 +1,81 @@
+import pandas as pd
+from cleaning_scripts.schema import (
+    CLEAN_COLUMNS,
+    YEAR_COLUMNS,
+    clean_schema,
+    enforce_schema,
+    save_clean_data,
+)
+
+
+def test_schema_covers_the_clean_columns():
+    schema = clean_schema()
+    assert set(CLEAN_COLUMNS) <= set(schema)
+    for col in YEAR_COLUMNS:
+        assert schema[col] == pd.Int16Dtype()
+
+
+def test_enforce_schema():
+    df = pd.DataFrame(
+        {
+            "Year_acquisition": [1995, 1995.5, "x", 99999, None],
+            "Date_creation_year": ["1850", "c. 1850", None, "-50", "1850.0"],
+            "Gender_classified": ["female", "male", "non-binary", None, "female"],
+            "Date_creation_precision": ["year", "decade", None, "century", "range"],
+            "Medium_raw": ["oil", None, "ink", None, None],
+        },
+        index=[4, 3, 2, 1, 0],
+    )
+    schema = clean_schema()
+
+    typed = enforce_schema(df, schema)
+
+    assert list(typed.columns) == list(schema) + ["Medium_raw"]
+    assert typed.index.tolist() == [4, 3, 2, 1, 0]
+    for col, dtype in schema.items():
+        if col != "Gender_classified":
+            assert typed[col].dtype == dtype
+    # Anything that is not a whole number in the Int16 range is missing
+    assert typed["Year_acquisition"].tolist()[0] == 1995
+    assert typed["Year_acquisition"].iloc[1:].isna().all()
+    assert typed["Date_creation_year"].tolist() == [1850, pd.NA, pd.NA, -50, 1850]
+    # Unknown genders are kept as extra categories
+    assert list(typed["Gender_classified"].cat.categories) == [
+        "female",
+        "male",
+        "non-binary",
+    ]
+    assert typed["Date_creation_precision"].tolist()[:2] == ["year", "decade"]
+    assert typed["Artist"].isna().all()
+
+
+def test_labels_outside_the_tag_lists_are_kept():
+    schema = clean_schema()
+    known = schema["Country_calculated"].categories[0]
+    df = pd.DataFrame(
+        {
+            "Medium_classified": ["Unlisted medium", None],
+            "Country_calculated": [known, "Atlantis"],
+            "Acquisition_classified": [None, "Unlisted method"],
+            "Date_creation_precision": ["millennium", "year"],
+        }
+    )
+
+    typed = enforce_schema(df, schema)
+
+    for col in df.columns:
+        assert typed[col].isna().tolist() == df[col].isna().tolist(), col
+        assert typed[col].dropna().tolist() == df[col].dropna().tolist()
+        # The tag list categories come first, in the same order for every museum
+        categories = list(typed[col].cat.categories)
+        assert categories[: len(schema[col].categories)] == list(schema[col].categories)
+
+
+def test_saved_tables_have_the_clean_columns(tmp_path):
+    df = pd.DataFrame({"Artist": ["A"], "Year_acquisition": [1990.0], "x": [1]})
+
+    save_clean_data([df], ["met"], str(tmp_path))
+
+    saved = pd.read_csv(tmp_path / "met.csv")
+    assert list(saved.columns) == CLEAN_COLUMNS
+    assert saved.loc[0, "Year_acquisition"] == 1990
@@ -0,0 +1,70 @@
+import pandas as pd
+import pytest
+from cleaning_scripts.load_tags import (
+    load_acquisition_tags,
+    load_medium_tags,
+    load_nationality_tags,
+)
+from cleaning_scripts.string_operations import (
+    classify_medium,
+    create_acquisition_method,
+    create_artist_nationality,
+)
+from reference_loops import substring_loop
+
+
+def labels_of(column):
+    return [None if pd.isna(label) else label for label in column]
+
+
+@pytest.mark.parametrize(
+    "classify, load_tags, column, raw_column, new_column, values",
+    [
+        (
+            classify_medium,
+            load_medium_tags,
+            "Medium",
+            "Medium_raw",
+            "Medium_classified",
+            ["Oil on canvas", "Watercolor on paper", "Bronze", "video", None, "x"],
+        ),
+        (
+            create_acquisition_method,
+            load_acquisition_tags,
+            "Credit Line",
+            "acquisition_raw",
+            "Acquisition_classified",
+            ["Gift of the artist", "Bequest of X", "Purchase", "In memory of Y", None],
+        ),
+        (
+            create_artist_nationality,
+            load_nationality_tags,
+            "Country",
+            "nationality_raw",
+            "Country_calculated",
+            ["American", "the (German)", "French, born Spain", "Mars", None],
+        ),
+    ],
+)
+def test_classifiers_match_the_substring_loop(
+    classify, load_tags, column, raw_column, new_column, values
+):
+    df = classify(pd.DataFrame({column: values * 3}))
+    tag_groups, labels = load_tags()
+
+    assert labels_of(df[new_column]) == substring_loop(
+        df[raw_column], tag_groups, labels
+    )
+    assert df[new_column].notna().any()
+
+
+def test_nationality_is_the_first_token():
+    df = create_artist_nationality(pd.DataFrame({"Country": ["(German), 1900"]}))
+    assert df["nationality_raw"].tolist() == ["german"]
+    assert df["Country_calculated"].tolist() == ["Germany"]
+
+
+def test_missing_column_leaves_empty_columns():
+    df = classify_medium(pd.DataFrame({"Title": ["x"]}))
+    assert df["Medium_raw"].isna().all()
+    assert df["Medium_classified"].isna().all()
@@ -0,0 +1,93 @@
+import random
+import pandas as pd
+import pytest
+from cleaning_scripts.string_operations import TAG_LOADERS
+from cleaning_scripts.tag_matcher import TagClassifier, TagMatcher
+from reference_loops import substring_loop
+
+
+def _random_tag_groups(rng):
+    alphabet = "abcAB é"
+    groups = []
+    for _ in range(rng.randint(1, 6)):
+        tags = [
+            "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 4)))
+            for _ in range(rng.randint(0, 4))
+        ]
+        groups.append(tags)
+    return groups
+
+
+def test_matches_the_substring_loop():
+    rng = random.Random(0)
+    for _ in range(300):
+        tag_groups = _random_tag_groups(rng)
+        # Labels may repeat, like in the tag lists of load_tags
+        labels = [rng.choice("xyz") for _ in tag_groups]
+        matcher = TagMatcher(tag_groups, labels)
+        for _ in range(30):
+            text = "".join(rng.choice("abcAB é") for _ in range(rng.randint(0, 12)))
+            assert [matcher.match(text)] == substring_loop([text], tag_groups, labels)
+
+
+def test_first_group_wins_over_the_leftmost_tag():
+    matcher = TagMatcher([["canvas"], ["oil"]], ["painting", "oil"])
+    assert matcher.match("Oil on canvas") == "painting"
+    assert matcher.match("oil on board") == "oil"
+    assert matcher.match("bronze") is None
+
+
+def test_overlapping_tags():
+    # "he" ends inside "she" and is only found through the failure links
+    matcher = TagMatcher([["hers"], ["he"], ["she"]], ["hers", "he", "she"])
+    assert matcher.match("ushers") == "hers"
+    assert matcher.match("ushe") == "he"
+    assert matcher.match("sh") is None
+
+
+def test_empty_tag_matches_every_text():
+    matcher = TagMatcher([["oil"], [""]], ["oil", "other"])
+    assert matcher.match("oil") == "oil"
+    assert matcher.match("") == "other"
+    assert matcher.match("bronze") == "other"
+
+
+def test_no_tags():
+    assert TagMatcher([], []).match("oil") is None
+    assert TagMatcher([[]], ["oil"]).match("oil") is None
+
+
+def _values(tag_groups, rng):
+    # Tags on their own, in other text and in other case, plus text without tags
+    tags = [tag for tags in tag_groups for tag in tags]
+    values = []
+    for _ in range(500):
+        tag = rng.choice(tags)
+        values += [tag, f"{rng.choice(tags)} on {tag}", tag.upper(), "zzz"]
+    return pd.Series(values + [None, float("nan"), 1995])
+
+
+@pytest.mark.parametrize("tags", sorted(TAG_LOADERS))
+def test_classifier_matches_the_substring_loop(tags):
+    tag_groups, labels = TAG_LOADERS[tags]()
+    values = _values(tag_groups, random.Random(0))
+
+    result = TagClassifier(tag_groups, labels).classify(values)
+
+    expected = substring_loop(values, tag_groups, labels)
+    assert [None if pd.isna(label) else label for label in result] == expected
+
+
+def test_classifier_stats_and_dtype():
+    classifier = TagClassifier(
+        [["oil"], ["paper"], ["ink"]], ["paint", "paper", "paint"]
+    )
+    result = classifier.classify(pd.Series(["oil", "oil on paper", "ink", None, "x"]))
+
+    assert list(result.cat.categories) == ["paint", "paper"]
+    assert result.tolist()[:3] == ["paint", "paint", "paint"]
+    assert result.isna().tolist() == [False, False, False, True, True]
+    assert classifier.stats["rows"] == 5
+    assert classifier.stats["matched"] == 3
+    assert classifier.stats["distinct_index"] == 2
+    assert classifier.stats["distinct_substring"] == 1
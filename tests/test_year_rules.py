@@ -0,0 +1,134 @@
+import random
+import re
+import pandas as pd
+import pytest
+from cleaning_scripts.year_rules import (
+    combine_patterns,
+    compile_year_rule,
+    extract_rule_years,
+)
+
+# Ateneum inventory number patterns of datasets.json, in priority order
+ATENEUM_PATTERNS = [
+    r"A-?((?:19|20)\d{2})-\d+",
+    r"N-?((?:19|20)\d{2})-\d+",
+    r"TN-?((?:19|20)\d{2})-\d+",
+    r"[A-Z] [IVX]+ (\d{4})",
+    r"[A-Z][- ][IVX]+[- ](\d{4})",
+    r"N-?((?:19|20)\d{2})-\d+:[A-F]+",
+    r"A[- ]III[- ](19\d{2}):\d+",
+    r"(?:^|\s)((?:18|19|20)\d{2})(?:\s|$|[:-])",
+]
+
+
+def first_pattern_wins(text, patterns):
+    # Sequential re.search, the first pattern that matches anywhere wins
+    for pattern in patterns:
+        match = re.search(pattern, text)
+        if match:
+            return match.group(1)
+    return None
+
+
+def combined(text, regex):
+    match = regex.match(text)
+    if match is None:
+        return None
+    return next((group for group in match.groups() if group is not None), None)
+
+
+def _inventory_numbers(n, seed=0):
+    rng = random.Random(seed)
+    pieces = ["A", "N", "TN", "B", "III", "IV", "-", " ", ":", "AB", "x"]
+    values = []
+    for _ in range(n):
+        words = []
+        for _ in range(rng.randint(1, 6)):
+            if rng.random() < 0.4:
+                words.append(
+                    str(rng.choice([rng.randint(1, 99), rng.randint(1750, 2100)]))
+                )
+            else:
+                words.append(rng.choice(pieces))
+        values.append("".join(words) if rng.random() < 0.5 else " ".join(words))
+    return values
+
+
+def test_combine_patterns_matches_sequential_search():
+    regex = combine_patterns(ATENEUM_PATTERNS)
+    for text in _inventory_numbers(5000):
+        assert combined(text, regex) == first_pattern_wins(text, ATENEUM_PATTERNS)
+
+
+def test_first_pattern_wins_over_the_leftmost_match():
+    patterns = [r"B(\d)", r"A(\d)"]
+    regex = combine_patterns(patterns)
+    assert combined("A1 B2", regex) == "2"
+    assert combined("A1", regex) == "1"
+    assert combined("C3", regex) is None
+
+
+def test_extract_rule_years_matches_sequential_search():
+    rule = compile_year_rule(
+        {
+            "target": "Year_acquisition",
+            "when_present": "inventoryNumber",
+            "source": "inventoryNumber",
+            "strip": [None],
+            "patterns": ATENEUM_PATTERNS,
+            "max_year": 2024,
+        }
+    )
+    values = pd.Series(_inventory_numbers(2000, seed=1) + [None])
+
+    years = extract_rule_years(values, rule)
+
+    expected = []
+    for value in values:
+        year = (
+            None
+            if not isinstance(value, str)
+            else first_pattern_wins(value.strip(), ATENEUM_PATTERNS)
+        )
+        expected.append(None if year is None or int(year) > 2024 else int(year))
+    assert [None if pd.isna(year) else year for year in years] == expected
+
+
+def test_text_preparation_and_century():
+    # Whitney accession numbers
+    rule = compile_year_rule(
+        {
+            "target": "Year_acquisition",
+            "when_present": "credit_line",
+            "source": "accession_number",
+            "lower": True,
+            "strip": ["p.", "sc.", "c.", "x"],
+            "split": ".",
+            "patterns": [r"\A(\d{2}|\d{4})\Z"],
+            "century": "19",
+        }
+    )
+    values = pd.Series(
+        ["93.12", "P.2001.5", "x54.3", "1.2.3", None], index=[5, 6, 7, 8, 9]
+    )
+
+    years = extract_rule_years(values, rule)
+
+    assert years.index.tolist() == [5, 6, 7, 8, 9]
+    assert years.tolist()[:3] == [1993, 2001, 1954]
+    assert years.iloc[3:].isna().all()
+
+
+@pytest.mark.parametrize(
+    "rule",
+    [
+        {"when_present": "a", "source": "a", "patterns": ["(1)"]},
+        {"target": "a", "when_present": "a", "source": "a", "method": "other"},
+        {"target": "a", "when_present": "a", "source": "a", "patterns": ["1"]},
+        {"target": "a", "when_present": "a", "source": "a", "patterns": ["(1)(2)"]},
+        {"target": "a", "when_present": "a", "source": "a"},
+    ],
+)
+def test_invalid_rules(rule):
+    with pytest.raises(ValueError):
+        compile_year_rule(rule)